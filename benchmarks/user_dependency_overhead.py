@@ -0,0 +1,113 @@
+"""
+요청당 의존성 주입(DI) 오버헤드 마이크로벤치마크: 기존 wiring vs app.state 공유 객체 + async 의존성
+
+    python benchmarks/user_dependency_overhead.py --requests 5000
+
+DB 나 네트워크 없이 ASGI 앱을 직접 호출해 UserService 를 주입받기만 하는 엔드포인트의 요청당 시간을 잽니다.
+
+- baseline: 의존성이 없는 엔드포인트 (라우팅/응답 비용)
+- before: 동기 의존성 2단계 (스레드풀 실행) + 요청마다 CryptContext(schemes=["bcrypt"]) 생성
+- after: get_user_service (async 의존성 1단계, lifespan 에서 만든 공유 객체 사용)
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Annotated
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from passlib.context import CryptContext  # noqa: E402
+
+from fastapi_template.core.config.database import get_db  # noqa: E402
+from fastapi_template.core.config.settings import get_settings  # noqa: E402
+from fastapi_template.domains.user.dependencies import (  # noqa: E402
+    UserServiceDep,
+    create_user_components
+)
+from fastapi_template.domains.user.repository import UserRepository  # noqa: E402
+
+
+async def fake_db():
+    yield None  # 세션은 사용하지 않음 (커넥션 체크아웃 비용 제외)
+
+
+class LegacyUserService:
+    def __init__(self, repository: UserRepository):
+        self.repository = repository
+        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def legacy_get_repository(session=Depends(get_db)) -> UserRepository:
+    return UserRepository(session)
+
+
+def legacy_get_service(repository: Annotated[UserRepository, Depends(legacy_get_repository)]) -> LegacyUserService:
+    return LegacyUserService(repository)
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.state.user = create_user_components(get_settings())
+    app.dependency_overrides[get_db] = fake_db
+
+    @app.get("/baseline")
+    async def baseline():
+        return {}
+
+    @app.get("/before")
+    async def before(service: Annotated[LegacyUserService, Depends(legacy_get_service)]):
+        return {}
+
+    @app.get("/after")
+    async def after(service: UserServiceDep):
+        return {}
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> None:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [], "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 80), "app": app
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+
+    await app(scope, receive, send)
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> float:
+    for _ in range(min(200, requests)):  # warm-up
+        await call(app, path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call(app, path)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    app = create_app()
+    results = {path: await measure(app, f"/{path}", args.requests) for path in ("baseline", "before", "after")}
+    app.state.user.shutdown()
+
+    print(f"requests: {args.requests}")
+    print(f"{'wiring':<10}{'us/req':>10}{'DI us/req':>12}")
+    for path, micros in results.items():
+        print(f"{path:<10}{micros:>10.1f}{micros - results['baseline']:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""
+목록 응답 직렬화 벤치마크: FastAPI 기본 경로 (response_model 재검증 + jsonable_encoder + json.dumps) vs ModelResponse
+
+    python benchmarks/user_list_serialization.py --users 100 --requests 2000
+
+서비스가 만든 UserListResponse 를 그대로 반환하는 엔드포인트를 ASGI 로 직접 호출해 요청당 시간을 잽니다. (DB 없음)
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fastapi import FastAPI  # noqa: E402
+
+from fastapi_template.core.response.model_response import ModelResponse  # noqa: E402
+from fastapi_template.domains.user.schemas import UserListResponse, UserResponse  # noqa: E402
+
+
+def build_response(users: int) -> UserListResponse:
+    now = datetime.utcnow()
+    return UserListResponse(
+        users=[
+            UserResponse(
+                id=uuid.uuid4(),
+                email=f"user{i}@example.com",
+                username=f"user{i}",
+                full_name=f"User {i}",
+                is_active=True,
+                created_at=now,
+                updated_at=now
+            )
+            for i in range(users)
+        ],
+        total=None,
+        page=1,
+        size=users,
+        next_cursor=None
+    )
+
+
+def create_app(payload: UserListResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=UserListResponse)
+    async def default() -> UserListResponse:
+        return payload
+
+    @app.get("/model-response", response_model=UserListResponse)
+    async def model_response() -> ModelResponse:
+        return ModelResponse(payload)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [], "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 80), "app": app
+    }
+    body = bytearray()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return bytes(body)
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> float:
+    for _ in range(min(50, requests)):  # warm-up
+        await call(app, path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await call(app, path)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = create_app(build_response(args.users))
+    # 두 경로의 응답 내용이 같은지 확인 (공백 등 형식 차이는 파싱 후 비교)
+    assert json.loads(await call(app, "/default")) == json.loads(await call(app, "/model-response"))
+
+    results = {path: await measure(app, f"/{path}", args.requests) for path in ("default", "model-response")}
+
+    print(f"users per response: {args.users}, requests: {args.requests}")
+    print(f"{'path':<16}{'us/req':>10}{'speedup':>10}")
+    for path, micros in results.items():
+        print(f"{path:<16}{micros:>10.1f}{results['default'] / micros:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
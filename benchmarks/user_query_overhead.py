@@ -0,0 +1,102 @@
+"""
+단건 조회 쿼리의 Python 오버헤드 벤치마크: 매번 select() 구성 vs lambda_stmt (UserRepository)
+
+    python benchmarks/user_query_overhead.py --queries 20000
+
+메모리 SQLite 에 사용자를 넣고 id 로 반복 조회합니다. DB 실행 비용이 거의 없으므로 차이는 대부분
+statement 구성, cache key 생성, 컴파일(캐시 미스 시) 같은 Python 쪽 비용입니다.
+
+- build: statement 구성 + cache key 생성만 (DB 실행 없음)
+- query: AsyncSession.execute 까지 포함한 조회 1건
+- no-cache: query_cache_size=0 엔진 (매번 SQL 컴파일) 참고값
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import insert, lambda_stmt, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from fastapi_template.domains.user.models import User  # noqa: E402
+from fastapi_template.domains.user.repository import UserRepository  # noqa: E402
+
+
+async def rebuilt_get_by_id(session: AsyncSession, user_id: uuid.UUID) -> User | None:
+    result = await session.execute(select(User).where(User.id == user_id))
+    return result.scalar_one_or_none()
+
+
+def measure_build(ids: list[uuid.UUID], use_lambda: bool) -> float:
+    started = time.perf_counter()
+    for user_id in ids:
+        if use_lambda:
+            statement = lambda_stmt(lambda: select(User).where(User.id == user_id))
+        else:
+            statement = select(User).where(User.id == user_id)
+        statement._generate_cache_key()
+    return (time.perf_counter() - started) / len(ids) * 1e6
+
+
+async def measure_query(session: AsyncSession, get_by_id, ids: list[uuid.UUID]) -> float:
+    started = time.perf_counter()
+    for user_id in ids:
+        user = await get_by_id(user_id)
+        assert user is not None and user.id == user_id
+        session.expunge(user)  # identity map 크기를 일정하게 유지
+    return (time.perf_counter() - started) / len(ids) * 1e6
+
+
+async def create_session(query_cache_size: int, users: list[dict]) -> AsyncSession:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool, query_cache_size=query_cache_size)
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+        await connection.execute(insert(User), users)
+    return AsyncSession(engine, expire_on_commit=False)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    users = [
+        {"id": uuid.uuid4(), "email": f"user{i}@example.com", "username": f"user{i}", "hashed_password": "x"}
+        for i in range(args.users)
+    ]
+    ids = [random.choice(users)["id"] for _ in range(args.queries)]
+
+    results = {
+        "build/select": measure_build(ids, use_lambda=False),
+        "build/lambda": measure_build(ids, use_lambda=True)
+    }
+
+    session = await create_session(1200, users)
+    repository = UserRepository(session)
+    await measure_query(session, repository.get_by_id, ids[:200])  # warm-up
+    results["query/select"] = await measure_query(session, lambda i: rebuilt_get_by_id(session, i), ids)
+    results["query/lambda"] = await measure_query(session, repository.get_by_id, ids)
+    await session.close()
+    await session.bind.dispose()
+
+    session = await create_session(0, users)
+    results["query/no-cache"] = await measure_query(session, lambda i: rebuilt_get_by_id(session, i), ids)
+    await session.close()
+    await session.bind.dispose()
+
+    print(f"queries: {args.queries}, users: {args.users}")
+    print(f"{'mode':<16}{'us/query':>10}{'queries/s':>12}")
+    for mode, micros in results.items():
+        print(f"{mode:<16}{micros:>10.1f}{1e6 / micros:>12.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""
+CPU Whisper 추론 벤치마크: 기본 fp32 경로와 int8 dynamic quantization 경로 비교
+
+    python benchmarks/whisper_cpu_inference.py --audio sample.wav --reference sample.txt \
+        --model base --runs 5 --intra-op-threads 4
+
+- latency: 요청 1건(전체 오디오 transcribe) 처리 시간 (mean / p50 / p95)
+- throughput: 오디오 길이 / 평균 처리 시간 (실시간 대비 배속)
+- WER: --reference 텍스트 기준 단어 오류율 (없으면 fp32 결과를 기준으로 한 상대 WER)
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fastapi_template.domains.whisper.audio import SAMPLE_RATE  # noqa: E402
+from fastapi_template.domains.whisper.registry import ModelRegistryConfig, WhisperModelRegistry  # noqa: E402
+
+
+def normalize(text: str) -> list[str]:
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref, hyp = normalize(reference), normalize(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    # 단어 단위 편집 거리 (한 줄씩만 유지)
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def run_mode(name: str, config: ModelRegistryConfig, audio, language: str | None, runs: int) -> dict:
+    registry = WhisperModelRegistry(config)
+
+    started = time.perf_counter()
+    loaded = registry.get()
+    load_seconds = time.perf_counter() - started
+
+    def transcribe() -> str:
+        return loaded.model.transcribe(audio, language=language, verbose=None, fp16=loaded.fp16)["text"]
+
+    transcribe()  # warm-up
+
+    latencies = []
+    text = ""
+    for _ in range(runs):
+        started = time.perf_counter()
+        text = transcribe()
+        latencies.append(time.perf_counter() - started)
+
+    latencies.sort()
+    duration = len(audio) / SAMPLE_RATE
+    return {
+        "mode": name,
+        "load_s": load_seconds,
+        "mean_s": statistics.mean(latencies),
+        "p50_s": latencies[len(latencies) // 2],
+        "p95_s": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "throughput_x": duration / statistics.mean(latencies),
+        "text": text
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio", required=True, help="벤치마크에 사용할 오디오 파일")
+    parser.add_argument("--reference", help="정답 텍스트 파일 (WER 계산용)")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--language", default=None)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--intra-op-threads", type=int, default=0)
+    parser.add_argument("--inter-op-threads", type=int, default=0)
+    args = parser.parse_args()
+
+    import whisper
+
+    audio = whisper.load_audio(args.audio)
+    reference = Path(args.reference).read_text(encoding="utf-8") if args.reference else None
+
+    base_config = ModelRegistryConfig(
+        models=(args.model,),
+        default_model=args.model,
+        device="cpu",
+        dtype="float32",
+        intra_op_threads=args.intra_op_threads,
+        inter_op_threads=args.inter_op_threads
+    )
+    results = [
+        run_mode("fp32", base_config, audio, args.language, args.runs),
+        run_mode("int8", replace(base_config, quantize_int8=True), audio, args.language, args.runs)
+    ]
+
+    wer_reference = reference if reference is not None else results[0]["text"]
+    print(f"audio: {args.audio} ({len(audio) / SAMPLE_RATE:.1f}s), model: {args.model}, runs: {args.runs}")
+    print(f"WER 기준: {'reference' if reference is not None else 'fp32 출력 (상대 WER)'}")
+    print(f"{'mode':<6}{'load(s)':>10}{'mean(s)':>10}{'p50(s)':>10}{'p95(s)':>10}{'x realtime':>12}{'WER':>8}")
+    for result in results:
+        wer = word_error_rate(wer_reference, result["text"])
+        print(
+            f"{result['mode']:<6}{result['load_s']:>10.2f}{result['mean_s']:>10.2f}{result['p50_s']:>10.2f}"
+            f"{result['p95_s']:>10.2f}{result['throughput_x']:>12.2f}{wer:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+이미 users 테이블이 있는 DB 에 사용자 검색 인덱스(SearchMode)를 추가합니다.
+
+    APP_ENV=prod python scripts/create_user_search_indexes.py         # 없는 인덱스만 생성
+    APP_ENV=prod python scripts/create_user_search_indexes.py --sql   # 실행하지 않고 DDL 만 출력
+
+models.User 의 검색 인덱스는 create_all 로 테이블을 새로 만들 때만 생성되므로, 기존 DB 에는 이 스크립트로 추가합니다.
+DDL 은 모델 정의에서 만들기 때문에 인덱스 정의와 어긋나지 않습니다.
+
+- PostgreSQL: pg_trgm 확장 + email/username trigram GIN 인덱스 (prefix, contains, fulltext)
+- MySQL: email/username ngram FULLTEXT 인덱스 (fulltext)
+
+큰 테이블에서는 인덱스 생성 중 쓰기가 막힐 수 있으므로 (PostgreSQL 은 --sql 출력에 CONCURRENTLY 를 붙여 직접 실행)
+트래픽이 적은 시간에 실행합니다.
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import Index, inspect  # noqa: E402
+from sqlalchemy.schema import CreateIndex  # noqa: E402
+
+from fastapi_template.core.config.database import engine  # noqa: E402
+from fastapi_template.domains.user.models import User  # noqa: E402
+
+# dialect 별 검색 인덱스 (models.User.__table_args__ 의 ddl_if 와 같은 구성)
+SEARCH_INDEXES = {
+    "postgresql": ("ix_users_email_trgm", "ix_users_username_trgm"),
+    "mysql": ("ft_users_email", "ft_users_username"),
+}
+
+# 인덱스보다 먼저 실행할 DDL
+PREREQUISITES = {
+    "postgresql": ("CREATE EXTENSION IF NOT EXISTS pg_trgm",),
+}
+
+
+def search_indexes(dialect_name: str) -> list[Index]:
+    names = SEARCH_INDEXES.get(dialect_name, ())
+    return [index for index in User.__table__.indexes if index.name in names]
+
+
+def ddl_statements(dialect_name: str, existing: set[str] = frozenset()) -> list[str]:
+    statements = list(PREREQUISITES.get(dialect_name, ()))
+    for index in search_indexes(dialect_name):
+        if index.name not in existing:
+            statements.append(str(CreateIndex(index).compile(dialect=engine.dialect)))
+    return statements
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sql", action="store_true", help="DDL 만 출력하고 실행하지 않음")
+    args = parser.parse_args()
+
+    dialect_name = engine.dialect.name
+    if dialect_name not in SEARCH_INDEXES:
+        print(f"{dialect_name}: 전용 검색 인덱스 없음 (LIKE 로 검색)")
+        return
+
+    if args.sql:
+        for statement in ddl_statements(dialect_name):
+            print(f"{statement};")
+        return
+
+    try:
+        async with engine.begin() as conn:
+            existing = await conn.run_sync(
+                lambda sync_conn: {index["name"] for index in inspect(sync_conn).get_indexes(User.__tablename__)}
+            )
+            statements = ddl_statements(dialect_name, existing)
+            for statement in statements:
+                print(f"{statement};")
+                await conn.exec_driver_sql(statement)
+    finally:
+        await engine.dispose()
+
+    created = len(statements) - len(PREREQUISITES.get(dialect_name, ()))
+    print(f"검색 인덱스 {created}개 생성 (이미 있는 인덱스 {len(search_indexes(dialect_name)) - created}개는 건너뜀)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,11 @@
 from fastapi_template.api.v1.samples import router as samples_router
 from fastapi_template.api.v1.users import router as users_router
 from fastapi_template.api.v1.sst_whisper import router as whisper_router
+from fastapi_template.api.v1.whisper_jobs import router as whisper_jobs_router
 
 routers = [
     samples_router,
     users_router,
-    whisper_router
+    whisper_router,
+    whisper_jobs_router
 ]
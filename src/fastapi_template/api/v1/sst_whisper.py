@@ -1,26 +1,18 @@
-import os
-import tempfile
+from fastapi import UploadFile, File, APIRouter, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-import torch
-import whisper
-from fastapi import UploadFile, File, HTTPException, APIRouter
-from fastapi.responses import JSONResponse
+from fastapi_template.domains.whisper.dependencies import WhisperServiceDep
 
 router = APIRouter(prefix="/whisper", tags=["whisper"])
 
-# GPU가 사용 가능한 경우만 fp16 사용
-fp16_enabled = torch.cuda.is_available()
-print("GPU 사용 가능 여부:", fp16_enabled)
-
-# Whisper 모델 로드 (서버 시작시 한 번만 로드)
-model = whisper.load_model("base")
-
 
 @router.post("/transcribe")
 async def transcribe_audio(
+        service: WhisperServiceDep,
         file: UploadFile = File(...),
         language: str | None = None,
-        task: str = "transcribe"  # transcribe 또는 translate
+        task: str = "transcribe",  # transcribe 또는 translate
+        model: str | None = None
 ):
     """
     오디오 파일을 업로드하여 텍스트로 변환합니다.
@@ -28,73 +20,38 @@ async def transcribe_audio(
     - **file**: 오디오 파일 (mp3, wav, m4a, flac 등)
     - **language**: 언어 코드 (선택사항, 자동 감지됨)
     - **task**: 'transcribe' (원본 언어) 또는 'translate' (영어로 번역)
-    """
-
-    # 지원되는 오디오 파일 형식 확인
-    allowed_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.mp4', '.avi', '.mov'}
-    file_extension = os.path.splitext(file.filename)[1].lower()
-
-    if file_extension not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"지원되지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}"
-        )
-
-    try:
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-            while chunk := await file.read(1024 * 1024):  # 1MB씩 읽기
-                tmp_file.write(chunk)
-            tmp_file_path = tmp_file.name
-
-        # 오디오 로드 및 전처리
-        audio = whisper.load_audio(tmp_file_path)
-        audio = whisper.pad_or_trim(audio)
-
-        # log-Mel spectrogram 생성
-        mel = whisper.log_mel_spectrogram(audio, n_mels=model.dims.n_mels).to(model.device)
+    - **model**: 사용할 Whisper 모델 (선택사항, WHISPER_MODELS 중 하나, 기본값 WHISPER_DEFAULT_MODEL)
 
-        # 언어 감지
-        _, probs = model.detect_language(mel)
-        detected_language = max(probs, key=probs.get)
-
-        print("감지된 언어", detected_language)
-
-        # 디코딩 옵션 설정
-        options = whisper.DecodingOptions(
-            language=language if language else detected_language,
-            task=task
-        )
-
-        # 오디오 디코딩
-        result = whisper.decode(model, mel, options)
-
-        # 임시 파일 삭제
-        os.unlink(tmp_file_path)
+    처리 대기열이 가득 찬 경우 503 (Retry-After 헤더 포함), 처리 시간이 초과되면 504 를 반환합니다.
+    """
+    return ORJSONResponse(content=await service.transcribe(file, language, task, model))
 
-        return JSONResponse(content={
-            "success": True,
-            "filename": file.filename,
-            "detected_language": detected_language,
-            "language_confidence": probs[detected_language],
-            "task": task,
-            "text": result.text,
-            "language_probabilities": dict(sorted(probs.items(), key=lambda x: x[1], reverse=True)[:5])
-        })
 
-    except Exception as e:
-        # 에러 발생시 임시 파일 정리
-        if 'tmp_file_path' in locals() and os.path.exists(tmp_file_path):
-            os.unlink(tmp_file_path)
+@router.post("/detect-language")
+async def detect_audio_languages(
+        service: WhisperServiceDep,
+        files: list[UploadFile] = File(...),
+        top_k: int = Query(default=5, ge=1, le=100),
+        model: str | None = None
+):
+    """
+    여러 오디오 파일의 언어만 한 번의 배치 추론으로 감지합니다 (텍스트 디코딩 없음).
 
-        raise HTTPException(status_code=500, detail=f"오디오 변환 중 오류가 발생했습니다: {str(e)}")
+    - **files**: 오디오 파일 목록 (각 파일의 앞 30초만 사용)
+    - **top_k**: 파일별로 반환할 상위 언어 수
+    - **model**: 사용할 Whisper 모델 (선택사항)
+    """
+    return ORJSONResponse(content=await service.detect_languages(files, top_k, model))
 
 
 @router.post("/transcribe-full")
 async def transcribe_audio_full(
+        service: WhisperServiceDep,
         file: UploadFile = File(...),
         language: str | None = None,
-        task: str = "transcribe"
+        task: str = "transcribe",
+        parallel: bool = False,
+        model: str | None = None
 ):
     """
     전체 오디오 파일을 세그먼트별로 변환합니다 (더 정확한 결과).
@@ -102,59 +59,40 @@ async def transcribe_audio_full(
     - **file**: 오디오 파일
     - **language**: 언어 코드 (선택사항)
     - **task**: 'transcribe' 또는 'translate'
+    - **parallel**: 긴 오디오를 무음 구간 기준으로 나눠 여러 워커에서 동시에 변환 (process executor 권장)
+    - **model**: 사용할 Whisper 모델 (선택사항)
+    """
+    return ORJSONResponse(content=await service.transcribe_full(file, language, task, parallel, model))
+
+
+@router.post("/transcribe-stream")
+async def transcribe_audio_stream(
+        service: WhisperServiceDep,
+        file: UploadFile = File(...),
+        language: str | None = None,
+        task: str = "transcribe",
+        model: str | None = None
+):
     """
+    오디오 파일을 30초 구간 단위로 변환하면서 세그먼트를 NDJSON 으로 스트리밍합니다.
 
-    # 지원되는 오디오 파일 형식 확인
-    allowed_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.mp4', '.avi', '.mov'}
-    file_extension = os.path.splitext(file.filename)[1].lower()
-
-    if file_extension not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"지원되지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}"
-        )
-
-    try:
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-            # chunk 단위로 파일 저장
-            while chunk := await file.read(1024 * 1024):  # 1MB씩 읽기
-                tmp_file.write(chunk)
-            tmp_file_path = tmp_file.name
-
-        # Whisper의 transcribe 함수 사용 (전체 파일 처리)
-        result = model.transcribe(
-            audio=tmp_file_path,
-            language=language,
-            task=task,
-            verbose=False,
-            fp16=fp16_enabled  # GPU 사용 시 float 16 연산 활성화 ( 속도 향상)
-        )
-
-        # 임시 파일 삭제
-        os.unlink(tmp_file_path)
-
-        # 세그먼트 정보 포함
-        segments = []
-        for segment in result["segments"]:
-            segments.append({
-                "start": segment["start"],
-                "end": segment["end"],
-                "text": segment["text"]
-            })
-
-        return JSONResponse(content={
-            "success": True,
-            "filename": file.filename,
-            "detected_language": result["language"],
-            "task": task,
-            "text": result["text"],
-            "segments": segments
-        })
-
-    except Exception as e:
-        # 에러 발생시 임시 파일 정리
-        if 'tmp_file_path' in locals() and os.path.exists(tmp_file_path):
-            os.unlink(tmp_file_path)
-
-        raise HTTPException(status_code=500, detail=f"오디오 변환 중 오류가 발생했습니다: {str(e)}")
+    - **file**: 오디오 파일
+    - **language**: 언어 코드 (선택사항, 첫 구간에서 자동 감지)
+    - **task**: 'transcribe' 또는 'translate'
+    - **model**: 사용할 Whisper 모델 (선택사항)
+
+    각 줄은 `event` 필드(start, segment, done, error)를 가진 JSON 객체입니다.
+    클라이언트 연결이 끊기면 남은 구간의 디코딩은 취소됩니다.
+    """
+    return StreamingResponse(
+        await service.transcribe_stream(file, language, task, model),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/cache/stats")
+async def transcription_cache_stats(service: WhisperServiceDep):
+    """
+    변환 결과 캐시의 hit/miss 통계를 조회합니다.
+    """
+    return service.cache_stats()
@@ -2,10 +2,17 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 
-from fastapi_template.domains.user.dependencies import UserServiceDep
+from fastapi_template.core.response.model_response import ModelResponse
+from fastapi_template.domains.user.dependencies import UserExporterDep, UserServiceDep
+from fastapi_template.domains.user.export import MEDIA_TYPES
 from fastapi_template.domains.user.schemas import (
+    UserBulkCreate,
+    UserBulkResult,
+    UserBulkUpdate,
     UserCreate,
+    UserExportFilter,
     UserUpdate,
     UserResponse,
     UserListResponse,
@@ -24,8 +31,53 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def create_user(
         user_data: UserCreate,
         service: UserServiceDep
-) -> UserResponse:
-    return await service.create_user(user_data)
+) -> ModelResponse:
+    return ModelResponse(await service.create_user(user_data), status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/bulk",
+    response_model=UserBulkResult,
+    summary="Create users in bulk"
+)
+async def bulk_create_users(
+        data: UserBulkCreate,
+        service: UserServiceDep
+) -> ModelResponse:
+    return ModelResponse(await service.bulk_create_users(data))
+
+
+@router.patch(
+    "/bulk",
+    response_model=UserBulkResult,
+    summary="Update users in bulk"
+)
+async def bulk_update_users(
+        data: UserBulkUpdate,
+        service: UserServiceDep
+) -> ModelResponse:
+    return ModelResponse(await service.bulk_update_users(data))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export users as NDJSON or CSV"
+)
+async def export_users(
+        filters: Annotated[UserExportFilter, Depends()],
+        exporter: UserExporterDep
+) -> StreamingResponse:
+    """
+    검색 조건에 맞는 사용자 전체를 NDJSON 또는 CSV 로 스트리밍합니다.
+
+    server-side cursor 로 일정 건수씩 읽어 바로 전송하므로 건수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    return StreamingResponse(
+        exporter.stream(filters),
+        media_type=MEDIA_TYPES[filters.format],
+        headers={"Content-Disposition": f'attachment; filename="users.{filters.format.value}"'}
+    )
 
 
 @router.get(
@@ -36,8 +88,8 @@ async def create_user(
 async def get_user(
         user_id: UUID,
         service: UserServiceDep
-) -> UserResponse:
-    return await service.get_user_by_id(user_id)
+) -> ModelResponse:
+    return ModelResponse(await service.get_user_by_id(user_id))
 
 
 @router.get(
@@ -48,8 +100,8 @@ async def get_user(
 async def get_users(
         filters: Annotated[UserFilter, Depends()],
         service: UserServiceDep
-) -> UserListResponse:
-    return await service.get_users(filters)
+) -> ModelResponse:
+    return ModelResponse(await service.get_users(filters))
 
 
 @router.put(
@@ -61,8 +113,8 @@ async def update_user(
         user_id: UUID,
         user_data: UserUpdate,
         service: UserServiceDep
-) -> UserResponse:
-    return await service.update_user(user_id, user_data)
+) -> ModelResponse:
+    return ModelResponse(await service.update_user(user_id, user_data))
 
 
 @router.delete(
@@ -0,0 +1,44 @@
+from uuid import UUID
+
+from fastapi import APIRouter, File, UploadFile, status
+
+from fastapi_template.domains.whisper.jobs.dependencies import TranscriptionJobServiceDep
+from fastapi_template.domains.whisper.jobs.schemas import TranscriptionJobResponse
+
+router = APIRouter(prefix="/whisper/jobs", tags=["whisper"])
+
+
+@router.post(
+    "",
+    response_model=TranscriptionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit a transcription job"
+)
+async def submit_transcription_job(
+        service: TranscriptionJobServiceDep,
+        file: UploadFile = File(...),
+        language: str | None = None,
+        task: str = "transcribe",
+        parallel: bool = False,
+        model: str | None = None
+) -> TranscriptionJobResponse:
+    """
+    오디오 파일을 변환 작업으로 등록하고 작업 id 를 바로 반환합니다.
+
+    - 파라미터는 `/whisper/transcribe-full` 과 동일합니다.
+    - 결과는 `GET /whisper/jobs/{job_id}` 로 조회합니다 (status: queued → running → succeeded/failed).
+    - 완료된 작업은 보관 기간(WHISPER_JOB_RETENTION_SECONDS)이 지나면 삭제됩니다.
+    """
+    return await service.submit(file, language, task, parallel, model)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=TranscriptionJobResponse,
+    summary="Get transcription job status and result"
+)
+async def get_transcription_job(
+        job_id: UUID,
+        service: TranscriptionJobServiceDep
+) -> TranscriptionJobResponse:
+    return await service.get_job(job_id)
@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from fastapi_template.core.config.settings import get_redis_config
+
+
+@lru_cache()
+def get_redis_client() -> Redis:
+    """애플리케이션 전역 Redis 클라이언트 (최초 사용 시 생성)"""
+    config = get_redis_config()
+    return Redis.from_url(
+        config['url'],
+        max_connections=config['max_connections'],
+        decode_responses=config['decode_responses']
+    )
+
+
+async def close_redis_client():
+    """Redis 연결 정리 (클라이언트가 생성된 경우에만)"""
+    if get_redis_client.cache_info().currsize:
+        await get_redis_client().aclose()
+        get_redis_client.cache_clear()
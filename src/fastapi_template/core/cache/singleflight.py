@@ -0,0 +1,40 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    같은 key 에 대한 동시 호출을 하나로 합칩니다. (cache stampede 방지)
+
+    첫 호출만 fn 을 실행하고, 실행 중에 들어온 호출은 같은 결과(또는 예외)를 기다립니다.
+    결과 객체가 호출자 사이에 공유되므로 세션에 묶인 ORM 객체 대신 직렬화된 값을 반환하는 fn 에 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is not None:
+            # 대기 중인 호출자가 취소되어도 공유 future 는 취소되지 않도록 shield
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        # 기다리는 호출자가 없을 때 "exception was never retrieved" 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
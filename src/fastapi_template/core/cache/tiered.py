@@ -0,0 +1,97 @@
+import json
+import logging
+from dataclasses import dataclass, asdict
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from fastapi_template.core.cache.memory import TTLCache
+from fastapi_template.core.metrics.cache import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.redis_hits
+
+    def to_dict(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            **asdict(self),
+            "hits": self.hits,
+            "hit_ratio": self.hits / total if total else 0.0
+        }
+
+
+class TieredCache:
+    """
+    in-process LRU(1단계) + 선택적 Redis(2단계) 캐시
+
+    - 값은 JSON 직렬화 가능한 객체여야 합니다.
+    - Redis 장애 시 경고 로그만 남기고 캐시 miss 로 처리합니다.
+    """
+
+    def __init__(self, namespace: str, memory: TTLCache, redis: Redis | None = None, ttl_seconds: int = 3600):
+        self.namespace = namespace
+        self.memory = memory
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._memory_hits = CACHE_REQUESTS.labels(namespace, "memory_hit")
+        self._redis_hits = CACHE_REQUESTS.labels(namespace, "redis_hit")
+        self._misses = CACHE_REQUESTS.labels(namespace, "miss")
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        value = self.memory.get(key)
+        if value is not None:
+            self.stats.memory_hits += 1
+            self._memory_hits.inc()
+            return value
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(self._redis_key(key))
+            except RedisError as e:
+                logger.warning(f"Redis 캐시 조회 실패 ({self.namespace}): {e}")
+                raw = None
+
+            if raw is not None:
+                value = json.loads(raw)
+                self.memory.set(key, value)
+                self.stats.redis_hits += 1
+                self._redis_hits.inc()
+                return value
+
+        self.stats.misses += 1
+        self._misses.inc()
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(self._redis_key(key), json.dumps(value), ex=self.ttl_seconds)
+            except RedisError as e:
+                logger.warning(f"Redis 캐시 저장 실패 ({self.namespace}): {e}")
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.memory.delete(key)
+
+        if self.redis is not None and keys:
+            try:
+                await self.redis.delete(*(self._redis_key(key) for key in keys))
+            except RedisError as e:
+                logger.warning(f"Redis 캐시 삭제 실패 ({self.namespace}): {e}")
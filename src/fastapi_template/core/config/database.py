@@ -1,23 +1,164 @@
+import asyncio
 from typing import AsyncGenerator, Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlmodel import SQLModel
 
+from fastapi_template.core.config.replica import ReplicaSet
 from fastapi_template.core.config.settings import get_settings
+from fastapi_template.core.metrics.db_pool import InstrumentedAsyncAdaptedQueuePool, instrument_engine
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.db_echo,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow
+
+def _connect_args() -> dict:
+    if settings.db_type.startswith("postgresql+asyncpg"):
+        # asyncpg 는 모든 쿼리를 서버 측 prepared statement 로 실행하며, 커넥션별로 재사용할 개수를 지정
+        return {"prepared_statement_cache_size": settings.db_prepared_statement_cache_size}
+    return {}
+
+
+def _create_engine(url: str, pool_name: str) -> AsyncEngine:
+    async_engine = create_async_engine(
+        url,
+        echo=settings.db_echo,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args=_connect_args(),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping
+    )
+    instrument_engine(async_engine, pool_name)
+    return async_engine
+
+
+engine = _create_engine(settings.database_url, "primary")
+
+replica_set = ReplicaSet(
+    [
+        _create_engine(url, f"replica-{index}")
+        for index, url in enumerate(settings.database_replica_urls)
+    ],
+    balancing=settings.db_replica_balancing
 )
 
+
+def _is_select(statement) -> bool:
+    """SELECT 인지 (lambda_stmt 도 공개 속성 is_select 가 감싼 statement 의 값을 돌려줌)"""
+    return getattr(statement, "is_select", False)
+
+
+def _is_dml(statement) -> bool:
+    """INSERT/UPDATE/DELETE 인지 (lambda_stmt 포함)"""
+    return getattr(statement, "is_dml", False)
+
+
+def _locks_rows(statement) -> bool:
+    """
+    SELECT ... FOR UPDATE 처럼 행을 잠그는 읽기인지
+
+    FOR UPDATE 여부는 공개 API 가 없어 내부 속성(lambda_stmt 의 _resolved, Select 의 _for_update_arg)으로 확인합니다.
+    SQLAlchemy 버전이 바뀌어 속성을 찾을 수 없으면 잠그는 읽기로 간주해 primary 로 보냅니다.
+    """
+    if isinstance(statement, StatementLambdaElement):
+        statement = getattr(statement, "_resolved", None)
+    return getattr(statement, "_for_update_arg", True) is not None
+
+
+class RoutingSession(Session):
+    """
+    읽기 쿼리는 replica 로, 쓰기는 primary 로 보내는 Session
+
+    - SELECT (FOR UPDATE 제외) 는 replica, 그 외 (INSERT/UPDATE/DELETE, flush, text()) 는 primary
+    - FOR UPDATE 여부를 확인할 수 없는 SELECT 는 primary
+    - 한 번 쓰기가 일어난 세션은 이후 읽기도 primary 로 고정 (같은 요청 안에서 방금 쓴 값을 읽을 수 있도록)
+    - 세션마다 replica 하나를 골라 사용하고, replica 가 없거나 모두 비정상이면 primary
+    """
+
+    def __init__(self, replicas: ReplicaSet | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.replicas = replicas
+        self.use_primary = False
+        self._replica = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self.replicas:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        is_select = _is_select(clause)
+        if self._flushing or _is_dml(clause) or (is_select and _locks_rows(clause)):
+            self.use_primary = True
+
+        # clause 가 없는 호출(dialect 확인, connection())이나 text() 등은 primary 로 보내되 고정하지는 않음
+        if self.use_primary or not is_select:
+            return engine.sync_engine
+        # 세션 안의 읽기는 같은 replica 로 (요청 하나가 여러 replica 커넥션을 잡지 않도록)
+        if self._replica is None:
+            self._replica = self.replicas.choose()
+        return self._replica.sync_engine if self._replica is not None else engine.sync_engine
+
+
+class UnitOfWorkSession(AsyncSession):
+    """
+    커넥션을 실제 DB 작업 시간 동안만 잡고 있는 AsyncSession
+
+    - 커넥션은 세션 생성 시점이 아니라 첫 쿼리 시점에 체크아웃 (AsyncSession 기본 동작)
+    - 쓰기는 commit/rollback 시점에 커넥션 반환 (기본 동작)
+    - 트랜잭션 밖에서 실행된 단순 SELECT 는 결과를 모두 받은 뒤 바로 트랜잭션을 끝내 커넥션을 반환
+      (그대로 두면 요청이 끝나 세션이 닫힐 때까지, 응답 직렬화 동안에도 커넥션을 잡고 있음)
+
+    scalars 는 AsyncSession 내부에서 execute 를 거치므로 따로 재정의하지 않습니다.
+    execute/scalar/scalars 결과는 이미 버퍼링되어 있고 expire_on_commit=False 이므로 커밋 후에도 그대로 사용할 수 있습니다.
+    같은 트랜잭션에서 여러 읽기가 필요하면 session.begin() 블록 안에서 실행합니다.
+    """
+
+    def _is_standalone_read(self, statement) -> bool:
+        return (
+            _is_select(statement)
+            and not _locks_rows(statement)
+            and not self.in_transaction()
+            and not (self.new or self.dirty or self.deleted)
+        )
+
+    async def execute(self, statement, *args, **kwargs):
+        release = self._is_standalone_read(statement)
+        result = await super().execute(statement, *args, **kwargs)
+        if release:
+            await self.commit()
+        return result
+
+    async def scalar(self, statement, *args, **kwargs):
+        release = self._is_standalone_read(statement)
+        result = await super().scalar(statement, *args, **kwargs)
+        if release:
+            await self.commit()
+        return result
+
+    async def get(self, *args, **kwargs):
+        release = not self.in_transaction() and not (self.new or self.dirty or self.deleted)
+        result = await super().get(*args, **kwargs)
+        if release and self.in_transaction():
+            await self.commit()
+        return result
+
+
+def use_primary(session: AsyncSession) -> None:
+    """이 세션의 이후 쿼리를 모두 primary 로 보냅니다. (replica 지연을 허용할 수 없는 읽기용)"""
+    session.sync_session.use_primary = True
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
-    expire_on_commit=False
+    class_=UnitOfWorkSession,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    replicas=replica_set
 )
 
 
@@ -27,8 +168,21 @@ async def setup_database():
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def warmup_database(connections: int) -> None:
+    """
+    primary 와 replica 풀에 커넥션을 미리 만들어 둡니다. (기동 직후 요청들이 connect 지연을 겪지 않도록)
+
+    pool_size 를 넘는 수는 overflow 커넥션이 되어 바로 닫히므로 pool_size 까지만 만듭니다.
+    """
+    for target in (engine, *replica_set.engines):
+        count = min(connections, target.sync_engine.pool.size())
+        opened = await asyncio.gather(*(target.connect().start() for _ in range(count)))
+        await asyncio.gather(*(connection.close() for connection in opened))
+
+
 async def cleanup_database():
     """데이터베이스 정리"""
+    await replica_set.dispose()
     await engine.dispose()
 
 
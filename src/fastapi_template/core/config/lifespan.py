@@ -1,15 +1,77 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from fastapi_template.core.config.database import setup_database, cleanup_database
+from fastapi_template.core.cache.redis_client import close_redis_client
+from fastapi_template.core.config.database import replica_set, setup_database, cleanup_database, warmup_database
+from fastapi_template.core.config.settings import get_settings
+from fastapi_template.core.metrics.registry import mark_process_dead, run_samplers
+from fastapi_template.domains.user.dependencies import create_user_components
+from fastapi_template.domains.whisper.dependencies import batch_scheduler, whisper_executor
+from fastapi_template.domains.whisper.jobs.dependencies import transcription_job_worker
+
+logger = logging.getLogger(__name__)
+
+
+async def _preload_whisper() -> None:
+    try:
+        await whisper_executor.preload()
+    except Exception:
+        logger.exception("Whisper 모델 사전 로드 실패 (요청 시점에 다시 로드를 시도합니다)")
+
+
+async def _unload_idle_whisper(idle_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(idle_seconds)
+        try:
+            await whisper_executor.unload_idle(idle_seconds)
+        except Exception:
+            logger.exception("유휴 Whisper 모델 해제 실패")
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+
+    # 요청 간에 공유하는 user 도메인 객체 (비밀번호 해시 풀, 캐시 등)
+    app.state.user = create_user_components(settings)
+
     # 테이블 세팅
     await setup_database()
+    if settings.db_pool_warmup_connections > 0:
+        await warmup_database(settings.db_pool_warmup_connections)
+
+    # 풀/대기열 상태 gauge 갱신 (multiprocess 모드에서 다른 워커가 스크레이프에 응답해도 최신 값이 보이도록)
+    background_tasks = [asyncio.create_task(run_samplers(settings.metrics_sample_interval_seconds))]
+    # replica 상태 점검 (비정상 replica 는 읽기 대상에서 제외)
+    if replica_set:
+        background_tasks.append(asyncio.create_task(replica_set.run_health_checks(
+            settings.db_replica_health_check_interval_seconds,
+            settings.db_replica_health_check_timeout_seconds
+        )))
+
+    # Whisper 모델은 서버 기동을 막지 않도록 백그라운드에서 로드
+    if settings.whisper_preload:
+        background_tasks.append(asyncio.create_task(_preload_whisper()))
+    if settings.whisper_model_idle_seconds > 0:
+        background_tasks.append(asyncio.create_task(_unload_idle_whisper(settings.whisper_model_idle_seconds)))
+
+    # 비동기 변환 작업 워커 (API 노드와 추론 노드를 분리할 때는 API 노드에서 비활성화)
+    if settings.whisper_job_worker_enabled:
+        transcription_job_worker.start()
 
     yield
     # 리소스 정리
+    await transcription_job_worker.stop()
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+
+    await batch_scheduler.stop()
+    whisper_executor.shutdown()
+    app.state.user.shutdown()
+    await close_redis_client()
     await cleanup_database()
+    mark_process_dead()
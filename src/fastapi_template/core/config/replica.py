@@ -0,0 +1,66 @@
+import asyncio
+import itertools
+import logging
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+ReplicaBalancing = Literal["round_robin", "least_connections"]
+
+
+class ReplicaSet:
+    """
+    읽기 전용 replica 엔진 묶음
+
+    - choose(): 정상(healthy) replica 중 하나를 round robin 또는 checkout 된 커넥션이 가장 적은 순으로 선택
+    - run_health_checks(): 주기적으로 SELECT 1 을 실행해 실패한 replica 를 선택 대상에서 제외하고, 복구되면 다시 포함
+    - 정상 replica 가 하나도 없으면 None 을 반환하고 호출자는 primary 를 사용
+    """
+
+    def __init__(self, engines: list[AsyncEngine], balancing: ReplicaBalancing = "round_robin"):
+        self.engines = engines
+        self.balancing = balancing
+        self._healthy = list(engines)
+        self._round_robin = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> AsyncEngine | None:
+        healthy = self._healthy
+        if not healthy:
+            return None
+        if self.balancing == "least_connections":
+            return min(healthy, key=lambda engine: engine.sync_engine.pool.checkedout())
+        return healthy[next(self._round_robin) % len(healthy)]
+
+    async def _is_healthy(self, engine: AsyncEngine, timeout: float) -> bool:
+        try:
+            async with asyncio.timeout(timeout):
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning(f"DB replica health check 실패: {engine.url.host}:{engine.url.port} ({e!r})")
+            return False
+
+    async def check_health(self, timeout: float) -> None:
+        results = await asyncio.gather(*(self._is_healthy(engine, timeout) for engine in self.engines))
+        healthy = [engine for engine, ok in zip(self.engines, results) if ok]
+
+        if len(healthy) != len(self._healthy):
+            logger.info(f"DB replica 상태 변경: 정상 {len(healthy)}/{len(self.engines)}")
+        # 리스트를 통째로 교체 (choose 는 락 없이 현재 리스트를 읽음)
+        self._healthy = healthy
+
+    async def run_health_checks(self, interval: float, timeout: float) -> None:
+        while True:
+            await self.check_health(timeout)
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
@@ -1,12 +1,13 @@
+import json
 import logging
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional
 
 from dotenv import load_dotenv
 from pydantic import Field, field_validator, computed_field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 # Setup logging for configuration debugging
 logger = logging.getLogger(__name__)
@@ -56,6 +57,27 @@ class Settings(BaseSettings):
     db_port: int = Field(..., alias="DB_PORT")
     db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
     db_max_overflow: int = Field(default=30, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, alias="DB_POOL_TIMEOUT", gt=0)
+    db_pool_recycle: int = Field(default=-1, alias="DB_POOL_RECYCLE", ge=-1)  # seconds, -1 disables recycling
+    db_pool_pre_ping: bool = Field(default=False, alias="DB_POOL_PRE_PING")
+    db_pool_warmup_connections: int = Field(default=0, alias="DB_POOL_WARMUP_CONNECTIONS", ge=0)
+    # SQLAlchemy compiled statement cache entries per engine
+    db_query_cache_size: int = Field(default=1200, alias="DB_QUERY_CACHE_SIZE", ge=0)
+    # asyncpg only: prepared statements cached per connection (0 disables reuse)
+    db_prepared_statement_cache_size: int = Field(default=256, alias="DB_PREPARED_STATEMENT_CACHE_SIZE", ge=0)
+
+    # Read replicas ("host" or "host:port", same credentials and database name as the primary)
+    # Comma-separated ("r1,r2:5433") or JSON list
+    db_replica_hosts: Annotated[List[str], NoDecode] = Field(default=[], alias="DB_REPLICA_HOSTS")
+    db_replica_balancing: Literal["round_robin", "least_connections"] = Field(
+        default="round_robin", alias="DB_REPLICA_BALANCING"
+    )
+    db_replica_health_check_interval_seconds: float = Field(
+        default=10.0, alias="DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS", gt=0
+    )
+    db_replica_health_check_timeout_seconds: float = Field(
+        default=2.0, alias="DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS", gt=0
+    )
 
     redis_url: str = Field(..., alias="REDIS_URL", description="Redis connection URL")
 
@@ -78,6 +100,17 @@ class Settings(BaseSettings):
     # Rate limiting
     rate_limit_per_minute: int = Field(default=60, alias="RATE_LIMIT_PER_MINUTE")
 
+    # Request profiling (disabled: the middleware is not installed at all)
+    profiling_enabled: bool = Field(default=False, alias="PROFILING_ENABLED")
+    profiling_sample_rate: float = Field(default=0.0, alias="PROFILING_SAMPLE_RATE", ge=0.0, le=1.0)
+    profiling_header: str = Field(default="X-Profile", alias="PROFILING_HEADER")
+    profiling_backend: Literal["cprofile", "pyinstrument"] = Field(default="cprofile", alias="PROFILING_BACKEND")
+    profiling_output_dir: Optional[str] = Field(default=None, alias="PROFILING_OUTPUT_DIR")  # None: system temp dir
+    profiling_max_files: int = Field(default=100, alias="PROFILING_MAX_FILES", ge=1)
+
+    # Metrics (multi-worker aggregation is enabled by the PROMETHEUS_MULTIPROC_DIR env var, read by prometheus_client)
+    metrics_sample_interval_seconds: float = Field(default=5.0, alias="METRICS_SAMPLE_INTERVAL_SECONDS", gt=0)
+
     # Redis connection pool settings
     redis_pool_size: int = Field(default=10, alias="REDIS_POOL_SIZE")
 
@@ -85,6 +118,82 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
     jwt_expire_minutes: int = Field(default=60, alias="JWT_EXPIRE_MINUTES")
 
+    # Password hashing settings
+    password_hash_rounds: int = Field(default=12, alias="PASSWORD_HASH_ROUNDS", ge=4, le=31)
+    password_hash_executor: Literal["thread", "process"] = Field(default="thread", alias="PASSWORD_HASH_EXECUTOR")
+    password_hash_max_workers: int = Field(default=4, alias="PASSWORD_HASH_MAX_WORKERS", ge=1)
+
+    # User list settings
+    user_total_cache_ttl_seconds: float = Field(default=30, alias="USER_TOTAL_CACHE_TTL_SECONDS", gt=0)
+    user_total_cache_max_entries: int = Field(default=1024, alias="USER_TOTAL_CACHE_MAX_ENTRIES", ge=0)
+
+    # User bulk import settings
+    user_bulk_chunk_size: int = Field(default=500, alias="USER_BULK_CHUNK_SIZE", ge=1, le=2000)
+
+    # User export settings
+    user_export_chunk_rows: int = Field(default=1000, alias="USER_EXPORT_CHUNK_ROWS", ge=1, le=10000)
+
+    # User cache settings
+    # Off by default: invalidation only reaches the worker that handled the write unless Redis is enabled.
+    # With Redis enabled the in-process tier is skipped, so every worker sees invalidations immediately.
+    user_cache_enabled: bool = Field(default=False, alias="USER_CACHE_ENABLED")
+    user_cache_max_entries: int = Field(default=10000, alias="USER_CACHE_MAX_ENTRIES", ge=0)
+    user_cache_ttl_seconds: int = Field(default=60, alias="USER_CACHE_TTL_SECONDS", ge=1)
+    user_cache_redis_enabled: bool = Field(default=False, alias="USER_CACHE_REDIS_ENABLED")
+
+    # Whisper model registry settings
+    # Comma-separated ("base,small") or JSON list
+    whisper_models: Annotated[List[str], NoDecode] = Field(default=["base"], alias="WHISPER_MODELS")
+    whisper_default_model: str = Field(default="base", alias="WHISPER_DEFAULT_MODEL")
+    whisper_device: Optional[str] = Field(default=None, alias="WHISPER_DEVICE")
+    whisper_dtype: Literal["auto", "float16", "float32"] = Field(default="auto", alias="WHISPER_DTYPE")
+    whisper_preload: bool = Field(default=False, alias="WHISPER_PRELOAD")
+    whisper_model_idle_seconds: float = Field(default=0, alias="WHISPER_MODEL_IDLE_SECONDS", ge=0)
+
+    # Whisper CPU inference settings
+    whisper_quantize_int8: bool = Field(default=False, alias="WHISPER_QUANTIZE_INT8")
+    whisper_intra_op_threads: int = Field(default=0, alias="WHISPER_INTRA_OP_THREADS", ge=0)
+    whisper_inter_op_threads: int = Field(default=0, alias="WHISPER_INTER_OP_THREADS", ge=0)
+
+    # Whisper micro-batching settings
+    whisper_batch_max_size: int = Field(default=8, alias="WHISPER_BATCH_MAX_SIZE", ge=1)
+    whisper_batch_max_wait_ms: int = Field(default=20, alias="WHISPER_BATCH_MAX_WAIT_MS", ge=0)
+    whisper_language_detect_max_files: int = Field(default=32, alias="WHISPER_LANGUAGE_DETECT_MAX_FILES", ge=1)
+
+    # Whisper worker pool settings
+    whisper_executor: Literal["thread", "process"] = Field(default="thread", alias="WHISPER_EXECUTOR")
+    whisper_max_workers: int = Field(default=1, alias="WHISPER_MAX_WORKERS", ge=1)
+    whisper_max_queue_size: int = Field(default=8, alias="WHISPER_MAX_QUEUE_SIZE", ge=0)
+    whisper_request_timeout_seconds: float = Field(default=300, alias="WHISPER_REQUEST_TIMEOUT_SECONDS", gt=0)
+    whisper_retry_after_seconds: int = Field(default=10, alias="WHISPER_RETRY_AFTER_SECONDS", ge=1)
+
+    # Whisper transcription cache settings
+    whisper_cache_enabled: bool = Field(default=True, alias="WHISPER_CACHE_ENABLED")
+    whisper_cache_max_entries: int = Field(default=256, alias="WHISPER_CACHE_MAX_ENTRIES", ge=0)
+    whisper_cache_ttl_seconds: int = Field(default=3600, alias="WHISPER_CACHE_TTL_SECONDS", ge=1)
+    whisper_cache_redis_enabled: bool = Field(default=False, alias="WHISPER_CACHE_REDIS_ENABLED")
+
+    # Whisper parallel long-audio transcription settings
+    whisper_split_chunk_seconds: float = Field(default=120.0, alias="WHISPER_SPLIT_CHUNK_SECONDS", ge=30)
+    whisper_split_silence_threshold_db: float = Field(default=-40.0, alias="WHISPER_SPLIT_SILENCE_THRESHOLD_DB")
+    whisper_split_min_silence_ms: int = Field(default=500, alias="WHISPER_SPLIT_MIN_SILENCE_MS", ge=30)
+
+    # Whisper asynchronous transcription job settings
+    whisper_job_worker_enabled: bool = Field(default=True, alias="WHISPER_JOB_WORKER_ENABLED")
+    whisper_job_worker_concurrency: int = Field(default=1, alias="WHISPER_JOB_WORKER_CONCURRENCY", ge=1)
+    # Uploads must outlive restarts (and be shared by every worker node): use a persistent volume in production
+    whisper_job_storage_dir: str = Field(
+        default=str(ROOT_DIR / "data" / "whisper-jobs"), alias="WHISPER_JOB_STORAGE_DIR"
+    )
+    whisper_job_redis_enabled: bool = Field(default=False, alias="WHISPER_JOB_REDIS_ENABLED")
+    whisper_job_poll_interval_seconds: float = Field(default=2.0, alias="WHISPER_JOB_POLL_INTERVAL_SECONDS", gt=0)
+    whisper_job_lease_seconds: float = Field(default=600, alias="WHISPER_JOB_LEASE_SECONDS", gt=0)
+    whisper_job_max_attempts: int = Field(default=3, alias="WHISPER_JOB_MAX_ATTEMPTS", ge=1)
+    whisper_job_retention_seconds: float = Field(default=86400, alias="WHISPER_JOB_RETENTION_SECONDS", gt=0)
+    whisper_job_cleanup_interval_seconds: float = Field(
+        default=300, alias="WHISPER_JOB_CLEANUP_INTERVAL_SECONDS", gt=0
+    )
+
     model_config = SettingsConfigDict(
         extra="ignore",
         env_file=str(env_file_path),
@@ -118,6 +227,17 @@ class Settings(BaseSettings):
             return [item.strip() for item in v.split(',')]
         return v
 
+    @field_validator('whisper_models', 'db_replica_hosts', mode='before')
+    @classmethod
+    def parse_comma_separated_list(cls, v) -> List[str]:
+        """Parse a NoDecode list field from a comma-separated string or a JSON list."""
+        if isinstance(v, str):
+            v = v.strip()
+            if v.startswith('['):
+                return json.loads(v)
+            return [item.strip() for item in v.split(',') if item.strip()]
+        return v
+
     @classmethod
     @field_validator('port')
     def validate_port(cls, v: int) -> int:
@@ -151,6 +271,18 @@ class Settings(BaseSettings):
         """데이터베이스 URL 생성"""
         return f"{self.db_type}://{self.db_username}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    @computed_field
+    @property
+    def database_replica_urls(self) -> List[str]:
+        """읽기 전용 replica URL 목록 (포트 생략 시 primary 포트 사용)"""
+        urls = []
+        for replica in self.db_replica_hosts:
+            host, _, port = replica.partition(":")
+            urls.append(
+                f"{self.db_type}://{self.db_username}:{self.db_password}@{host}:{port or self.db_port}/{self.db_name}"
+            )
+        return urls
+
     def configure_logging(self):
         """Configure application logging based on settings."""
         # logs 디렉토리 생성
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"  # 한 줄에 JSON 객체 하나
+    CSV = "csv"  # 첫 줄 헤더
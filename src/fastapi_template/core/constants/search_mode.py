@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class SearchMode(str, Enum):
+    EXACT = "exact"  # 완전 일치 (unique 인덱스)
+    PREFIX = "prefix"  # 앞부분 일치 (PostgreSQL: trigram 인덱스, MySQL: B-tree 인덱스)
+    CONTAINS = "contains"  # 부분 일치 (PostgreSQL: trigram 인덱스, 그 외: 전체 스캔)
+    FULLTEXT = "fulltext"  # MySQL: ngram FULLTEXT 인덱스, 그 외: contains 와 동일
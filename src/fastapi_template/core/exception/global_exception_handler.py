@@ -1,8 +1,7 @@
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.responses import JSONResponse
-
+from fastapi_template.core.response.model_response import ModelResponse
 from fastapi_template.core.schemas.error_response import ErrorResponse
 
 
@@ -25,8 +24,9 @@ def register_global_exception_handlers(app: FastAPI):
             path=str(request.url.path),
             trace=str(exc.detail)
         )
-        return JSONResponse(status_code=exc.status_code,
-                            content=err.model_dump())
+        return ModelResponse(err,
+                             status_code=exc.status_code,
+                             headers=exc.headers)  # Retry-After 등 예외에 지정된 헤더 유지
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -39,8 +39,7 @@ def register_global_exception_handlers(app: FastAPI):
             path=str(request.url.path),
             trace=str(exc.errors())
         )
-        return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                            content=err.model_dump())
+        return ModelResponse(err, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
     # Generic 예외 처리
     @app.exception_handler(Exception)
@@ -51,5 +50,4 @@ def register_global_exception_handlers(app: FastAPI):
 
         err = ErrorResponse.create_error_response(exc, request)
 
-        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            content=err.model_dump())
+        return ModelResponse(err, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,7 @@
+from prometheus_client import Counter
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "캐시 조회 결과 (memory_hit: in-process LRU, redis_hit: Redis, miss: 둘 다 없음)",
+    ["cache", "result"]
+)
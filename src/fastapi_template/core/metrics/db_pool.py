@@ -0,0 +1,100 @@
+"""
+SQLAlchemy 커넥션 풀 메트릭
+
+- 체크아웃 대기 시간, 타임아웃 횟수: InstrumentedAsyncAdaptedQueuePool 에서 측정
+- 커넥션 수명: pool connect/close 이벤트로 측정
+- 사용 중/유휴/overflow 커넥션 수: 샘플러가 풀 상태를 읽어 gauge 에 기록 (요청 경로에 비용 없음)
+"""
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from fastapi_template.core.metrics.registry import register_sampler
+
+POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "커넥션 풀 체크아웃 대기 시간 (새 커넥션 생성 포함)",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 안에 커넥션을 얻지 못한 횟수",
+    ["pool"]
+)
+POOL_CONNECTION_LIFETIME_SECONDS = Histogram(
+    "db_pool_connection_lifetime_seconds",
+    "DB 커넥션 생성부터 종료까지의 시간",
+    ["pool"],
+    buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200, 14400, 86400)
+)
+# 워커 프로세스마다 풀을 가지므로 multiprocess 모드에서는 살아 있는 워커의 값을 합산
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "설정된 풀 크기 (pool_size)",
+    ["pool"],
+    multiprocess_mode="livesum"
+)
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "상태별 커넥션 수 (checked_out: 사용 중, idle: 풀에서 대기, overflow: pool_size 초과분)",
+    ["pool", "state"],
+    multiprocess_mode="livesum"
+)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간과 타임아웃을 기록하는 AsyncAdaptedQueuePool"""
+
+    metrics_name = "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(self.metrics_name).inc()
+            raise
+        POOL_CHECKOUT_SECONDS.labels(self.metrics_name).observe(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() 가 만드는 새 풀에도 이름 유지
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+def _pool_state_sampler(name: str, engine: AsyncEngine):
+    def sample() -> None:
+        # dispose() 후에는 새 풀로 바뀌므로 매번 엔진에서 현재 풀을 읽음
+        pool = engine.sync_engine.pool
+        POOL_SIZE.labels(name).set(pool.size())
+        POOL_CONNECTIONS.labels(name, "checked_out").set(pool.checkedout())
+        POOL_CONNECTIONS.labels(name, "idle").set(pool.checkedin())
+        POOL_CONNECTIONS.labels(name, "overflow").set(max(pool.overflow(), 0))
+
+    return sample
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """엔진의 커넥션 풀에 메트릭 이름을 붙이고 커넥션 수명 이벤트와 상태 샘플러를 등록합니다."""
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        pool.metrics_name = name
+        register_sampler(_pool_state_sampler(name, engine))
+
+    lifetime = POOL_CONNECTION_LIFETIME_SECONDS.labels(name)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "close")
+    def _on_close(dbapi_connection, connection_record):
+        connected_at = connection_record.info.pop("connected_at", None)
+        if connected_at is not None:
+            lifetime.observe(time.monotonic() - connected_at)
@@ -0,0 +1,20 @@
+from prometheus_client import Gauge, Histogram
+
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간 (응답 본문 전송 완료까지)",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10, 30, 60)
+)
+HTTP_RESPONSE_SIZE_BYTES = Histogram(
+    "http_response_size_bytes",
+    "응답 본문 크기",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 요청 수",
+    ["method"],
+    multiprocess_mode="livesum"
+)
@@ -0,0 +1,8 @@
+from prometheus_client import Histogram
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "bcrypt 해시/검증 시간 (워커 풀 대기 시간 포함)",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 2, 5, 10)
+)
@@ -0,0 +1,62 @@
+"""
+메트릭 레지스트리와 상태 gauge 샘플러
+
+- PROMETHEUS_MULTIPROC_DIR 환경 변수가 설정되면 (uvicorn --workers N) prometheus_client 의 multiprocess 모드로 동작합니다.
+  각 워커가 디렉터리의 mmap 파일에 값을 기록하고, /metrics 는 어느 워커가 응답하든 모든 워커의 값을 합쳐 노출합니다.
+  디렉터리는 서버를 시작하기 전에 비워야 합니다 (이전 실행의 파일이 남아 있으면 counter 가 이어서 합산됨).
+- multiprocess 모드에서는 스크레이프 시점에 다른 워커의 상태를 읽는 collector 를 쓸 수 없으므로,
+  풀/대기열 같은 현재 상태 값은 샘플러가 주기적으로 (그리고 스크레이프 직전에) gauge 에 기록합니다.
+"""
+import asyncio
+import logging
+import os
+from typing import Callable
+
+from prometheus_client import CollectorRegistry, REGISTRY, generate_latest, multiprocess
+
+logger = logging.getLogger(__name__)
+
+Sampler = Callable[[], None]
+
+_samplers: list[Sampler] = []
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def register_sampler(sampler: Sampler) -> None:
+    """현재 상태를 gauge 에 기록하는 함수를 등록합니다."""
+    _samplers.append(sampler)
+
+
+def sample_all() -> None:
+    for sampler in _samplers:
+        try:
+            sampler()
+        except Exception:
+            logger.exception(f"메트릭 샘플링 실패 ({getattr(sampler, '__qualname__', sampler)})")
+
+
+async def run_samplers(interval_seconds: float) -> None:
+    """interval_seconds 마다 상태 gauge 를 갱신합니다. (multiprocess 모드에서 다른 워커가 응답하는 스크레이프용)"""
+    while True:
+        sample_all()
+        await asyncio.sleep(interval_seconds)
+
+
+def render_latest() -> bytes:
+    """Prometheus text format 으로 현재 메트릭을 반환합니다."""
+    sample_all()
+    if not multiprocess_enabled():
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead() -> None:
+    """종료되는 워커의 live gauge 값을 집계에서 제외합니다."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
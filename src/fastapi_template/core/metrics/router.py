@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from fastapi_template.core.metrics.registry import render_latest
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus 스크레이프 엔드포인트 (multiprocess 모드에서는 모든 워커의 값을 합산)"""
+    return Response(render_latest(), media_type=CONTENT_TYPE_LATEST)
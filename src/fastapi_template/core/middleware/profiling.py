@@ -0,0 +1,128 @@
+import cProfile
+import importlib.util
+import logging
+import os
+import random
+import re
+import tempfile
+import time
+from collections import deque
+from typing import Literal
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi_template.core.middleware.timing import route_template
+
+logger = logging.getLogger(__name__)
+
+ProfilingBackend = Literal["cprofile", "pyinstrument"]
+
+PROFILE_FILE_HEADER = "X-Profile-File"
+
+
+class ProfilingMiddleware:
+    """
+    요청 단위 샘플링 프로파일러 (순수 ASGI 미들웨어)
+
+    - 요청 헤더(기본 X-Profile: 1)가 있거나 sample_rate 확률에 당첨된 요청만 프로파일링
+    - cprofile: .prof (pstats / snakeviz 로 분석), pyinstrument: async 호출 흐름을 보여주는 .html
+    - 저장한 파일 이름은 응답 헤더 X-Profile-File 로 알려주고, 최근 max_files 개만 보관
+    - 프로파일러는 프로세스에 하나만 켤 수 있으므로 이미 프로파일링 중이면 그 요청은 건너뜀
+      (cProfile 은 그 사이 같은 스레드에서 실행된 다른 요청의 코루틴도 함께 기록함)
+
+    프로파일링하지 않는 요청은 헤더 확인과 난수 하나만 추가되므로 오버헤드는 거의 없습니다.
+    운영 환경에서는 헤더로 누구나 켤 수 있으므로 PROFILING_ENABLED 를 필요한 동안만 켭니다.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            sample_rate: float = 0.0,
+            header: str = "X-Profile",
+            backend: ProfilingBackend = "cprofile",
+            output_dir: str | None = None,
+            max_files: int = 100
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.header = header.lower().encode("latin-1")
+        self.output_dir = output_dir or os.path.join(tempfile.gettempdir(), "fastapi-template-profiles")
+        self.max_files = max_files
+        self._files: deque[str] = deque()
+        self._active = False
+
+        if backend == "pyinstrument" and importlib.util.find_spec("pyinstrument") is None:
+            logger.warning("pyinstrument 가 설치되어 있지 않아 cProfile 로 프로파일링합니다")
+            backend = "cprofile"
+        self.backend = backend
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if self._active:
+            return False
+        for name, value in scope["headers"]:
+            if name == self.header:
+                return value not in (b"", b"0", b"false")
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        file_name = self._file_name(scope)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(PROFILE_FILE_HEADER, file_name)
+            await send(message)
+
+        self._active = True
+        try:
+            if self.backend == "pyinstrument":
+                await self._run_pyinstrument(scope, receive, send_wrapper, file_name)
+            else:
+                await self._run_cprofile(scope, receive, send_wrapper, file_name)
+        finally:
+            self._active = False
+
+    async def _run_cprofile(self, scope: Scope, receive: Receive, send: Send, file_name: str) -> None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            path = os.path.join(self.output_dir, f"{file_name}.prof")
+            profiler.dump_stats(path)
+            self._keep(path, scope)
+
+    async def _run_pyinstrument(self, scope: Scope, receive: Receive, send: Send, file_name: str) -> None:
+        from pyinstrument import Profiler
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+            path = os.path.join(self.output_dir, f"{file_name}.html")
+            with open(path, "w", encoding="utf-8") as profile_file:
+                profile_file.write(profiler.output_html())
+            self._keep(path, scope)
+
+    def _file_name(self, scope: Scope) -> str:
+        # 라우트는 요청 처리 후에 정해지므로 파일 이름에는 실제 경로를 사용
+        path = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_")[:80] or "root"
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{time.perf_counter_ns() % 1_000_000:06d}-{scope['method']}-{path}"
+
+    def _keep(self, path: str, scope: Scope) -> None:
+        logger.info(f"요청 프로파일 저장: {scope['method']} {route_template(scope)} -> {path}")
+        self._files.append(path)
+        while len(self._files) > self.max_files:
+            try:
+                os.remove(self._files.popleft())
+            except FileNotFoundError:
+                pass
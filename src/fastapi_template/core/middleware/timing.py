@@ -0,0 +1,63 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fastapi_template.core.metrics.http import (
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_RESPONSE_SIZE_BYTES
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    매칭된 라우트의 경로 템플릿 (예: /api/v1/users/{user_id})
+
+    실제 경로 대신 템플릿을 label 로 사용해 metric 시계열 수가 경로 파라미터 값에 따라 늘어나지 않도록 합니다.
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
+
+class TimingMiddleware:
+    """
+    라우트별 처리 시간, 응답 크기, 처리 중인 요청 수를 기록하는 순수 ASGI 미들웨어
+
+    BaseHTTPMiddleware 와 달리 응답 본문을 다시 감싸지 않으므로 스트리밍 응답도 그대로 전달되며,
+    처리 시간은 본문 전송이 끝난 시점까지 측정합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500  # 응답 시작 전에 예외가 나면 ServerErrorMiddleware 가 500 을 보냄
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION_SECONDS.labels(method, route, str(status_code)).observe(elapsed)
+            HTTP_RESPONSE_SIZE_BYTES.labels(method, route).observe(response_size)
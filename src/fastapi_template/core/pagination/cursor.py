@@ -0,0 +1,23 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """(created_at, id) 정렬 키를 클라이언트에 노출하지 않는 opaque cursor 문자열로 인코딩합니다."""
+    payload = json.dumps([created_at.isoformat(), id.hex], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(hex=id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
@@ -0,0 +1,28 @@
+from typing import Any, Mapping
+
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+class ModelResponse(Response):
+    """
+    Pydantic 모델을 pydantic-core 직렬화기로 바로 JSON bytes 로 만드는 응답
+
+    엔드포인트가 Response 를 반환하면 FastAPI 는 response_model 재검증과 jsonable_encoder 변환을 건너뛰므로,
+    서비스가 이미 만든 (검증된) 응답 모델에 사용합니다. response_model 은 OpenAPI 문서용으로 그대로 둡니다.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+            self,
+            content: BaseModel,
+            status_code: int = 200,
+            headers: Mapping[str, str] | None = None,
+            background: BackgroundTask | None = None
+    ):
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Literal
+
+from passlib.context import CryptContext
+
+from fastapi_template.core.metrics.password import PASSWORD_HASH_SECONDS
+
+logger = logging.getLogger(__name__)
+
+HasherKind = Literal["thread", "process"]
+
+
+@lru_cache()
+def _get_context(rounds: int) -> CryptContext:
+    # min/max rounds 를 설정 값으로 고정: cost 가 다른 기존 해시는 needs_update 로 판정되어 로그인 시 재해시됨
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds
+    )
+
+
+# 워커 프로세스에서도 실행되므로 모듈 수준 함수로 정의 (pickle 가능)
+def _hash(rounds: int, password: str) -> str:
+    return _get_context(rounds).hash(password)
+
+
+def _verify(rounds: int, password: str, hashed_password: str) -> bool:
+    return _get_context(rounds).verify(password, hashed_password)
+
+
+def _verify_and_update(rounds: int, password: str, hashed_password: str) -> tuple[bool, str | None]:
+    return _get_context(rounds).verify_and_update(password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 이벤트 루프 밖의 워커 풀에서 실행합니다.
+
+    - thread: bcrypt 라이브러리가 연산 중 GIL 을 해제하므로 스레드 풀로도 병렬 처리됨 (기본값)
+    - process: 같은 프로세스의 다른 CPU 작업과 격리가 필요한 경우
+    동시에 실행되는 해시 연산은 max_workers 개로 제한되고, 나머지는 풀의 대기열에서 기다립니다.
+    """
+
+    def __init__(self, rounds: int = 12, kind: HasherKind = "thread", max_workers: int = 4):
+        self.rounds = rounds
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher"
+                )
+            logger.info(f"Password hasher 시작 (kind={self.kind}, max_workers={self.max_workers}, rounds={self.rounds})")
+        return self._executor
+
+    async def _run(self, operation: str, fn, *args):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._get_executor(), fn, self.rounds, *args)
+        finally:
+            PASSWORD_HASH_SECONDS.labels(operation).observe(time.perf_counter() - started)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", _hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", _verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """비밀번호를 검증하고, 해시의 cost 가 현재 설정과 다르면 새 해시를 함께 반환합니다."""
+        return await self._run("verify_and_update", _verify_and_update, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
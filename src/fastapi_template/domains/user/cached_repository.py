@@ -0,0 +1,125 @@
+from datetime import datetime
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from fastapi_template.core.cache.singleflight import SingleFlight
+from fastapi_template.core.cache.tiered import TieredCache
+from fastapi_template.core.config.database import use_primary
+from fastapi_template.domains.user.models import User
+from fastapi_template.domains.user.repository import UserRepository
+from fastapi_template.domains.user.schemas import UserCreate, UserUpdate, UserFilter, UserResponse
+
+
+class CachedUserRepository:
+    """
+    UserRepository 의 단건 조회(id, email, username)에 read-through 캐시를 적용하는 래퍼
+
+    - 캐시 값은 hashed_password 를 뺀 공개 필드 (UserResponse) 이며, 조회 시마다 새 UserResponse 로 복원합니다.
+    - 존재하지 않는 사용자(None)는 캐시하지 않음: 가입 직후 조회가 막히지 않도록
+    - 같은 key 의 동시 miss 는 SingleFlight 로 DB 조회 한 번으로 합침
+    - update/delete 시 id key 와 변경 후 key, 캐시에 남아 있는 변경 전 key 를 삭제 (key 를 찾기 위한 DB 조회 없음)
+    - 비밀번호 검증용 조회, 목록 조회와 쓰기는 그대로 UserRepository 에 위임
+    - 무효화는 공유 캐시(Redis)와 현재 프로세스의 in-process 캐시에만 적용되므로, 워커가 여럿이면 Redis 만 사용 (dependencies 참고)
+    """
+
+    def __init__(self, repository: UserRepository, cache: TieredCache, singleflight: SingleFlight):
+        self.repository = repository
+        self.cache = cache
+        self.singleflight = singleflight
+
+    @staticmethod
+    def _keys(user: User | UserResponse) -> tuple[str, str, str]:
+        return f"id:{user.id}", f"email:{user.email}", f"username:{user.username}"
+
+    async def _get(self, key: str, load: Callable[[], Awaitable[User | None]]) -> UserResponse | None:
+        data = await self.cache.get(key)
+        if data is None:
+            data = await self.singleflight.do(key, lambda: self._load(load))
+        return UserResponse.model_validate(data) if data is not None else None
+
+    async def _load(self, load: Callable[[], Awaitable[User | None]]) -> dict | None:
+        # 무효화 직후 지연된 replica 의 이전 값으로 캐시가 다시 채워지지 않도록 캐시를 채우는 조회는 primary 에서 실행
+        use_primary(self.repository.session)
+        user = await load()
+        if user is None:
+            return None
+
+        # 비밀번호 해시는 in-process/Redis 캐시에 남기지 않음
+        data = UserResponse.model_validate(user).model_dump(mode="json")
+        for key in self._keys(user):
+            await self.cache.set(key, data)
+        return data
+
+    async def _cached_keys(self, user_id: UUID) -> set[str]:
+        """id key 와, 캐시에 남아 있으면 그 사용자의 email/username key (DB 조회 없음)"""
+        data = await self.cache.get(f"id:{user_id}")
+        if data is None:
+            return {f"id:{user_id}"}
+        return set(self._keys(UserResponse.model_validate(data)))
+
+    async def _invalidate(self, keys: set[str]) -> None:
+        if keys:
+            await self.cache.delete(*keys)
+
+    async def create(self, user_data: UserCreate, hashed_password: str) -> User:
+        return await self.repository.create(user_data, hashed_password)
+
+    async def get_by_id(self, user_id: UUID) -> UserResponse | None:
+        return await self._get(f"id:{user_id}", lambda: self.repository.get_by_id(user_id))
+
+    async def get_by_email(self, email: str) -> UserResponse | None:
+        return await self._get(f"email:{email}", lambda: self.repository.get_by_email(email))
+
+    async def get_by_username(self, username: str) -> UserResponse | None:
+        return await self._get(f"username:{username}", lambda: self.repository.get_by_username(username))
+
+    async def get_for_authentication(self, email: str) -> User | None:
+        return await self.repository.get_for_authentication(email)
+
+    async def get_list(self, filters: UserFilter, after: tuple[datetime, UUID] | None = None) -> list[User]:
+        return await self.repository.get_list(filters, after)
+
+    async def count(self, filters: UserFilter) -> int:
+        return await self.repository.count(filters)
+
+    async def get_many(self, user_ids: list[UUID]) -> list[User]:
+        return await self.repository.get_many(user_ids)
+
+    async def find_existing(self, emails: list[str], usernames: list[str]) -> tuple[dict[str, UUID], dict[str, UUID]]:
+        return await self.repository.find_existing(emails, usernames)
+
+    async def bulk_insert(self, rows: list[dict]) -> set[UUID]:
+        return await self.repository.bulk_insert(rows)
+
+    async def bulk_update(self, rows: list[dict]) -> None:
+        before = await self.repository.get_many([row["id"] for row in rows])
+        keys = {key for user in before for key in self._keys(user)}
+        keys.update(f"email:{row['email']}" for row in rows if row.get("email"))
+        keys.update(f"username:{row['username']}" for row in rows if row.get("username"))
+
+        await self.repository.bulk_update(rows)
+        await self._invalidate(keys)
+
+    async def rollback(self) -> None:
+        await self.repository.rollback()
+
+    async def update(self, user_id: UUID, user_data: UserUpdate) -> User | None:
+        # id key 가 캐시에 없으면 같은 시점에 캐시된 email/username key 도 TTL 이 지났거나 없는 상태
+        keys = await self._cached_keys(user_id)
+
+        user = await self.repository.update(user_id, user_data)
+        if user is not None:
+            keys.update(self._keys(user))
+        await self._invalidate(keys)
+        return user
+
+    async def update_password(self, user_id: UUID, hashed_password: str) -> None:
+        # 캐시 값에는 비밀번호 해시가 없으므로 무효화할 key 가 없음
+        await self.repository.update_password(user_id, hashed_password)
+
+    async def delete(self, user_id: UUID) -> bool:
+        keys = await self._cached_keys(user_id)
+
+        deleted = await self.repository.delete(user_id)
+        await self._invalidate(keys)
+        return deleted
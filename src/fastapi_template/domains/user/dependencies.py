@@ -1,20 +1,86 @@
+from dataclasses import dataclass
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
-from fastapi_template.core.config.database import DbDep
+from fastapi_template.core.cache.memory import TTLCache
+from fastapi_template.core.cache.redis_client import get_redis_client
+from fastapi_template.core.cache.singleflight import SingleFlight
+from fastapi_template.core.cache.tiered import TieredCache
+from fastapi_template.core.config.database import AsyncSessionLocal, DbDep
+from fastapi_template.core.config.settings import Settings
+from fastapi_template.core.security.password import PasswordHasher
+from fastapi_template.domains.user.cached_repository import CachedUserRepository
+from fastapi_template.domains.user.export import UserExporter
 from fastapi_template.domains.user.repository import UserRepository
 from fastapi_template.domains.user.service import UserService
 
 
-def get_user_repository(session: DbDep) -> UserRepository:
-    return UserRepository(session)
+@dataclass(frozen=True)
+class UserComponents:
+    """
+    요청 간에 공유하는 user 도메인 구성 요소 (상태가 없거나 스레드/코루틴 안전한 객체)
 
+    lifespan 에서 한 번 만들어 app.state.user 에 보관하고, 요청마다 새로 만드는 것은
+    세션에 묶인 UserRepository 와 UserService 뿐입니다.
+    """
+    password_hasher: PasswordHasher
+    total_cache: TTLCache[int]  # 목록 조회 전체 건수 캐시 (필터 조합별)
+    user_cache: TieredCache | None  # 단건 조회 캐시 (id, email, username), 비활성화 시 None
+    singleflight: SingleFlight
+    exporter: UserExporter
+    bulk_chunk_size: int
 
-def get_user_service(
-        user_repository: Annotated[UserRepository, Depends(get_user_repository)]
-) -> UserService:
-    return UserService(user_repository)
+    def shutdown(self) -> None:
+        self.password_hasher.shutdown()
+
+
+def create_user_components(settings: Settings) -> UserComponents:
+    return UserComponents(
+        password_hasher=PasswordHasher(
+            rounds=settings.password_hash_rounds,
+            kind=settings.password_hash_executor,
+            max_workers=settings.password_hash_max_workers
+        ),
+        total_cache=TTLCache(
+            max_size=settings.user_total_cache_max_entries,
+            ttl_seconds=settings.user_total_cache_ttl_seconds
+        ),
+        user_cache=TieredCache(
+            namespace="user",
+            # 다른 워커의 in-process 캐시는 무효화할 수 없으므로 Redis 를 쓰면 1단계 캐시는 끔 (max_size=0)
+            memory=TTLCache(
+                max_size=0 if settings.user_cache_redis_enabled else settings.user_cache_max_entries,
+                ttl_seconds=settings.user_cache_ttl_seconds
+            ),
+            redis=get_redis_client() if settings.user_cache_redis_enabled else None,
+            ttl_seconds=settings.user_cache_ttl_seconds
+        ) if settings.user_cache_enabled else None,
+        singleflight=SingleFlight(),
+        exporter=UserExporter(AsyncSessionLocal, chunk_rows=settings.user_export_chunk_rows),
+        bulk_chunk_size=settings.user_bulk_chunk_size
+    )
+
+
+# async 로 선언: 동기 의존성은 요청마다 스레드풀을 거쳐 실행되므로
+async def get_user_service(request: Request, session: DbDep) -> UserService:
+    components: UserComponents = request.app.state.user
+
+    repository = UserRepository(session)
+    if components.user_cache is not None:
+        repository = CachedUserRepository(repository, components.user_cache, components.singleflight)
+
+    return UserService(
+        repository,
+        components.password_hasher,
+        components.total_cache,
+        bulk_chunk_size=components.bulk_chunk_size
+    )
+
+
+async def get_user_exporter(request: Request) -> UserExporter:
+    return request.app.state.user.exporter
 
 
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+UserExporterDep = Annotated[UserExporter, Depends(get_user_exporter)]
@@ -0,0 +1,57 @@
+import re
+
+from sqlalchemy.exc import IntegrityError
+
+# unique 인덱스 이름 → 충돌한 필드 (models.User 의 Field(unique=True, index=True) 가 만드는 인덱스)
+_UNIQUE_INDEX_FIELDS = {
+    "ix_users_email": "email",
+    "ix_users_username": "username",
+}
+
+# MySQL 1062: "Duplicate entry 'a@b.com' for key 'users.ix_users_email'" (8.0 미만은 테이블 접두어 없음)
+_MYSQL_DUPLICATE_ENTRY = 1062
+_MYSQL_DUPLICATE_KEY = re.compile(r"for key '(?:[^'.]+\.)?([^']+)'")
+
+# SQLite 는 인덱스 이름 대신 컬럼을 알려줌: "UNIQUE constraint failed: users.email"
+_SQLITE_UNIQUE_COLUMNS = {
+    "UNIQUE constraint failed: users.email": "ix_users_email",
+    "UNIQUE constraint failed: users.username": "ix_users_username",
+}
+
+
+def _violated_constraint(error: IntegrityError) -> str | None:
+    """IntegrityError 에서 위반된 unique 제약(인덱스) 이름을 꺼냅니다. 알 수 없으면 None."""
+    orig = error.orig
+
+    # asyncpg: SQLAlchemy 어댑터 예외의 __cause__ 가 constraint_name 을 가진 asyncpg 예외
+    for candidate in (orig, getattr(orig, "__cause__", None)):
+        constraint_name = getattr(candidate, "constraint_name", None)
+        if constraint_name:
+            return constraint_name
+
+    # aiomysql/pymysql: args == (errno, message)
+    args = getattr(orig, "args", ())
+    if len(args) >= 2 and args[0] == _MYSQL_DUPLICATE_ENTRY:
+        match = _MYSQL_DUPLICATE_KEY.search(str(args[1]))
+        if match:
+            return match.group(1)
+
+    return _SQLITE_UNIQUE_COLUMNS.get(str(orig))
+
+
+class UserAlreadyExistsError(Exception):
+    """email 또는 username 이 이미 사용 중 (unique 제약 위반, 400)"""
+
+    def __init__(self, field: str):
+        super().__init__(f"User with the same {field} already exists")
+        self.field = field
+
+    @classmethod
+    def from_integrity_error(cls, error: IntegrityError) -> "UserAlreadyExistsError | None":
+        """
+        위반된 제약 이름으로 충돌한 컬럼을 찾습니다.
+
+        email/username unique 인덱스 위반이 아니면 (NOT NULL 위반 등) None 을 반환해 원래 예외를 그대로 올리게 합니다.
+        """
+        field = _UNIQUE_INDEX_FIELDS.get(_violated_constraint(error) or "")
+        return cls(field) if field else None
@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from fastapi_template.core.constants.export_format import ExportFormat
+from fastapi_template.domains.user.repository import EXPORT_COLUMNS, UserRepository
+from fastapi_template.domains.user.schemas import UserExportFilter
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv"
+}
+
+_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def _to_text(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _encode_ndjson(rows: Sequence[Row]) -> bytes:
+    # UUID 등 나머지 타입은 default=str 로 문자열 변환
+    return "".join(
+        json.dumps({field: _to_text(value) for field, value in zip(_FIELDS, row)}, default=str, ensure_ascii=False)
+        + "\n"
+        for row in rows
+    ).encode()
+
+
+def _encode_csv(rows: Sequence[Row] | None) -> bytes:
+    """rows 가 None 이면 헤더 한 줄만 만듭니다."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if rows is None:
+        writer.writerow(_FIELDS)
+    else:
+        writer.writerows([_to_text(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+class UserExporter:
+    """
+    users 테이블을 NDJSON/CSV 로 스트리밍 내보내기
+
+    요청 스코프 세션(get_db)은 StreamingResponse 본문을 보내기 전에 닫히므로,
+    스트림 안에서 별도 세션을 열고 모든 행을 보낸 뒤 닫습니다.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], chunk_rows: int = 1000):
+        self.session_factory = session_factory
+        self.chunk_rows = chunk_rows
+
+    async def stream(self, filters: UserExportFilter) -> AsyncIterator[bytes]:
+        if filters.format == ExportFormat.CSV:
+            encode = _encode_csv
+            yield _encode_csv(None)
+        else:
+            encode = _encode_ndjson
+
+        async with self.session_factory() as session:
+            async for rows in UserRepository(session).stream_rows(filters, self.chunk_rows):
+                yield encode(rows)
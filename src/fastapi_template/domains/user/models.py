@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import DDL, Index, event
 from sqlmodel import SQLModel, Field
 
 
@@ -13,8 +14,35 @@ class UserBase(SQLModel):
 
 class User(UserBase, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # 목록 조회 keyset pagination 정렬 키
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # 부분 문자열 검색 인덱스 (DB 별로 해당 DB 에서만 생성)
+        # PostgreSQL 의 unique B-tree 인덱스는 C 가 아닌 collation 에서 LIKE 'x%' 에 쓰이지 않으므로 prefix 도 trigram 인덱스 사용
+        # create_all 은 새 테이블에만 인덱스를 만들므로 기존 DB 는 scripts/create_user_search_indexes.py 로 추가
+        Index(
+            "ft_users_email", "email", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"
+        ).ddl_if(dialect="mysql"),
+        Index(
+            "ft_users_username", "username", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"
+        ).ddl_if(dialect="mysql"),
+        Index(
+            "ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     hashed_password: str = Field(max_length=255)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# trigram 인덱스에 필요한 PostgreSQL 확장
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
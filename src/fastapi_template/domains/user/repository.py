@@ -1,10 +1,30 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import ColumnElement, Row, Select, and_, delete, func, insert, lambda_stmt, or_, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert, match as mysql_match
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fastapi_template.core.constants.search_mode import SearchMode
+from fastapi_template.domains.user.exceptions import UserAlreadyExistsError
 from fastapi_template.domains.user.models import User
-from fastapi_template.domains.user.schemas import UserCreate, UserUpdate, UserFilter
+from fastapi_template.domains.user.schemas import UserCreate, UserUpdate, UserFilter, UserSearchFilter
+
+# 내보내기 대상 컬럼 (hashed_password 제외)
+EXPORT_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.full_name,
+    User.is_active,
+    User.created_at,
+    User.updated_at
+)
 
 
 class UserRepository:
@@ -12,6 +32,12 @@ class UserRepository:
         self.session = session
 
     async def create(self, user_data: UserCreate, hashed_password: str) -> User:
+        """
+        INSERT 후 커밋만 실행합니다. (중복 검사 SELECT, refresh 없음)
+
+        모든 컬럼 기본값은 Python 쪽에서 채워지고 expire_on_commit=False 이므로 refresh 가 필요 없습니다.
+        email/username 중복은 unique 제약 위반을 UserAlreadyExistsError 로 변환해 알립니다.
+        """
         user = User(
             email=user_data.email,
             username=user_data.username,
@@ -19,65 +45,220 @@ class UserRepository:
             hashed_password=hashed_password
         )
         self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
+        async with self._unique_violation_guard():
+            await self.session.commit()
         return user
 
+    @asynccontextmanager
+    async def _unique_violation_guard(self) -> AsyncIterator[None]:
+        """블록 안의 unique 제약 위반(IntegrityError)을 롤백하고 UserAlreadyExistsError 로 변환합니다."""
+        try:
+            yield
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise UserAlreadyExistsError.from_integrity_error(e) or e
+
+    # 단건 조회는 lambda_stmt 로 작성: statement 구성과 cache key 생성을 코드 위치 기준으로 한 번만 하고,
+    # 이후 호출은 클로저 변수만 bound parameter 로 바꿔 compiled cache 를 그대로 사용
     async def get_by_id(self, user_id: UUID) -> User | None:
-        statement = select(User).where(User.id == user_id)
+        statement = lambda_stmt(lambda: select(User).where(User.id == user_id))
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
     async def get_by_email(self, email: str) -> User | None:
-        statement = select(User).where(User.email == email)
+        statement = lambda_stmt(lambda: select(User).where(User.email == email))
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
     async def get_by_username(self, username: str) -> User | None:
-        statement = select(User).where(User.username == username)
+        statement = lambda_stmt(lambda: select(User).where(User.username == username))
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
-    async def get_list(self, filters: UserFilter) -> tuple[list[User], int]:
-        statement = select(User)
+    async def get_for_authentication(self, email: str) -> User | None:
+        """비밀번호 검증용 조회: hashed_password 를 포함한 User 를 반환합니다. (캐시 래퍼도 캐시하지 않음)"""
+        return await self.get_by_email(email)
 
+    def _apply_filters(self, statement: Select, filters: UserSearchFilter) -> Select:
         if filters.email:
-            statement = statement.where(User.email.contains(filters.email))
+            statement = statement.where(self._match(User.email, filters.email, filters.match))
         if filters.username:
-            statement = statement.where(User.username.contains(filters.username))
+            statement = statement.where(self._match(User.username, filters.username, filters.match))
         if filters.is_active is not None:
             statement = statement.where(User.is_active.is_(filters.is_active))
+        return statement
+
+    def _match(self, column, value: str, mode: SearchMode) -> ColumnElement[bool]:
+        if mode == SearchMode.EXACT:
+            return column == value
+        if mode == SearchMode.PREFIX:
+            return column.startswith(value, autoescape=True)
+
+        # ngram 인덱스는 2글자(ngram_token_size) 미만 검색어를 찾지 못하므로 LIKE 로 처리
+        if mode == SearchMode.FULLTEXT and self.session.get_bind().dialect.name == "mysql" and len(value) >= 2:
+            # 따옴표로 감싸 n-gram 이 연속으로 나타나는 행만 찾음 (부분 문자열 검색)
+            return mysql_match(column, against='"' + value.replace('"', " ") + '"').in_boolean_mode()
+
+        return column.contains(value, autoescape=True)
+
+    async def get_list(
+            self,
+            filters: UserFilter,
+            after: tuple[datetime, UUID] | None = None
+    ) -> list[User]:
+        """
+        (created_at, id) 순으로 정렬된 목록에서 최대 size + 1 건을 조회합니다. (다음 페이지 존재 여부 확인용)
+
+        - after 가 있으면 keyset 방식: 해당 정렬 키 다음 행부터 ix_users_created_at_id 인덱스로 바로 조회
+        - 없으면 page 기준 offset 방식 (하위 호환)
+        """
+        statement = self._apply_filters(select(User), filters).order_by(User.created_at, User.id)
+
+        if after is not None:
+            created_at, user_id = after
+            # row value 비교 (created_at, id) > (...) 를 펼친 형태: 모든 DB 에서 인덱스 range scan 으로 처리됨
+            statement = statement.where(or_(
+                User.created_at > created_at,
+                and_(User.created_at == created_at, User.id > user_id)
+            ))
+        else:
+            statement = statement.offset((filters.page - 1) * filters.size)
 
-        total_statement = select(func.count(User.id)).select_from(statement.subquery())
-        total_result = await self.session.execute(total_statement)
-        total = total_result.scalar_one()
+        result = await self.session.execute(statement.limit(filters.size + 1))
+        return list(result.scalars().all())
 
-        offset = (filters.page - 1) * filters.size
-        statement = statement.offset(offset).limit(filters.size)
+    async def stream_rows(self, filters: UserSearchFilter, chunk_rows: int) -> AsyncIterator[Sequence[Row]]:
+        """
+        검색 조건에 맞는 사용자를 server-side cursor 로 chunk_rows 건씩 읽어 내보냅니다.
 
+        ORM 객체 대신 EXPORT_COLUMNS 튜플만 읽으므로 전체 테이블도 일정한 메모리로 처리됩니다.
+        """
+        statement = (
+            self._apply_filters(select(*EXPORT_COLUMNS), filters)
+            .order_by(User.created_at, User.id)
+            .execution_options(yield_per=chunk_rows)
+        )
+        result = await self.session.stream(statement)
+        async for rows in result.partitions():
+            yield rows
+
+    async def count(self, filters: UserFilter) -> int:
+        statement = self._apply_filters(select(func.count()).select_from(User), filters)
         result = await self.session.execute(statement)
-        users = result.scalars().all()
+        return result.scalar_one()
+
+    async def get_many(self, user_ids: list[UUID]) -> list[User]:
+        statement = select(User).where(User.id.in_(user_ids))
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
+    async def find_existing(self, emails: list[str], usernames: list[str]) -> tuple[dict[str, UUID], dict[str, UUID]]:
+        """
+        이미 사용 중인 email / username 을 한 번의 쿼리로 조회합니다.
+
+        {email: user_id}, {username: user_id} 를 반환합니다.
+        """
+        if not emails and not usernames:
+            return {}, {}
+
+        statement = select(User.id, User.email, User.username).where(or_(
+            User.email.in_(emails),
+            User.username.in_(usernames)
+        ))
+        rows = (await self.session.execute(statement)).all()
+
+        email_set, username_set = set(emails), set(usernames)
+        return (
+            {row.email: row.id for row in rows if row.email in email_set},
+            {row.username: row.id for row in rows if row.username in username_set}
+        )
 
-        return users, total
+    async def bulk_insert(self, rows: list[dict]) -> set[UUID]:
+        """
+        여러 사용자를 multi-row INSERT 한 번으로 추가하고 커밋합니다.
+
+        사전 검사 이후 동시에 추가된 email/username 과 충돌하는 행은 건너뛰며 (ON CONFLICT DO NOTHING /
+        ON DUPLICATE KEY UPDATE no-op), 실제로 추가된 id 집합을 반환합니다.
+        """
+        dialect = self.session.get_bind().dialect
+
+        if dialect.name == "mysql":
+            statement = mysql_insert(User).values(rows)
+            statement = statement.on_duplicate_key_update(id=statement.table.c.id)
+        elif dialect.name == "postgresql":
+            statement = postgresql_insert(User).values(rows).on_conflict_do_nothing()
+        elif dialect.name == "sqlite":
+            statement = sqlite_insert(User).values(rows).on_conflict_do_nothing()
+        else:
+            statement = insert(User).values(rows)
+
+        row_ids = [row["id"] for row in rows]
+        if dialect.insert_returning:
+            inserted = set((await self.session.execute(statement.returning(User.id))).scalars().all())
+        else:
+            await self.session.execute(statement)
+            inserted = set((await self.session.execute(
+                select(User.id).where(User.id.in_(row_ids))
+            )).scalars().all())
+
+        await self.session.commit()
+        return inserted
+
+    async def bulk_update(self, rows: list[dict]) -> None:
+        """id 와 변경할 필드를 담은 dict 목록으로 primary key 기준 bulk UPDATE 후 커밋합니다."""
+        await self.session.execute(update(User), rows)
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
 
     async def update(self, user_id: UUID, user_data: UserUpdate) -> User | None:
-        user = await self.get_by_id(user_id)
-        if not user:
-            return None
+        """
+        UPDATE 한 번으로 수정합니다. (조회 후 수정, refresh 없음)
 
+        UPDATE ... RETURNING 을 지원하는 DB 는 수정된 행을 바로 받고, MySQL 은 UPDATE 후 한 번 더 조회합니다.
+        """
         update_data = user_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user, field, value)
+        if not update_data:
+            return await self.get_by_id(user_id)
 
+        statement = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data, updated_at=datetime.utcnow())
+            # 세션에 이미 로드된 객체 동기화용 SELECT 생략 (RETURNING/재조회 결과로 갱신)
+            .execution_options(synchronize_session=False)
+        )
+
+        if self.session.get_bind().dialect.update_returning:
+            async with self._unique_violation_guard():
+                result = await self.session.execute(
+                    statement.returning(User),
+                    execution_options={"populate_existing": True}
+                )
+                user = result.scalar_one_or_none()
+                await self.session.commit()
+            return user
+
+        async with self._unique_violation_guard():
+            result = await self.session.execute(statement)
+            await self.session.commit()
+        if result.rowcount == 0:
+            return None
+        return await self.session.get(User, user_id, populate_existing=True)
+
+    async def update_password(self, user_id: UUID, hashed_password: str) -> None:
+        statement = (
+            update(User)
+            .where(User.id == user_id)
+            .values(hashed_password=hashed_password, updated_at=datetime.utcnow())
+        )
+        await self.session.execute(statement)
         await self.session.commit()
-        await self.session.refresh(user)
-        return user
 
     async def delete(self, user_id: UUID) -> bool:
-        user = await self.get_by_id(user_id)
-        if not user:
-            return False
-
-        await self.session.delete(user)
+        """DELETE 한 번으로 삭제하고, 삭제된 행이 있는지 반환합니다."""
+        statement = delete(User).where(User.id == user_id).execution_options(synchronize_session=False)
+        result = await self.session.execute(statement)
         await self.session.commit()
-        return True
+        return result.rowcount > 0
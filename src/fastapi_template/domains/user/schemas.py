@@ -3,6 +3,11 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
 
+from fastapi_template.core.constants.export_format import ExportFormat
+from fastapi_template.core.constants.search_mode import SearchMode
+
+BULK_MAX_ITEMS = 10000
+
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -18,6 +23,30 @@ class UserUpdate(BaseModel):
     is_active: bool | None = None
 
 
+class UserBulkCreate(BaseModel):
+    users: list[UserCreate] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class UserBulkUpdateItem(UserUpdate):
+    id: UUID
+
+
+class UserBulkUpdate(BaseModel):
+    users: list[UserBulkUpdateItem] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class UserBulkError(BaseModel):
+    index: int  # 요청 users 목록에서의 위치
+    detail: str
+
+
+class UserBulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    ids: list[UUID]
+    errors: list[UserBulkError]
+
+
 class UserResponse(BaseModel):
     id: UUID
     email: str
@@ -34,14 +63,26 @@ class UserResponse(BaseModel):
 
 class UserListResponse(BaseModel):
     users: list[UserResponse]
-    total: int
+    total: int | None
     page: int
     size: int
+    next_cursor: str | None = None
 
 
-class UserFilter(BaseModel):
+class UserSearchFilter(BaseModel):
+    """목록 조회와 내보내기에 공통으로 쓰는 검색 조건"""
     email: str | None = None
     username: str | None = None
+    match: SearchMode = Field(default=SearchMode.CONTAINS, description="email/username 검색 방식")
     is_active: str | None = None
-    page: int = Field(default=1, ge=1)
+
+
+class UserFilter(UserSearchFilter):
+    cursor: str | None = Field(default=None, description="이전 응답의 next_cursor (지정 시 page 무시)")
+    page: int = Field(default=1, ge=1, description="offset 방식 페이지 번호 (하위 호환용, cursor 사용 권장)")
     size: int = Field(default=10, ge=1, le=100)
+    include_total: bool = Field(default=False, description="전체 건수 포함 여부 (짧은 시간 캐시된 값)")
+
+
+class UserExportFilter(UserSearchFilter):
+    format: ExportFormat = Field(default=ExportFormat.NDJSON, description="내보내기 형식")
@@ -1,12 +1,23 @@
+import asyncio
+from datetime import datetime
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
+from sqlalchemy.exc import IntegrityError
 
+from fastapi_template.core.cache.memory import TTLCache
+from fastapi_template.core.pagination.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from fastapi_template.core.security.password import PasswordHasher
+from fastapi_template.domains.user.cached_repository import CachedUserRepository
+from fastapi_template.domains.user.exceptions import UserAlreadyExistsError
 from fastapi_template.domains.user.models import User
 from fastapi_template.domains.user.repository import UserRepository
 from fastapi_template.domains.user.schemas import (
+    UserBulkCreate,
+    UserBulkError,
+    UserBulkResult,
+    UserBulkUpdate,
     UserCreate,
     UserUpdate,
     UserResponse,
@@ -14,36 +25,185 @@ from fastapi_template.domains.user.schemas import (
     UserFilter
 )
 
+# UserUpdate 에서 생략은 가능하지만 명시적인 null 로는 수정할 수 없는 컬럼 (NOT NULL)
+NOT_NULL_UPDATE_FIELDS = ("email", "username", "is_active")
+
 
 class UserService:
-    def __init__(self, user_repository: UserRepository):  # Repository 주입
+    def __init__(
+            self,
+            user_repository: UserRepository | CachedUserRepository,  # Repository 주입
+            password_hasher: PasswordHasher,
+            total_cache: TTLCache[int] | None = None,
+            bulk_chunk_size: int = 500
+    ):
         self.repository = user_repository
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.password_hasher = password_hasher
+        self.total_cache = total_cache
+        self.bulk_chunk_size = bulk_chunk_size
 
-    def _hash_password(self, password: str) -> str:
-        return self.pwd_context.hash(password)
+    async def create_user(self, user_data: UserCreate) -> UserResponse:
+        # 중복 검사는 별도 SELECT 없이 unique 제약 위반으로 판단
+        hashed_password = await self.password_hasher.hash(user_data.password)
+        try:
+            user = await self.repository.create(user_data, hashed_password)
+        except UserAlreadyExistsError as e:
+            raise self._already_exists(e)
+        return UserResponse.model_validate(user)
 
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.pwd_context.verify(plain_password, hashed_password)
+    @staticmethod
+    def _already_exists(error: UserAlreadyExistsError) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered" if error.field == "email" else "Username already taken"
+        )
 
-    async def create_user(self, user_data: UserCreate) -> UserResponse:
-        existing_user = await self.repository.get_by_email(user_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
+    async def bulk_create_users(self, data: UserBulkCreate) -> UserBulkResult:
+        """
+        여러 사용자를 chunk 단위로 추가합니다. 실패한 행은 건너뛰고 행별 오류로 보고합니다.
+
+        chunk 마다 중복 검사 쿼리 1회, 비밀번호 해시 병렬 처리, multi-row INSERT 1회, 커밋 1회를 실행합니다.
+        """
+        errors: dict[int, str] = {}
+        ids: list[UUID] = []
+
+        candidates = []
+        seen_emails, seen_usernames = set(), set()
+        for index, item in enumerate(data.users):
+            if item.email in seen_emails:
+                errors[index] = "Duplicate email in request"
+            elif item.username in seen_usernames:
+                errors[index] = "Duplicate username in request"
+            else:
+                candidates.append((index, item))
+            seen_emails.add(item.email)
+            seen_usernames.add(item.username)
+
+        for start in range(0, len(candidates), self.bulk_chunk_size):
+            chunk = candidates[start:start + self.bulk_chunk_size]
+
+            existing_emails, existing_usernames = await self.repository.find_existing(
+                [item.email for _, item in chunk],
+                [item.username for _, item in chunk]
             )
+            valid = []
+            for index, item in chunk:
+                if item.email in existing_emails:
+                    errors[index] = "Email already registered"
+                elif item.username in existing_usernames:
+                    errors[index] = "Username already taken"
+                else:
+                    valid.append((index, item))
+            if not valid:
+                continue
 
-        existing_username = await self.repository.get_by_username(user_data.username)
-        if existing_username:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
+            hashed_passwords = await asyncio.gather(
+                *(self.password_hasher.hash(item.password) for _, item in valid)
             )
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "id": uuid4(),
+                    "email": item.email,
+                    "username": item.username,
+                    "full_name": item.full_name,
+                    "is_active": True,
+                    "hashed_password": hashed_password,
+                    "created_at": now,
+                    "updated_at": now
+                }
+                for (_, item), hashed_password in zip(valid, hashed_passwords)
+            ]
 
-        hashed_password = self._hash_password(user_data.password)
-        user = await self.repository.create(user_data, hashed_password)
-        return UserResponse.model_validate(user)
+            inserted = await self.repository.bulk_insert(rows)
+            for (index, _), row in zip(valid, rows):
+                if row["id"] in inserted:
+                    ids.append(row["id"])
+                else:
+                    errors[index] = "Email or username already exists"
+
+        return self._bulk_result(ids, errors)
+
+    async def bulk_update_users(self, data: UserBulkUpdate) -> UserBulkResult:
+        """여러 사용자를 chunk 단위로 수정합니다. 실패한 행은 건너뛰고 행별 오류로 보고합니다."""
+        errors: dict[int, str] = {}
+        ids: list[UUID] = []
+
+        candidates = []
+        seen_ids, seen_emails, seen_usernames = set(), set(), set()
+        for index, item in enumerate(data.users):
+            null_field = next(
+                (name for name in NOT_NULL_UPDATE_FIELDS if name in item.model_fields_set and getattr(item, name) is None),
+                None
+            )
+            if null_field:
+                errors[index] = f"{null_field} must not be null"
+            elif item.id in seen_ids:
+                errors[index] = "Duplicate id in request"
+            elif item.email and item.email in seen_emails:
+                errors[index] = "Duplicate email in request"
+            elif item.username and item.username in seen_usernames:
+                errors[index] = "Duplicate username in request"
+            else:
+                candidates.append((index, item))
+            seen_ids.add(item.id)
+            seen_emails.add(item.email)
+            seen_usernames.add(item.username)
+
+        for start in range(0, len(candidates), self.bulk_chunk_size):
+            chunk = candidates[start:start + self.bulk_chunk_size]
+
+            found = {user.id for user in await self.repository.get_many([item.id for _, item in chunk])}
+            existing_emails, existing_usernames = await self.repository.find_existing(
+                [item.email for _, item in chunk if item.email],
+                [item.username for _, item in chunk if item.username]
+            )
+
+            valid = []
+            for index, item in chunk:
+                if item.id not in found:
+                    errors[index] = "User not found"
+                elif item.email and existing_emails.get(item.email, item.id) != item.id:
+                    errors[index] = "Email already registered"
+                elif item.username and existing_usernames.get(item.username, item.id) != item.id:
+                    errors[index] = "Username already taken"
+                else:
+                    valid.append((index, item))
+            if not valid:
+                continue
+
+            now = datetime.utcnow()
+            rows = [(index, {**item.model_dump(exclude_unset=True), "updated_at": now}) for index, item in valid]
+            try:
+                await self.repository.bulk_update([row for _, row in rows])
+            except IntegrityError:
+                # 사전 검사 이후 동시에 변경된 값과 충돌: 행 단위로 다시 시도해 실패한 행만 보고
+                await self.repository.rollback()
+                for index, row in rows:
+                    try:
+                        await self.repository.bulk_update([row])
+                    except IntegrityError as e:
+                        await self.repository.rollback()
+                        errors[index] = self._update_conflict_detail(e)
+            ids.extend(item.id for index, item in valid if index not in errors)
+
+        return self._bulk_result(ids, errors)
+
+    @classmethod
+    def _update_conflict_detail(cls, error: IntegrityError) -> str:
+        conflict = UserAlreadyExistsError.from_integrity_error(error)
+        if conflict is not None:
+            return cls._already_exists(conflict).detail
+        return "Rejected by a database constraint"
+
+    @staticmethod
+    def _bulk_result(ids: list[UUID], errors: dict[int, str]) -> UserBulkResult:
+        return UserBulkResult(
+            succeeded=len(ids),
+            failed=len(errors),
+            ids=ids,
+            errors=[UserBulkError(index=index, detail=detail) for index, detail in sorted(errors.items())]
+        )
 
     async def get_user_by_id(self, user_id: UUID) -> UserResponse:
         user = await self.repository.get_by_id(user_id)
@@ -61,34 +221,47 @@ class UserService:
         return UserResponse.model_validate(user)
 
     async def get_users(self, filters: UserFilter) -> UserListResponse:
-        users, total = await self.repository.get_list(filters)
-        user_responses = [UserResponse.model_validate(user) for user in users]
+        after = None
+        if filters.cursor:
+            try:
+                after = decode_cursor(filters.cursor)
+            except InvalidCursorError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+
+        users = await self.repository.get_list(filters, after)
+
+        next_cursor = None
+        if len(users) > filters.size:
+            users = users[:filters.size]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
 
         return UserListResponse(
-            users=user_responses,
-            total=total,
+            users=[UserResponse.model_validate(user) for user in users],
+            total=await self._get_total(filters) if filters.include_total else None,
             page=filters.page,
-            size=filters.size
+            size=filters.size,
+            next_cursor=next_cursor
         )
 
-    async def update_user(self, user_id: UUID, user_data: UserUpdate) -> UserResponse:
-        if user_data.email:
-            existing_user = await self.repository.get_by_email(user_data.email)
-            if existing_user and existing_user.id != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
+    async def _get_total(self, filters: UserFilter) -> int:
+        """전체 건수는 필터 조합별로 짧게 캐시합니다. (매 요청마다 전체 count 를 피하기 위해)"""
+        key = (filters.email, filters.username, filters.match, filters.is_active)
+        if self.total_cache is not None and (total := self.total_cache.get(key)) is not None:
+            return total
 
-        if user_data.username:
-            existing_username = await self.repository.get_by_username(user_data.username)
-            if existing_username and existing_username.id != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already taken"
-                )
+        total = await self.repository.count(filters)
+        if self.total_cache is not None:
+            self.total_cache.set(key, total)
+        return total
 
-        user = await self.repository.update(user_id, user_data)
+    async def update_user(self, user_id: UUID, user_data: UserUpdate) -> UserResponse:
+        try:
+            user = await self.repository.update(user_id, user_data)
+        except UserAlreadyExistsError as e:
+            raise self._already_exists(e)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -106,7 +279,16 @@ class UserService:
         return True
 
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
-        user = await self.repository.get_by_email(email)
-        if not user or not self._verify_password(password, user.hashed_password):
+        user = await self.repository.get_for_authentication(email)
+        if not user:
             return None
+
+        verified, new_hash = await self.password_hasher.verify_and_update(password, user.hashed_password)
+        if not verified:
+            return None
+
+        # bcrypt cost 설정이 바뀐 경우 로그인 시점에 새 cost 로 재해시
+        if new_hash:
+            await self.repository.update_password(user.id, new_hash)
+            user.hashed_password = new_hash
         return user
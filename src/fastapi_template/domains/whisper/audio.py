@@ -0,0 +1,195 @@
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import BinaryIO
+
+import numpy as np
+import soundfile
+from fastapi import UploadFile
+
+# whisper.audio 의 하이퍼파라미터와 동일 (torch import 를 피하기 위해 직접 정의)
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30  # 모델이 한 번에 처리하는 구간 길이
+WINDOW_SAMPLES = WINDOW_SECONDS * SAMPLE_RATE
+
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# moov atom 이 파일 끝에 올 수 있어 파이프(비탐색 입력)로는 디코딩할 수 없는 컨테이너
+SEEKABLE_ONLY_EXTENSIONS = {'.mp4', '.m4a', '.mov'}
+
+# ffmpeg 없이 바로 읽을 수 있는 컨테이너의 매직 넘버 (WAV, FLAC)
+_NATIVE_SIGNATURES = (b"RIFF", b"fLaC")
+
+_FFMPEG_OUTPUT_ARGS = [
+    "-f", "s16le",
+    "-ac", "1",
+    "-acodec", "pcm_s16le",
+    "-ar", str(SAMPLE_RATE),
+    "pipe:1"
+]
+
+
+class _PcmBuffer:
+    """ffmpeg 가 출력하는 s16le PCM 을 미리 할당한 NumPy 버퍼에 이어 붙입니다 (부족하면 2배씩 확장)."""
+
+    def __init__(self, capacity_bytes: int):
+        self._buffer = np.empty(max(capacity_bytes, 2), dtype=np.uint8)
+        self._size = 0
+
+    def write(self, data: bytes) -> None:
+        end = self._size + len(data)
+        if end > len(self._buffer):
+            grown = np.empty(max(end, len(self._buffer) * 2), dtype=np.uint8)
+            grown[:self._size] = self._buffer[:self._size]
+            self._buffer = grown
+        self._buffer[self._size:end] = np.frombuffer(data, dtype=np.uint8)
+        self._size = end
+
+    def to_float32(self) -> np.ndarray:
+        # whisper.load_audio 와 동일한 정규화
+        samples = self._buffer[:self._size - self._size % 2].view(np.int16)
+        return samples.astype(np.float32) / 32768.0
+
+
+def _spool(source: BinaryIO, destination: BinaryIO) -> None:
+    """업로드 파일 전체를 destination 에 복사합니다. (디스크 I/O 이므로 스레드에서 실행)"""
+    source.seek(0)
+    shutil.copyfileobj(source, destination, CHUNK_SIZE)
+    destination.flush()
+
+
+def _hash_file(fileobj: BinaryIO) -> str:
+    fileobj.seek(0)
+    digest = hashlib.file_digest(fileobj, "sha256").hexdigest()
+    fileobj.seek(0)
+    return digest
+
+
+async def hash_upload(file: UploadFile) -> str:
+    """업로드 파일 내용의 sha256 해시를 계산하고 읽기 위치를 처음으로 되돌립니다. (이벤트 루프 밖 스레드에서 실행)"""
+    return await asyncio.to_thread(_hash_file, file.file)
+
+
+def _read_native(source: str | BinaryIO, max_seconds: float | None = None) -> np.ndarray | None:
+    """이미 16kHz mono 인 WAV/FLAC (파일 경로 또는 파일 객체) 은 ffmpeg 없이 바로 읽습니다. 조건이 맞지 않으면 None."""
+    frames = int(max_seconds * SAMPLE_RATE) if max_seconds is not None else -1
+    try:
+        with soundfile.SoundFile(source) as sound:
+            if sound.samplerate != SAMPLE_RATE or sound.channels != 1:
+                return None
+            return sound.read(frames=frames, dtype="float32")
+    except RuntimeError:  # libsndfile 이 읽을 수 없는 형식
+        return None
+
+
+async def _run_ffmpeg(input_args: list[str], source, capacity_bytes: int) -> np.ndarray:
+    """
+    ffmpeg 를 실행해 PCM 출력을 버퍼로 읽습니다.
+
+    source 가 있으면 (bytes 청크를 내놓는 async iterator) ffmpeg 의 stdin 으로 흘려보냅니다.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-nostdin", "-threads", "0", *input_args, *_FFMPEG_OUTPUT_ARGS,
+        stdin=asyncio.subprocess.PIPE if source is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    buffer = _PcmBuffer(capacity_bytes)
+
+    async def feed_stdin():
+        try:
+            async for chunk in source:
+                process.stdin.write(chunk)
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg 가 먼저 종료된 경우: 종료 코드와 stderr 로 판단
+            pass
+        finally:
+            process.stdin.close()
+
+    async def read_stdout():
+        while data := await process.stdout.read(CHUNK_SIZE):
+            buffer.write(data)
+
+    try:
+        tasks = [read_stdout(), process.stderr.read()]
+        if source is not None:
+            tasks.append(feed_stdin())
+        _, stderr, *_ = await asyncio.gather(*tasks)
+        return_code = await process.wait()
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    if return_code != 0:
+        raise RuntimeError(f"Failed to load audio: {stderr.decode(errors='replace')}")
+
+    return buffer.to_float32()
+
+
+def _duration_args(max_seconds: float | None) -> list[str]:
+    # 출력 옵션: 앞 max_seconds 초만 디코딩하고 종료 (나머지 입력은 읽지 않음)
+    return ["-t", str(max_seconds)] if max_seconds is not None else []
+
+
+def _capacity_bytes(size: int, max_seconds: float | None) -> int:
+    # 압축 포맷 기준으로 원본 크기만큼의 샘플(=2배 바이트)을 미리 할당 (길이 제한이 있으면 그만큼만)
+    capacity_bytes = size * 2
+    if max_seconds is not None:
+        capacity_bytes = min(capacity_bytes, int(max_seconds * SAMPLE_RATE) * 2)
+    return capacity_bytes
+
+
+async def decode_upload(file: UploadFile, max_seconds: float | None = None) -> np.ndarray:
+    """
+    업로드 파일을 디스크에 다시 쓰지 않고 16kHz mono float32 waveform 으로 디코딩합니다.
+
+    - 16kHz mono WAV/FLAC: ffmpeg 없이 업로드 파일에서 바로 읽음 (스레드에서 실행)
+    - 그 외: 업로드 스트림을 ffmpeg stdin 으로 흘려보내고 PCM 을 NumPy 버퍼로 읽음
+    - mp4/m4a/mov: 파이프 입력을 지원하지 않으므로 자동 삭제되는 임시 파일에 (스레드에서) 복사한 뒤 ffmpeg 로 디코딩
+    max_seconds 를 지정하면 앞부분 max_seconds 초만 디코딩합니다.
+    """
+    capacity_bytes = _capacity_bytes(file.size or CHUNK_SIZE, max_seconds)
+    output_args = _duration_args(max_seconds)
+    file_extension = os.path.splitext(file.filename or "")[1].lower()
+
+    if file_extension in SEEKABLE_ONLY_EXTENSIONS:
+        with tempfile.NamedTemporaryFile(suffix=file_extension) as tmp_file:
+            await asyncio.to_thread(_spool, file.file, tmp_file)
+            return await _run_ffmpeg(["-i", tmp_file.name, *output_args], None, capacity_bytes)
+
+    first_chunk = await file.read(CHUNK_SIZE)
+
+    if first_chunk.startswith(_NATIVE_SIGNATURES):
+        await file.seek(0)
+        audio = await asyncio.to_thread(_read_native, file.file, max_seconds)
+        if audio is not None:
+            return audio
+
+        # 16kHz mono 가 아니면 처음부터 ffmpeg 로 디코딩
+        await file.seek(0)
+        first_chunk = await file.read(CHUNK_SIZE)
+
+    async def upload_chunks():
+        yield first_chunk
+        while chunk := await file.read(CHUNK_SIZE):
+            yield chunk
+
+    return await _run_ffmpeg(["-i", "pipe:0", *output_args], upload_chunks(), capacity_bytes)
+
+
+async def decode_file(path: str) -> np.ndarray:
+    """디스크에 저장된 오디오 파일을 16kHz mono float32 waveform 으로 디코딩합니다."""
+    with open(path, "rb") as audio_file:
+        header = audio_file.read(len(_NATIVE_SIGNATURES[0]))
+
+    if header.startswith(_NATIVE_SIGNATURES):
+        audio = await asyncio.to_thread(_read_native, path)
+        if audio is not None:
+            return audio
+
+    return await _run_ffmpeg(["-i", path], None, os.path.getsize(path) * 2)
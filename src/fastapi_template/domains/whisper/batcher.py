@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from fastapi_template.domains.whisper.executor import ExecutorSlot, WhisperExecutor, current_slot
+from fastapi_template.domains.whisper.inference import TranscriptionResult, transcribe_batch
+
+if TYPE_CHECKING:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    model_name: str
+    mel: "torch.Tensor"
+    language: str | None
+    task: str
+    future: asyncio.Future = field(repr=False)
+    slot: ExecutorSlot | None = field(default=None, repr=False)
+
+
+class WhisperBatchScheduler:
+    """
+    동시에 들어온 transcribe 요청을 모아 한 번에 추론하는 마이크로 배치 스케줄러
+
+    - 최대 배치 크기(max_batch_size)에 도달하거나
+    - 첫 요청 이후 최대 대기 시간(max_wait_ms)이 지나면 배치를 실행합니다.
+
+    배치 추론 자체는 WhisperExecutor 의 워커 풀에서 실행되며, 워커 수(max_workers)만큼의 배치를 동시에 실행합니다.
+    앞선 배치가 실행되는 동안에도 다음 배치를 모으고, 워커가 모두 사용 중이면 빈 워커가 생길 때까지 기다립니다.
+    """
+
+    def __init__(self, executor: WhisperExecutor, max_batch_size: int = 8, max_wait_ms: int = 20):
+        self._executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[_PendingRequest] | None = None
+        self._worker: asyncio.Task | None = None
+        self._batch_slots: asyncio.Semaphore | None = None
+        self._running: set[asyncio.Task] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        """배치에 들어가기를 기다리는 요청 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _ensure_started(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._batch_slots = asyncio.Semaphore(self._executor.max_workers)
+            self._worker = asyncio.create_task(self._run(), name="whisper-batch-scheduler")
+
+    async def submit(
+            self,
+            model_name: str,
+            mel: "torch.Tensor",
+            language: str | None,
+            task: str
+    ) -> TranscriptionResult:
+        """mel spectrogram 하나를 큐에 넣고 배치 추론 결과를 기다립니다."""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(
+            _PendingRequest(
+                model_name=model_name,
+                mel=mel,
+                language=language,
+                task=task,
+                future=future,
+                slot=current_slot()
+            )
+        )
+        return await future
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        # 실행 중인 배치 취소 (각 배치의 요청은 _run_group 에서 취소 처리)
+        for task in self._running:
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+
+        # 처리되지 못한 요청 정리
+        while self._queue is not None and not self._queue.empty():
+            pending = self._queue.get_nowait()
+            if not pending.future.done():
+                pending.future.cancel()
+
+    async def _collect_batch(self) -> list[_PendingRequest]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # 대기 중 취소된 요청은 추론에서 제외
+        return [pending for pending in batch if not pending.future.done()]
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            if not batch:
+                continue
+
+            # 모델이 다른 요청은 같은 배치로 묶을 수 없으므로 모델별로 나눠 실행
+            groups: dict[str, list[_PendingRequest]] = defaultdict(list)
+            for pending in batch:
+                groups[pending.model_name].append(pending)
+
+            for model_name, group in groups.items():
+                # 워커가 모두 사용 중이면 대기: 그동안 들어온 요청은 큐에 쌓여 다음 배치로 모임
+                await self._batch_slots.acquire()
+                task = asyncio.create_task(self._run_group(model_name, group), name=f"whisper-batch-{model_name}")
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+    async def _run_group(self, model_name: str, batch: list[_PendingRequest]) -> None:
+        try:
+            await self._infer(model_name, batch)
+        finally:
+            self._batch_slots.release()
+            # 중단(stop)된 배치의 요청은 결과를 받지 못하므로 취소
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.cancel()
+
+    async def _infer(self, model_name: str, batch: list[_PendingRequest]) -> None:
+        try:
+            results = await self._executor.run(
+                transcribe_batch,
+                model_name,
+                [pending.mel for pending in batch],
+                [pending.language for pending in batch],
+                [pending.task for pending in batch],
+                # 배치에 포함된 요청이 도중에 타임아웃되어도 추론이 끝날 때까지 슬롯을 점유
+                slots=[pending.slot for pending in batch if pending.slot is not None]
+            )
+        except Exception as e:
+            logger.exception(f"Whisper 배치 추론 실패 (model={model_name}, batch_size={len(batch)})")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        logger.debug(f"Whisper 배치 추론 완료 (model={model_name}, batch_size={len(batch)})")
+        for pending, result in zip(batch, results):
+            if not pending.future.done():
+                pending.future.set_result(result)
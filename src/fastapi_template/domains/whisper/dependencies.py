@@ -0,0 +1,75 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from fastapi_template.core.cache.memory import TTLCache
+from fastapi_template.core.cache.redis_client import get_redis_client
+from fastapi_template.core.cache.tiered import TieredCache
+from fastapi_template.core.config.settings import get_settings
+from fastapi_template.domains.whisper.batcher import WhisperBatchScheduler
+from fastapi_template.domains.whisper.executor import WhisperExecutor
+from fastapi_template.domains.whisper.inference import configure_registry
+from fastapi_template.domains.whisper.metrics import register_queue_samplers
+from fastapi_template.domains.whisper.registry import ModelRegistryConfig
+from fastapi_template.domains.whisper.service import WhisperService
+from fastapi_template.domains.whisper.splitter import SplitOptions
+
+settings = get_settings()
+
+registry_config = ModelRegistryConfig(
+    models=tuple(settings.whisper_models),
+    default_model=settings.whisper_default_model,
+    device=settings.whisper_device,
+    dtype=settings.whisper_dtype,
+    preload=settings.whisper_preload,
+    quantize_int8=settings.whisper_quantize_int8,
+    intra_op_threads=settings.whisper_intra_op_threads,
+    inter_op_threads=settings.whisper_inter_op_threads
+)
+# API 프로세스의 레지스트리 (모델 이름 검증 및 thread executor 에서 사용, 모델은 요청 시점에 로드)
+configure_registry(registry_config)
+
+whisper_executor = WhisperExecutor(
+    kind=settings.whisper_executor,
+    max_workers=settings.whisper_max_workers,
+    max_queue_size=settings.whisper_max_queue_size,
+    timeout_seconds=settings.whisper_request_timeout_seconds,
+    retry_after_seconds=settings.whisper_retry_after_seconds,
+    registry_config=registry_config
+)
+
+batch_scheduler = WhisperBatchScheduler(
+    whisper_executor,
+    max_batch_size=settings.whisper_batch_max_size,
+    max_wait_ms=settings.whisper_batch_max_wait_ms
+)
+register_queue_samplers(whisper_executor, batch_scheduler)
+
+transcription_cache = TieredCache(
+    namespace="whisper",
+    memory=TTLCache(
+        max_size=settings.whisper_cache_max_entries,
+        ttl_seconds=settings.whisper_cache_ttl_seconds
+    ),
+    redis=get_redis_client() if settings.whisper_cache_redis_enabled else None,
+    ttl_seconds=settings.whisper_cache_ttl_seconds
+) if settings.whisper_cache_enabled else None
+
+split_options = SplitOptions(
+    chunk_seconds=settings.whisper_split_chunk_seconds,
+    threshold_db=settings.whisper_split_silence_threshold_db,
+    min_silence_ms=settings.whisper_split_min_silence_ms
+)
+
+
+def get_whisper_service() -> WhisperService:
+    return WhisperService(
+        whisper_executor,
+        batch_scheduler,
+        transcription_cache,
+        split_options,
+        max_language_detect_files=settings.whisper_language_detect_max_files
+    )
+
+
+WhisperServiceDep = Annotated[WhisperService, Depends(get_whisper_service)]
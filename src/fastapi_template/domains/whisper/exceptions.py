@@ -0,0 +1,14 @@
+class WhisperOverloadedError(Exception):
+    """처리 대기열이 가득 차 새 요청을 받을 수 없음 (503)"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Whisper 처리 대기열이 가득 찼습니다.")
+        self.retry_after = retry_after
+
+
+class WhisperTimeoutError(Exception):
+    """요청 처리 시간이 제한을 초과함 (504)"""
+
+    def __init__(self, timeout: float):
+        super().__init__(f"Whisper 처리 시간이 {timeout}초를 초과했습니다.")
+        self.timeout = timeout
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Literal, Sequence, TypeVar
+
+from fastapi_template.domains.whisper.exceptions import WhisperOverloadedError, WhisperTimeoutError
+from fastapi_template.domains.whisper.inference import init_worker, preload_model, unload_idle_models
+from fastapi_template.domains.whisper.registry import ModelRegistryConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class ExecutorSlot:
+    """
+    WhisperExecutor 의 처리 슬롯 하나
+
+    슬롯을 확보한 쪽이 release 하고, 슬롯에 묶여 워커 풀에 제출된 작업이 모두 끝나야 반환됩니다.
+    요청이 타임아웃/취소되어도 이미 실행 중인 작업은 멈출 수 없으므로, 그동안에는 슬롯을 계속 점유합니다.
+    """
+
+    def __init__(self, executor: "WhisperExecutor"):
+        self._executor = executor
+        self._holders = 1  # 슬롯을 확보한 쪽
+        self._token = None
+
+    def hold(self, future: Future) -> None:
+        """워커 풀 작업이 끝날 때까지 슬롯을 반환하지 않습니다."""
+        self._holders += 1
+        loop = asyncio.get_running_loop()
+
+        def on_done(_: Future) -> None:
+            # 완료 콜백은 워커 스레드에서 호출될 수 있으므로 이벤트 루프에서 반환
+            try:
+                loop.call_soon_threadsafe(self.release)
+            except RuntimeError:  # 이벤트 루프가 이미 종료됨
+                pass
+
+        future.add_done_callback(on_done)
+
+    def release(self) -> None:
+        self._holders -= 1
+        if self._holders == 0:
+            self._executor._in_flight -= 1
+
+    def __enter__(self) -> "ExecutorSlot":
+        # 같은 태스크에서 호출되는 run() 이 이 슬롯에 작업을 묶도록 설정
+        self._token = _current_slot.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current_slot.reset(self._token)
+        self.release()
+
+
+_current_slot: ContextVar[ExecutorSlot | None] = ContextVar("whisper_executor_slot", default=None)
+
+
+def current_slot() -> ExecutorSlot | None:
+    """현재 태스크에서 확보한 (reserve() 안이면) 처리 슬롯"""
+    return _current_slot.get()
+
+
+class WhisperExecutor:
+    """
+    Whisper 오디오 전처리/추론 전용 워커 풀
+
+    - thread: 프로세스 내 모델 레지스트리를 스레드 풀에서 공유 (추론은 모델별 lock 으로 직렬화)
+    - process: 워커 프로세스마다 registry_config 로 설정된 모델 레지스트리를 가짐
+
+    동시에 처리 중인 요청 수를 max_workers + max_queue_size 로 제한하고,
+    초과 요청은 WhisperOverloadedError 로 즉시 거절합니다.
+    """
+
+    def __init__(
+            self,
+            kind: ExecutorKind = "thread",
+            max_workers: int = 1,
+            max_queue_size: int = 8,
+            timeout_seconds: float = 300,
+            retry_after_seconds: int = 10,
+            registry_config: ModelRegistryConfig = ModelRegistryConfig()
+    ):
+        self.kind = kind
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queue_size
+        self.timeout_seconds = timeout_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.registry_config = registry_config
+        self._in_flight = 0
+        self._executor: Executor | None = None
+        self._last_used = time.monotonic()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def is_full(self) -> bool:
+        return self._in_flight >= self.capacity
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_worker,
+                    initargs=(self.registry_config,)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="whisper"
+                )
+            logger.info(f"Whisper executor 시작 (kind={self.kind}, max_workers={self.max_workers})")
+        return self._executor
+
+    def acquire(self) -> ExecutorSlot:
+        """처리 슬롯 하나를 확보합니다. 슬롯이 없으면 WhisperOverloadedError 를 발생시킵니다."""
+        if self.is_full:
+            raise WhisperOverloadedError(self.retry_after_seconds)
+        self._in_flight += 1
+        return ExecutorSlot(self)
+
+    @asynccontextmanager
+    async def reserve(self) -> AsyncIterator[None]:
+        """
+        요청 하나에 대한 처리 슬롯을 확보합니다.
+
+        슬롯이 없으면 WhisperOverloadedError, 처리 시간이 제한을 넘으면 WhisperTimeoutError 를 발생시킵니다.
+        """
+        with self.acquire():
+            try:
+                async with asyncio.timeout(self.timeout_seconds):
+                    yield
+            except TimeoutError as e:
+                raise WhisperTimeoutError(self.timeout_seconds) from e
+
+    async def run(self, fn: Callable[..., T], *args: Any, slots: Sequence[ExecutorSlot] | None = None) -> T:
+        """
+        워커 풀에서 fn 을 실행합니다.
+
+        작업은 slots (생략 시 현재 reserve() 로 확보한 슬롯) 에 묶여, 끝날 때까지 슬롯이 반환되지 않습니다.
+        호출 측이 취소(타임아웃 포함)되면 아직 시작되지 않은 작업은 대기열에서 제거됩니다.
+        """
+        if slots is None:
+            current = _current_slot.get()
+            slots = (current,) if current is not None else ()
+
+        self._last_used = time.monotonic()
+        future = self._get_executor().submit(fn, *args)
+        for slot in slots:
+            slot.hold(future)
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            self._last_used = time.monotonic()
+
+    async def preload(self) -> None:
+        """기본 모델을 미리 로드합니다. process 모드에서는 워커 프로세스도 모두 미리 띄웁니다."""
+        workers = self.max_workers if self.kind == "process" else 1
+        await asyncio.gather(*(self.run(preload_model) for _ in range(workers)))
+
+    async def unload_idle(self, idle_seconds: float) -> None:
+        """
+        idle_seconds 이상 사용되지 않은 모델을 메모리에서 해제합니다.
+
+        - thread: 레지스트리에서 유휴 모델만 해제
+        - process: 처리 중인 요청이 없으면 워커 프로세스를 종료 (다음 요청 시 다시 시작)
+        """
+        if self._executor is None:
+            return
+
+        if self.kind == "thread":
+            await asyncio.to_thread(unload_idle_models, idle_seconds)
+        elif self._in_flight == 0 and time.monotonic() - self._last_used >= idle_seconds:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True)
+            logger.info(f"유휴 Whisper 워커 프로세스 종료 ({idle_seconds:.0f}s 미사용)")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,230 @@
+"""
+워커(스레드/프로세스)에서 실행되는 Whisper 추론 함수 모음
+
+torch/whisper 는 무거운 모듈이므로 이 모듈을 import 하는 시점이 아니라 실제 추론 시점에 import 합니다.
+모델은 프로세스마다 하나의 WhisperModelRegistry 로 관리됩니다.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fastapi_template.domains.whisper.audio import WINDOW_SAMPLES
+from fastapi_template.domains.whisper.registry import ModelRegistryConfig, WhisperModelRegistry
+
+if TYPE_CHECKING:
+    import torch
+
+_registry = WhisperModelRegistry()
+
+
+@dataclass(frozen=True)
+class TranscriptionResult:
+    detected_language: str
+    language_probs: dict[str, float]
+    text: str
+
+
+def configure_registry(config: ModelRegistryConfig) -> None:
+    """현재 프로세스의 모델 레지스트리 설정을 교체합니다."""
+    global _registry
+    _registry = WhisperModelRegistry(config)
+
+
+def get_registry() -> WhisperModelRegistry:
+    return _registry
+
+
+def init_worker(config: ModelRegistryConfig) -> None:
+    """워커 프로세스 initializer: 레지스트리를 설정하고, preload 설정 시 기본 모델을 미리 로드"""
+    configure_registry(config)
+    if config.preload:
+        _registry.get()
+
+
+def preload_model(model_name: str | None = None) -> None:
+    _registry.get(model_name)
+
+
+def unload_idle_models(idle_seconds: float) -> list[str]:
+    return _registry.unload_idle(idle_seconds)
+
+
+def prepare_mel(model_name: str | None, audio: np.ndarray) -> "torch.Tensor":
+    """16kHz waveform 을 30초 길이로 맞춘 log-Mel spectrogram 으로 변환합니다."""
+    import whisper
+
+    audio = whisper.pad_or_trim(audio)
+    return whisper.log_mel_spectrogram(audio, n_mels=_registry.get(model_name).model.dims.n_mels)
+
+
+def detect_audio_language(model_name: str | None, audio: np.ndarray) -> str:
+    """오디오 앞 30초로 언어를 감지합니다."""
+    loaded = _registry.get(model_name)
+    mel = prepare_mel(model_name, audio[:WINDOW_SAMPLES]).to(loaded.model.device)
+    with loaded.lock:
+        _, probs = loaded.model.detect_language(mel)
+    return max(probs, key=probs.get)
+
+
+def detect_languages_batch(
+        model_name: str | None,
+        audios: list[np.ndarray],
+        top_k: int
+) -> list[list[tuple[str, float]]]:
+    """
+    여러 오디오의 언어를 한 번의 배치 추론으로 감지하고, 클립별 상위 top_k 언어와 확률을 반환합니다.
+
+    - mel spectrogram 을 배치 단위로 한 번에 계산 (클립별 정규화는 whisper.log_mel_spectrogram 과 동일)
+    - 인코더 1회 + SOT 토큰 1개에 대한 디코더 1 step 만 실행하고, 텍스트는 디코딩하지 않음
+    - 언어 토큰 logits 만 골라 softmax/topk 를 텐서 연산으로 처리 (언어별 dict 를 만들지 않음)
+    """
+    import torch
+    from whisper.audio import HOP_LENGTH, N_FFT, N_SAMPLES, mel_filters
+    from whisper.tokenizer import get_tokenizer
+
+    loaded = _registry.get(model_name)
+    model = loaded.model
+    device = model.device
+
+    waveforms = np.zeros((len(audios), N_SAMPLES), dtype=np.float32)
+    for index, audio in enumerate(audios):
+        clip = audio[:N_SAMPLES]
+        waveforms[index, :len(clip)] = clip
+
+    waveforms = torch.from_numpy(waveforms).to(device)
+    window = torch.hann_window(N_FFT, device=device)
+    stft = torch.stft(waveforms, N_FFT, HOP_LENGTH, window=window, return_complex=True)
+    magnitudes = stft[..., :-1].abs() ** 2
+    mel = mel_filters(device, model.dims.n_mels) @ magnitudes
+    log_spec = torch.clamp(mel, min=1e-10).log10()
+    log_spec = torch.maximum(log_spec, log_spec.amax(dim=(-2, -1), keepdim=True) - 8.0)
+    mel = (log_spec + 4.0) / 4.0
+
+    tokenizer = get_tokenizer(model.is_multilingual, num_languages=model.num_languages)
+    language_tokens = torch.tensor(tokenizer.all_language_tokens, device=device)
+    sot = torch.full((len(audios), 1), tokenizer.sot, device=device)
+
+    # 다른 스레드의 디코딩이 설치한 kv-cache hook 에 이 forward 결과가 섞이지 않도록 모델 lock 안에서 실행
+    with loaded.lock, torch.no_grad():
+        audio_features = model.embed_audio(mel.half() if loaded.fp16 else mel)
+        logits = model.logits(sot, audio_features)[:, 0]
+
+    probs = logits[:, language_tokens].float().softmax(dim=-1)
+    top_probs, top_indices = probs.topk(min(top_k, probs.shape[-1]), dim=-1)
+
+    codes = tokenizer.all_language_codes
+    return [
+        [(codes[index], prob) for index, prob in zip(indices, values)]
+        for indices, values in zip(top_indices.tolist(), top_probs.tolist())
+    ]
+
+
+def transcribe_batch(
+        model_name: str | None,
+        mels: list["torch.Tensor"],
+        languages: list[str | None],
+        tasks: list[str]
+) -> list[TranscriptionResult]:
+    """
+    30초 단위 mel spectrogram 여러 개를 하나의 배치로 묶어 언어 감지와 디코딩을 수행합니다.
+
+    - 언어 감지는 배치 전체에 대해 한 번만 실행
+    - 디코딩은 (language, task) 조합별로 묶어서 실행 (DecodingOptions 가 배치 단위 옵션이므로)
+    """
+    import torch
+    import whisper
+
+    loaded = _registry.get(model_name)
+    model = loaded.model
+    mel = torch.stack(mels).to(model.device)
+
+    with loaded.lock:
+        # 언어 감지 (배치)
+        _, probs_list = model.detect_language(mel)
+        detected = [max(probs, key=probs.get) for probs in probs_list]
+
+        groups: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for index, (language, task) in enumerate(zip(languages, tasks)):
+            groups[(language or detected[index], task)].append(index)
+
+        texts: list[str] = [""] * len(mels)
+        for (language, task), indices in groups.items():
+            options = whisper.DecodingOptions(language=language, task=task, fp16=loaded.fp16)
+            decoded = whisper.decode(model, mel[indices], options)
+            for index, result in zip(indices, decoded):
+                texts[index] = result.text
+
+    return [
+        TranscriptionResult(
+            detected_language=detected[index],
+            language_probs=probs_list[index],
+            text=texts[index]
+        )
+        for index in range(len(mels))
+    ]
+
+
+def transcribe_audio(model_name: str | None, audio: np.ndarray, language: str | None, task: str) -> dict:
+    """16kHz waveform 전체를 세그먼트 단위로 변환합니다."""
+    loaded = _registry.get(model_name)
+    with loaded.lock:
+        result = loaded.model.transcribe(
+            audio=audio,
+            language=language,
+            task=task,
+            verbose=False,
+            fp16=loaded.fp16  # GPU 사용 시 float 16 연산 활성화 ( 속도 향상)
+        )
+
+    return {
+        "language": result["language"],
+        "text": result["text"],
+        "segments": [
+            {
+                "start": segment["start"],
+                "end": segment["end"],
+                "text": segment["text"]
+            }
+            for segment in result["segments"]
+        ]
+    }
+
+
+def transcribe_window(
+        model_name: str | None,
+        audio: np.ndarray,
+        offset: float,
+        language: str | None,
+        task: str,
+        initial_prompt: str | None = None
+) -> dict:
+    """
+    오디오의 한 구간(스트리밍 30초 구간, 병렬 변환 청크)을 변환하고,
+    세그먼트 시간을 전체 오디오 기준(offset 초)으로 보정합니다.
+    """
+    loaded = _registry.get(model_name)
+    with loaded.lock:
+        result = loaded.model.transcribe(
+            audio=audio,
+            language=language,
+            task=task,
+            initial_prompt=initial_prompt,
+            condition_on_previous_text=False,
+            verbose=None,
+            fp16=loaded.fp16
+        )
+
+    return {
+        "language": result["language"],
+        "text": result["text"],
+        "segments": [
+            {
+                "start": segment["start"] + offset,
+                "end": segment["end"] + offset,
+                "text": segment["text"]
+            }
+            for segment in result["segments"]
+        ]
+    }
@@ -0,0 +1,46 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from fastapi_template.core.cache.redis_client import get_redis_client
+from fastapi_template.core.config.database import AsyncSessionLocal, DbDep
+from fastapi_template.core.config.settings import get_settings
+from fastapi_template.domains.whisper.dependencies import WhisperServiceDep, get_whisper_service
+from fastapi_template.domains.whisper.jobs.queue import TranscriptionJobQueue
+from fastapi_template.domains.whisper.jobs.repository import TranscriptionJobRepository
+from fastapi_template.domains.whisper.jobs.service import TranscriptionJobService
+from fastapi_template.domains.whisper.jobs.worker import TranscriptionJobWorker
+
+settings = get_settings()
+
+transcription_job_queue = TranscriptionJobQueue(
+    redis=get_redis_client() if settings.whisper_job_redis_enabled else None,
+    poll_interval=settings.whisper_job_poll_interval_seconds
+)
+
+transcription_job_worker = TranscriptionJobWorker(
+    AsyncSessionLocal,
+    transcription_job_queue,
+    get_whisper_service(),
+    concurrency=settings.whisper_job_worker_concurrency,
+    lease_seconds=settings.whisper_job_lease_seconds,
+    max_attempts=settings.whisper_job_max_attempts,
+    retention_seconds=settings.whisper_job_retention_seconds,
+    cleanup_interval_seconds=settings.whisper_job_cleanup_interval_seconds
+)
+
+
+def get_transcription_job_repository(session: DbDep) -> TranscriptionJobRepository:
+    return TranscriptionJobRepository(session)
+
+
+def get_transcription_job_service(
+        repository: Annotated[TranscriptionJobRepository, Depends(get_transcription_job_repository)],
+        whisper_service: WhisperServiceDep
+) -> TranscriptionJobService:
+    return TranscriptionJobService(
+        repository, transcription_job_queue, whisper_service, settings.whisper_job_storage_dir
+    )
+
+
+TranscriptionJobServiceDep = Annotated[TranscriptionJobService, Depends(get_transcription_job_service)]
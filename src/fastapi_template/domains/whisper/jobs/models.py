@@ -0,0 +1,32 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column, Index
+from sqlmodel import SQLModel, Field
+
+from fastapi_template.core.constants.transcription_job_status import TranscriptionJobStatus
+
+
+class TranscriptionJob(SQLModel, table=True):
+    __tablename__ = "transcription_jobs"
+    __table_args__ = (
+        # 워커가 가장 오래된 대기 작업을 찾을 때 사용
+        Index("ix_transcription_jobs_status_created_at", "status", "created_at"),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    status: TranscriptionJobStatus = Field(default=TranscriptionJobStatus.QUEUED)
+    filename: str = Field(max_length=255)
+    file_path: str = Field(max_length=1024)
+    model: str = Field(max_length=50)
+    language: str | None = Field(default=None, max_length=10)
+    task: str = Field(default="transcribe", max_length=20)
+    parallel: bool = Field(default=False)
+    attempts: int = Field(default=0)
+    worker_id: str | None = Field(default=None, max_length=100)
+    error: str | None = Field(default=None, max_length=1000)
+    result: dict | None = Field(default=None, sa_column=Column(JSON))
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    started_at: datetime | None = Field(default=None)
+    heartbeat_at: datetime | None = Field(default=None)
+    finished_at: datetime | None = Field(default=None, index=True)
@@ -0,0 +1,48 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionJobQueue:
+    """
+    워커에게 새 작업을 알리는 큐
+
+    작업의 원본은 항상 DB(transcription_jobs)이며, 이 큐는 대기 시간을 줄이기 위한 알림 용도입니다.
+
+    - redis 가 있으면 작업 id 를 Redis 리스트로 전달하고 워커는 BLPOP 으로 즉시 깨어남
+    - redis 가 없거나 장애 시에는 poll_interval 마다 DB 를 조회 (알림이 유실되어도 작업은 처리됨)
+    """
+
+    def __init__(self, redis: Redis | None = None, poll_interval: float = 2.0, key: str = "whisper:jobs"):
+        self.redis = redis
+        self.poll_interval = poll_interval
+        self.key = key
+
+    async def push(self, job_id: UUID) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.rpush(self.key, str(job_id))
+        except RedisError as e:
+            logger.warning(f"작업 알림 전송 실패, DB polling 으로 처리됩니다 ({job_id}): {e}")
+
+    async def wait(self) -> UUID | None:
+        """
+        다음 작업 id 를 기다립니다.
+
+        poll_interval 동안 알림이 없으면 None 을 반환하며, 이 경우 워커는 DB 에서 가장 오래된 작업을 가져갑니다.
+        """
+        if self.redis is not None:
+            try:
+                item = await self.redis.blpop([self.key], timeout=self.poll_interval)
+                return UUID(item[1]) if item else None
+            except RedisError as e:
+                logger.warning(f"작업 알림 수신 실패, DB polling 으로 전환합니다: {e}")
+
+        await asyncio.sleep(self.poll_interval)
+        return None
@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import select, update, delete, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_template.core.constants.transcription_job_status import TranscriptionJobStatus
+from fastapi_template.domains.whisper.jobs.models import TranscriptionJob
+
+ERROR_MAX_LENGTH = 1000
+
+
+class TranscriptionJobRepository:
+    """
+    변환 작업 저장소
+
+    작업 테이블 자체가 영속 큐 역할을 합니다. 작업 할당(claim)은 status 조건부 UPDATE 로 처리하므로
+    SKIP LOCKED 를 지원하지 않는 DB 에서도 여러 워커가 같은 작업을 가져가지 않습니다.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, job: TranscriptionJob) -> TranscriptionJob:
+        self.session.add(job)
+        await self.session.commit()
+        return job
+
+    async def get_by_id(self, job_id: UUID) -> TranscriptionJob | None:
+        statement = select(TranscriptionJob).where(TranscriptionJob.id == job_id)
+        result = await self.session.execute(statement)
+        return result.scalar_one_or_none()
+
+    async def claim(self, worker_id: str, job_id: UUID | None = None) -> TranscriptionJob | None:
+        """
+        대기 중인 작업 하나를 worker_id 에 할당합니다.
+
+        job_id 가 없으면 가장 오래된 대기 작업을 고르고, 다른 워커와 경합에서 지면 다음 작업을 시도합니다.
+        """
+        while True:
+            candidate_id = job_id
+            if candidate_id is None:
+                statement = (
+                    select(TranscriptionJob.id)
+                    .where(TranscriptionJob.status == TranscriptionJobStatus.QUEUED)
+                    .order_by(TranscriptionJob.created_at)
+                    .limit(1)
+                )
+                candidate_id = (await self.session.execute(statement)).scalar_one_or_none()
+                if candidate_id is None:
+                    return None
+
+            now = datetime.utcnow()
+            statement = (
+                update(TranscriptionJob)
+                .where(
+                    TranscriptionJob.id == candidate_id,
+                    TranscriptionJob.status == TranscriptionJobStatus.QUEUED
+                )
+                .values(
+                    status=TranscriptionJobStatus.RUNNING,
+                    worker_id=worker_id,
+                    attempts=TranscriptionJob.attempts + 1,
+                    started_at=now,
+                    heartbeat_at=now
+                )
+            )
+            result = await self.session.execute(statement)
+            await self.session.commit()
+
+            if result.rowcount == 1:
+                return await self.get_by_id(candidate_id)
+            if job_id is not None:
+                return None
+
+    async def heartbeat(self, job_id: UUID, worker_id: str) -> None:
+        statement = (
+            update(TranscriptionJob)
+            .where(TranscriptionJob.id == job_id, TranscriptionJob.worker_id == worker_id)
+            .values(heartbeat_at=datetime.utcnow())
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
+
+    async def complete(self, job_id: UUID, worker_id: str, result: dict) -> None:
+        await self._finish(job_id, worker_id, TranscriptionJobStatus.SUCCEEDED, result=result, error=None)
+
+    async def fail(self, job_id: UUID, worker_id: str, error: str) -> None:
+        await self._finish(job_id, worker_id, TranscriptionJobStatus.FAILED, result=None, error=error)
+
+    async def _finish(
+            self,
+            job_id: UUID,
+            worker_id: str,
+            status: TranscriptionJobStatus,
+            result: dict | None,
+            error: str | None
+    ) -> None:
+        # 임대가 만료되어 다른 워커에 재할당된 작업은 갱신하지 않음
+        statement = (
+            update(TranscriptionJob)
+            .where(
+                TranscriptionJob.id == job_id,
+                TranscriptionJob.worker_id == worker_id,
+                TranscriptionJob.status == TranscriptionJobStatus.RUNNING
+            )
+            .values(
+                status=status,
+                result=result,
+                error=error[:ERROR_MAX_LENGTH] if error else None,
+                finished_at=datetime.utcnow()
+            )
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
+
+    async def requeue_expired(self, lease_seconds: float, max_attempts: int) -> list[UUID]:
+        """
+        heartbeat 가 lease_seconds 이상 끊긴 작업(워커 종료 등)을 다시 대기 상태로 돌립니다.
+        시도 횟수가 max_attempts 에 도달한 작업은 실패 처리합니다. 재대기된 작업 id 를 반환합니다.
+        """
+        expired_before = datetime.utcnow() - timedelta(seconds=lease_seconds)
+        expired = (
+            TranscriptionJob.status == TranscriptionJobStatus.RUNNING,
+            TranscriptionJob.heartbeat_at < expired_before
+        )
+
+        await self.session.execute(
+            update(TranscriptionJob)
+            .where(*expired, TranscriptionJob.attempts >= max_attempts)
+            .values(
+                status=TranscriptionJobStatus.FAILED,
+                error="작업 처리 중 워커 응답이 끊겼습니다 (최대 재시도 횟수 초과)",
+                finished_at=datetime.utcnow()
+            )
+        )
+
+        requeue_ids = (await self.session.execute(
+            select(TranscriptionJob.id).where(*expired, TranscriptionJob.attempts < max_attempts)
+        )).scalars().all()
+        if requeue_ids:
+            await self.session.execute(
+                update(TranscriptionJob)
+                .where(TranscriptionJob.id.in_(requeue_ids), *expired)
+                .values(status=TranscriptionJobStatus.QUEUED, worker_id=None)
+            )
+
+        await self.session.commit()
+        return list(requeue_ids)
+
+    async def delete_finished_before(self, finished_before: datetime) -> list[str]:
+        """finished_before 이전에 끝난 작업을 삭제하고, 정리할 업로드 파일 경로를 반환합니다."""
+        finished = (
+            or_(
+                TranscriptionJob.status == TranscriptionJobStatus.SUCCEEDED,
+                TranscriptionJob.status == TranscriptionJobStatus.FAILED
+            ),
+            TranscriptionJob.finished_at < finished_before
+        )
+
+        file_paths = (await self.session.execute(
+            select(TranscriptionJob.file_path).where(*finished)
+        )).scalars().all()
+        if file_paths:
+            await self.session.execute(delete(TranscriptionJob).where(*finished))
+            await self.session.commit()
+
+        return list(file_paths)
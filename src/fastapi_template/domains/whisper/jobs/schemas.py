@@ -0,0 +1,26 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from fastapi_template.core.constants.transcription_job_status import TranscriptionJobStatus
+
+
+class TranscriptionJobResponse(BaseModel):
+    id: UUID
+    status: TranscriptionJobStatus
+    filename: str
+    model: str
+    language: str | None
+    task: str
+    parallel: bool
+    attempts: int
+    error: str | None
+    result: dict | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    model_config = {
+        "from_attributes": True
+    }
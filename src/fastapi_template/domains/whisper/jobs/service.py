@@ -0,0 +1,84 @@
+import asyncio
+import os
+import shutil
+from typing import BinaryIO
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, UploadFile, status
+
+from fastapi_template.domains.whisper.audio import CHUNK_SIZE
+from fastapi_template.domains.whisper.jobs.models import TranscriptionJob
+from fastapi_template.domains.whisper.jobs.queue import TranscriptionJobQueue
+from fastapi_template.domains.whisper.jobs.repository import TranscriptionJobRepository
+from fastapi_template.domains.whisper.jobs.schemas import TranscriptionJobResponse
+from fastapi_template.domains.whisper.service import WhisperService
+
+
+class TranscriptionJobService:
+    def __init__(
+            self,
+            repository: TranscriptionJobRepository,
+            queue: TranscriptionJobQueue,
+            whisper_service: WhisperService,
+            storage_dir: str
+    ):
+        self.repository = repository
+        self.queue = queue
+        self.whisper_service = whisper_service
+        self.storage_dir = storage_dir
+
+    async def submit(
+            self,
+            file: UploadFile,
+            language: str | None,
+            task: str,
+            parallel: bool = False,
+            model: str | None = None
+    ) -> TranscriptionJobResponse:
+        model_name = self.whisper_service.validate_request(file, model)
+
+        # 워커가 다른 프로세스/노드에서 실행될 수 있으므로 업로드 파일은 공유 저장소에 보관
+        job_id = uuid4()
+        file_extension = os.path.splitext(file.filename)[1].lower()
+        file_path = os.path.join(self.storage_dir, f"{job_id}{file_extension}")
+
+        await asyncio.to_thread(self._store_upload, file.file, file_path)
+
+        try:
+            job = await self.repository.create(TranscriptionJob(
+                id=job_id,
+                filename=file.filename,
+                file_path=file_path,
+                model=model_name,
+                language=language,
+                task=task,
+                parallel=parallel
+            ))
+        except Exception:
+            os.remove(file_path)
+            raise
+
+        await self.queue.push(job.id)
+        return TranscriptionJobResponse.model_validate(job)
+
+    @staticmethod
+    def _store_upload(source: BinaryIO, file_path: str) -> None:
+        """업로드 파일을 저장소에 복사합니다. (디스크 I/O 이므로 스레드에서 실행)"""
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        source.seek(0)
+        try:
+            with open(file_path, "wb") as stored_file:
+                shutil.copyfileobj(source, stored_file, CHUNK_SIZE)
+        except BaseException:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+
+    async def get_job(self, job_id: UUID) -> TranscriptionJobResponse:
+        job = await self.repository.get_by_id(job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Transcription job not found"
+            )
+        return TranscriptionJobResponse.model_validate(job)
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from fastapi_template.domains.whisper.audio import SAMPLE_RATE, decode_file
+from fastapi_template.domains.whisper.exceptions import WhisperOverloadedError
+from fastapi_template.domains.whisper.executor import ExecutorSlot
+from fastapi_template.domains.whisper.jobs.models import TranscriptionJob
+from fastapi_template.domains.whisper.jobs.queue import TranscriptionJobQueue
+from fastapi_template.domains.whisper.jobs.repository import TranscriptionJobRepository
+from fastapi_template.domains.whisper.metrics import observe_transcription
+from fastapi_template.domains.whisper.service import WhisperService
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionJobWorker:
+    """
+    transcription_jobs 테이블의 대기 작업을 가져와 처리하는 워커
+
+    - concurrency 개의 소비 태스크가 작업을 하나씩 할당(claim)받아 처리
+    - 처리 중에는 lease_seconds / 3 마다 heartbeat 를 갱신하고,
+      heartbeat 가 끊긴 작업(워커 종료 등)은 정리 루프가 다시 대기 상태로 돌림 (최대 max_attempts 회)
+    - 정리 루프는 retention_seconds 가 지난 완료/실패 작업과 업로드 파일을 삭제
+
+    API 프로세스의 lifespan 에서 실행하거나, 추론 전용 노드에서 별도 프로세스로 실행할 수 있습니다.
+    (python -m fastapi_template.domains.whisper.jobs.worker)
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            queue: TranscriptionJobQueue,
+            whisper_service: WhisperService,
+            concurrency: int = 1,
+            lease_seconds: float = 600,
+            max_attempts: int = 3,
+            retention_seconds: float = 86400,
+            cleanup_interval_seconds: float = 300
+    ):
+        self.session_factory = session_factory
+        self.queue = queue
+        self.whisper_service = whisper_service
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._consume(), name=f"whisper-job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._maintain(), name="whisper-job-maintenance"))
+        logger.info(f"Whisper 작업 워커 시작 (worker_id={self.worker_id}, concurrency={self.concurrency})")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _consume(self) -> None:
+        job_id: UUID | None = None
+        while True:
+            try:
+                with await self._acquire_slot():
+                    async with self.session_factory() as session:
+                        job = await TranscriptionJobRepository(session).claim(self.worker_id, job_id)
+                    if job is not None:
+                        await self._process(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Whisper 작업 처리 루프 오류")
+                job = None
+
+            # 처리한 작업이 있으면 남은 대기 작업을 바로 이어서 확인, 없으면 알림(또는 polling 주기)을 기다림
+            job_id = None if job is not None else await self.queue.wait()
+
+    async def _acquire_slot(self) -> ExecutorSlot:
+        """HTTP 요청과 같은 처리 슬롯을 공유하며, 슬롯이 없으면 빌 때까지 기다립니다."""
+        while True:
+            try:
+                return self.whisper_service.executor.acquire()
+            except WhisperOverloadedError:
+                await asyncio.sleep(self.queue.poll_interval)
+
+    async def _process(self, job: TranscriptionJob) -> None:
+        logger.info(f"Whisper 작업 시작 (job_id={job.id}, attempt={job.attempts})")
+        heartbeat = asyncio.create_task(self._heartbeat(job.id))
+
+        try:
+            started = time.perf_counter()
+            audio = await decode_file(job.file_path)
+            result = await self.whisper_service.transcribe_decoded(
+                job.model, audio, job.language, job.task, job.parallel
+            )
+            observe_transcription("job", job.model, len(audio) / SAMPLE_RATE, time.perf_counter() - started)
+        except Exception as e:
+            logger.exception(f"Whisper 작업 실패 (job_id={job.id})")
+            async with self.session_factory() as session:
+                await TranscriptionJobRepository(session).fail(
+                    job.id, self.worker_id, f"오디오 변환 중 오류가 발생했습니다: {str(e)}"
+                )
+        else:
+            async with self.session_factory() as session:
+                await TranscriptionJobRepository(session).complete(job.id, self.worker_id, result)
+            logger.info(f"Whisper 작업 완료 (job_id={job.id})")
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        # 결과는 DB 에 남으므로 업로드 파일은 바로 정리
+        self._remove_file(job.file_path)
+
+    async def _heartbeat(self, job_id: UUID) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with self.session_factory() as session:
+                    await TranscriptionJobRepository(session).heartbeat(job_id, self.worker_id)
+            except Exception:
+                logger.exception(f"Whisper 작업 heartbeat 갱신 실패 (job_id={job_id})")
+
+    async def _maintain(self) -> None:
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    repository = TranscriptionJobRepository(session)
+                    requeued = await repository.requeue_expired(self.lease_seconds, self.max_attempts)
+                    file_paths = await repository.delete_finished_before(
+                        datetime.utcnow() - timedelta(seconds=self.retention_seconds)
+                    )
+
+                for job_id in requeued:
+                    await self.queue.push(job_id)
+                for file_path in file_paths:
+                    self._remove_file(file_path)
+
+                if requeued or file_paths:
+                    logger.info(f"Whisper 작업 정리 (재대기 {len(requeued)}건, 삭제 {len(file_paths)}건)")
+            except Exception:
+                logger.exception("Whisper 작업 정리 실패")
+
+            await asyncio.sleep(self.cleanup_interval_seconds)
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+
+async def _run_standalone() -> None:
+    from fastapi_template.core.cache.redis_client import close_redis_client
+    from fastapi_template.core.config.database import cleanup_database, setup_database
+    from fastapi_template.domains.whisper.dependencies import batch_scheduler, whisper_executor
+    from fastapi_template.domains.whisper.jobs.dependencies import transcription_job_worker
+
+    await setup_database()
+    transcription_job_worker.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await transcription_job_worker.stop()
+        await batch_scheduler.stop()
+        whisper_executor.shutdown()
+        await close_redis_client()
+        await cleanup_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(_run_standalone())
@@ -0,0 +1,61 @@
+"""
+Whisper 처리량/대기열 메트릭
+
+- 대기열 상태 (처리 중인 요청, 배치 대기 요청): 샘플러가 gauge 에 기록
+- 처리한 오디오 길이, 처리 시간, real-time factor (처리 시간 / 오디오 길이, 1 미만이면 실시간보다 빠름):
+  캐시 miss 로 실제 변환한 요청만 기록
+"""
+from prometheus_client import Counter, Gauge, Histogram
+
+from fastapi_template.core.metrics.registry import register_sampler
+from fastapi_template.domains.whisper.batcher import WhisperBatchScheduler
+from fastapi_template.domains.whisper.executor import WhisperExecutor
+
+WHISPER_IN_FLIGHT = Gauge(
+    "whisper_requests_in_flight",
+    "처리 슬롯을 점유 중인 요청 수 (워커 풀에서 실행 중 + 대기 중)",
+    multiprocess_mode="livesum"
+)
+WHISPER_CAPACITY = Gauge(
+    "whisper_capacity",
+    "동시에 받을 수 있는 최대 요청 수 (max_workers + max_queue_size)",
+    multiprocess_mode="livesum"
+)
+WHISPER_BATCH_QUEUE_DEPTH = Gauge(
+    "whisper_batch_queue_depth",
+    "배치 스케줄러 큐에서 기다리는 요청 수",
+    multiprocess_mode="livesum"
+)
+WHISPER_AUDIO_SECONDS = Counter(
+    "whisper_audio_seconds_total",
+    "변환한 오디오 길이 합계",
+    ["endpoint", "model"]
+)
+WHISPER_PROCESSING_SECONDS = Histogram(
+    "whisper_processing_seconds",
+    "오디오 디코딩부터 변환 완료까지의 시간",
+    ["endpoint", "model"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+)
+WHISPER_REAL_TIME_FACTOR = Histogram(
+    "whisper_real_time_factor",
+    "처리 시간 / 오디오 길이",
+    ["endpoint", "model"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5, 10)
+)
+
+
+def observe_transcription(endpoint: str, model_name: str, audio_seconds: float, elapsed: float) -> None:
+    WHISPER_AUDIO_SECONDS.labels(endpoint, model_name).inc(audio_seconds)
+    WHISPER_PROCESSING_SECONDS.labels(endpoint, model_name).observe(elapsed)
+    if audio_seconds > 0:
+        WHISPER_REAL_TIME_FACTOR.labels(endpoint, model_name).observe(elapsed / audio_seconds)
+
+
+def register_queue_samplers(executor: WhisperExecutor, scheduler: WhisperBatchScheduler) -> None:
+    def sample() -> None:
+        WHISPER_IN_FLIGHT.set(executor.in_flight)
+        WHISPER_CAPACITY.set(executor.capacity)
+        WHISPER_BATCH_QUEUE_DEPTH.set(scheduler.queue_depth)
+
+    register_sampler(sample)
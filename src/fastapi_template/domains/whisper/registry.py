@@ -0,0 +1,165 @@
+import gc
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    import whisper
+
+logger = logging.getLogger(__name__)
+
+ModelDtype = Literal["auto", "float16", "float32"]
+
+
+@dataclass(frozen=True)
+class ModelRegistryConfig:
+    models: tuple[str, ...] = ("base",)
+    default_model: str = "base"
+    device: str | None = None  # None 이면 GPU 사용 가능 여부로 결정
+    dtype: ModelDtype = "auto"  # auto: GPU 에서만 fp16
+    preload: bool = False
+    quantize_int8: bool = False  # CPU 에서 Linear 레이어 int8 dynamic quantization 적용
+    intra_op_threads: int = 0  # 0 이면 torch 기본값
+    inter_op_threads: int = 0
+
+
+@dataclass
+class LoadedModel:
+    name: str
+    model: "whisper.Whisper"
+    fp16: bool
+    # whisper 디코딩은 모델 모듈에 kv-cache hook 을 설치하므로 같은 모델을 동시에 사용할 수 없음
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class WhisperModelRegistry:
+    """
+    프로세스 단위 Whisper 모델 레지스트리
+
+    - 설정에 등록된 모델만 요청 시점에 로드 (torch/whisper import 도 최초 로드 시점으로 지연)
+    - 일정 시간 사용되지 않은 모델은 unload_idle 로 메모리에서 해제
+    """
+
+    def __init__(self, config: ModelRegistryConfig = ModelRegistryConfig()):
+        self.config = config
+        self._models: dict[str, LoadedModel] = {}
+        self._load_lock = threading.Lock()
+        self._threads_configured = False
+
+    def resolve_name(self, name: str | None) -> str:
+        name = name or self.config.default_model
+        if name not in self.config.models:
+            raise ValueError(f"지원되지 않는 모델입니다: {name} (사용 가능: {', '.join(self.config.models)})")
+        return name
+
+    def get(self, name: str | None = None) -> LoadedModel:
+        name = self.resolve_name(name)
+
+        loaded = self._models.get(name)
+        if loaded is None:
+            with self._load_lock:
+                loaded = self._models.get(name)
+                if loaded is None:
+                    loaded = self._load(name)
+                    self._models[name] = loaded
+
+        loaded.last_used = time.monotonic()
+        return loaded
+
+    def _configure_threads(self) -> None:
+        """
+        torch 스레드 수를 설정합니다. 프로세스당 한 번, 첫 모델 로드 전에만 적용됩니다.
+
+        process executor 에서는 워커 수 x intra_op_threads 가 CPU 코어 수를 넘지 않도록 설정해야 합니다.
+        """
+        if self._threads_configured:
+            return
+        self._threads_configured = True
+
+        import torch
+
+        if self.config.intra_op_threads > 0:
+            torch.set_num_threads(self.config.intra_op_threads)
+        if self.config.inter_op_threads > 0:
+            try:
+                torch.set_num_interop_threads(self.config.inter_op_threads)
+            except RuntimeError:
+                # 이미 병렬 작업이 실행된 프로세스에서는 변경 불가
+                logger.warning("torch inter-op 스레드 수를 변경할 수 없습니다 (이미 초기화됨)")
+
+    def _load(self, name: str) -> LoadedModel:
+        import torch
+        import whisper
+
+        self._configure_threads()
+
+        device = self.config.device or ("cuda" if torch.cuda.is_available() else "cpu")
+        if self.config.dtype == "auto":
+            fp16 = device.startswith("cuda")
+        else:
+            fp16 = self.config.dtype == "float16"
+
+        started = time.perf_counter()
+        model = whisper.load_model(name, device=device)
+
+        quantized = self.config.quantize_int8 and device == "cpu"
+        if quantized:
+            model = quantize_int8(model)
+            fp16 = False
+        elif self.config.quantize_int8:
+            logger.warning(f"int8 quantization 은 CPU 에서만 지원됩니다 (device={device}), 건너뜁니다")
+
+        logger.info(
+            f"Whisper 모델 로드: {name} (device={device}, fp16={fp16}, int8={quantized}, "
+            f"{time.perf_counter() - started:.1f}s)"
+        )
+
+        return LoadedModel(name=name, model=model, fp16=fp16)
+
+    def unload_idle(self, idle_seconds: float) -> list[str]:
+        """idle_seconds 이상 사용되지 않은 모델을 해제합니다. 사용 중인 모델은 건너뜁니다."""
+        now = time.monotonic()
+        unloaded = []
+
+        with self._load_lock:
+            for name, loaded in list(self._models.items()):
+                if now - loaded.last_used < idle_seconds or not loaded.lock.acquire(blocking=False):
+                    continue
+                try:
+                    del self._models[name]
+                    unloaded.append(name)
+                finally:
+                    loaded.lock.release()
+
+        if unloaded:
+            gc.collect()
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            logger.info(f"유휴 Whisper 모델 해제: {', '.join(unloaded)}")
+
+        return unloaded
+
+    def loaded_models(self) -> list[str]:
+        return list(self._models)
+
+
+def quantize_int8(model: "whisper.Whisper") -> "whisper.Whisper":
+    """
+    Whisper 모델의 Linear 레이어에 int8 dynamic quantization 을 적용합니다 (CPU 전용).
+
+    whisper.model.Linear 는 nn.Linear 의 하위 클래스라 quantize_dynamic 이 타입을 인식하지 못하므로
+    먼저 nn.Linear 로 바꾼 뒤 변환합니다. (forward 에서 weight dtype 을 맞추는 것 외에는 동일)
+    """
+    import torch
+    from whisper.model import Linear
+
+    for module in model.modules():
+        if isinstance(module, Linear):
+            module.__class__ = torch.nn.Linear
+
+    # inplace: 모델 전체를 복사하지 않도록 (로드 시 메모리 사용량 2배 방지)
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
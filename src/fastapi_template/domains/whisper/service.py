@@ -0,0 +1,395 @@
+import asyncio
+import json
+import os
+import time
+from dataclasses import asdict
+from typing import AsyncIterator
+
+import numpy as np
+from fastapi import HTTPException, UploadFile, status
+
+from fastapi_template.core.cache.tiered import TieredCache
+from fastapi_template.domains.whisper.audio import (
+    SAMPLE_RATE,
+    WINDOW_SAMPLES,
+    WINDOW_SECONDS,
+    decode_upload,
+    hash_upload
+)
+from fastapi_template.domains.whisper.batcher import WhisperBatchScheduler
+from fastapi_template.domains.whisper.exceptions import WhisperOverloadedError, WhisperTimeoutError
+from fastapi_template.domains.whisper.executor import ExecutorSlot, WhisperExecutor
+from fastapi_template.domains.whisper.metrics import observe_transcription
+from fastapi_template.domains.whisper.splitter import SplitOptions, split_on_silence
+from fastapi_template.domains.whisper.inference import (
+    detect_audio_language,
+    detect_languages_batch,
+    get_registry,
+    prepare_mel,
+    transcribe_audio,
+    transcribe_window
+)
+
+# 지원되는 오디오 파일 형식
+ALLOWED_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.mp4', '.avi', '.mov'}
+
+
+class WhisperService:
+    def __init__(
+            self,
+            executor: WhisperExecutor,
+            scheduler: WhisperBatchScheduler,
+            cache: TieredCache | None = None,
+            split_options: SplitOptions = SplitOptions(),
+            max_language_detect_files: int = 32
+    ):
+        self.executor = executor
+        self.scheduler = scheduler
+        self.cache = cache
+        self.split_options = split_options
+        self.max_language_detect_files = max_language_detect_files
+
+    @staticmethod
+    def _validate_extension(file: UploadFile) -> str:
+        file_extension = os.path.splitext(file.filename)[1].lower()
+        if file_extension not in ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"지원되지 않는 파일 형식입니다. 지원 형식: {', '.join(ALLOWED_EXTENSIONS)}"
+            )
+        return file_extension
+
+    @staticmethod
+    def _resolve_model(model: str | None) -> str:
+        try:
+            return get_registry().resolve_name(model)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def validate_request(self, file: UploadFile, model: str | None) -> str:
+        """업로드 파일 형식과 모델 이름을 검증하고, 사용할 모델 이름을 반환합니다."""
+        self._validate_extension(file)
+        return self._resolve_model(model)
+
+    @staticmethod
+    def _cache_key(endpoint: str, model_name: str, content_hash: str, language: str | None, task: str) -> str:
+        return f"{endpoint}:{model_name}:{task}:{language or 'auto'}:{content_hash}"
+
+    async def _get_cached(self, key: str) -> dict | None:
+        if self.cache is None:
+            return None
+        return await self.cache.get(key)
+
+    async def _set_cached(self, key: str, value: dict) -> None:
+        if self.cache is not None:
+            await self.cache.set(key, value)
+
+    async def transcribe(self, file: UploadFile, language: str | None, task: str, model: str | None = None) -> dict:
+        model_name = self.validate_request(file, model)
+
+        try:
+            cache_key = self._cache_key("transcribe", model_name, await hash_upload(file), language, task)
+
+            # 동일한 파일/옵션의 이전 결과가 있으면 디코딩/추론 생략
+            result = await self._get_cached(cache_key)
+            if result is None:
+                async with self.executor.reserve():
+                    started = time.perf_counter()
+                    # 오디오 디코딩 (메모리) 후 log-Mel spectrogram 생성 (워커 풀에서 실행)
+                    audio = await decode_upload(file)
+                    mel = await self.executor.run(prepare_mel, model_name, audio)
+
+                    # 언어 감지 및 디코딩 (같은 모델의 동시 요청과 함께 배치 처리)
+                    result = asdict(await self.scheduler.submit(model_name, mel, language, task))
+                    # 앞 30초만 변환됨
+                    observe_transcription(
+                        "transcribe",
+                        model_name,
+                        min(len(audio), WINDOW_SAMPLES) / SAMPLE_RATE,
+                        time.perf_counter() - started
+                    )
+                await self._set_cached(cache_key, result)
+
+        except (WhisperOverloadedError, WhisperTimeoutError) as e:
+            raise self._to_http_exception(e)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"오디오 변환 중 오류가 발생했습니다: {str(e)}"
+            )
+
+        probs = result["language_probs"]
+        detected_language = result["detected_language"]
+        return {
+            "success": True,
+            "filename": file.filename,
+            "model": model_name,
+            "detected_language": detected_language,
+            "language_confidence": probs[detected_language],
+            "task": task,
+            "text": result["text"],
+            "language_probabilities": dict(sorted(probs.items(), key=lambda x: x[1], reverse=True)[:5])
+        }
+
+    async def detect_languages(self, files: list[UploadFile], top_k: int, model: str | None = None) -> dict:
+        if len(files) > self.max_language_detect_files:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"한 번에 최대 {self.max_language_detect_files}개 파일까지 처리할 수 있습니다."
+            )
+        for file in files:
+            self._validate_extension(file)
+        model_name = self._resolve_model(model)
+
+        try:
+            async with self.executor.reserve():
+                # 언어 감지는 앞 30초만 사용하므로 그만큼만 디코딩 (파일 단위로 동시에 실행)
+                audios = await asyncio.gather(*(decode_upload(file, WINDOW_SECONDS) for file in files))
+                results = await self.executor.run(detect_languages_batch, model_name, audios, top_k)
+
+        except (WhisperOverloadedError, WhisperTimeoutError) as e:
+            raise self._to_http_exception(e)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"언어 감지 중 오류가 발생했습니다: {str(e)}"
+            )
+
+        return {
+            "success": True,
+            "model": model_name,
+            "results": [
+                {
+                    "filename": file.filename,
+                    "detected_language": top_languages[0][0],
+                    "language_confidence": top_languages[0][1],
+                    "language_probabilities": dict(top_languages)
+                }
+                for file, top_languages in zip(files, results)
+            ]
+        }
+
+    async def transcribe_full(
+            self,
+            file: UploadFile,
+            language: str | None,
+            task: str,
+            parallel: bool = False,
+            model: str | None = None
+    ) -> dict:
+        model_name = self.validate_request(file, model)
+
+        try:
+            endpoint = "transcribe-full-parallel" if parallel else "transcribe-full"
+            cache_key = self._cache_key(endpoint, model_name, await hash_upload(file), language, task)
+
+            result = await self._get_cached(cache_key)
+            if result is None:
+                async with self.executor.reserve():
+                    started = time.perf_counter()
+                    audio = await decode_upload(file)
+                    result = await self.transcribe_decoded(model_name, audio, language, task, parallel)
+                    observe_transcription(endpoint, model_name, len(audio) / SAMPLE_RATE, time.perf_counter() - started)
+                await self._set_cached(cache_key, result)
+
+        except (WhisperOverloadedError, WhisperTimeoutError) as e:
+            raise self._to_http_exception(e)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"오디오 변환 중 오류가 발생했습니다: {str(e)}"
+            )
+
+        return {
+            "success": True,
+            "filename": file.filename,
+            "model": model_name,
+            "detected_language": result["language"],
+            "task": task,
+            "text": result["text"],
+            "segments": result["segments"]
+        }
+
+    async def transcribe_decoded(
+            self,
+            model_name: str,
+            audio: np.ndarray,
+            language: str | None,
+            task: str,
+            parallel: bool = False
+    ) -> dict:
+        """디코딩된 waveform 전체를 세그먼트 단위로 변환합니다. (처리 슬롯 확보는 호출 측 책임)"""
+        if parallel:
+            return await self._transcribe_parallel(model_name, audio, language, task)
+        # Whisper의 transcribe 함수 사용 (전체 오디오 처리, 워커 풀에서 실행)
+        return await self.executor.run(transcribe_audio, model_name, audio, language, task)
+
+    async def _transcribe_parallel(
+            self,
+            model_name: str,
+            audio: np.ndarray,
+            language: str | None,
+            task: str
+    ) -> dict:
+        """
+        긴 오디오를 무음 구간 기준으로 나눠 워커 풀에서 동시에 변환한 뒤, 순서대로 합칩니다.
+
+        process executor 에서 워커 수만큼 병렬로 처리됩니다 (thread executor 는 모델 lock 으로 직렬화됨).
+        """
+        # 파일 전체에 대한 RMS 계산이므로 이벤트 루프를 막지 않도록 워커 풀에서 실행
+        chunks = await self.executor.run(
+            split_on_silence,
+            audio,
+            SAMPLE_RATE,
+            self.split_options.chunk_seconds,
+            self.split_options.threshold_db,
+            self.split_options.min_silence_ms
+        )
+        if len(chunks) == 1:
+            return await self.executor.run(transcribe_audio, model_name, audio, language, task)
+
+        # 청크마다 언어가 다르게 감지되지 않도록 먼저 한 번 감지해 고정
+        language = language or await self.executor.run(detect_audio_language, model_name, audio)
+
+        results = await asyncio.gather(*(
+            self.executor.run(transcribe_window, model_name, audio[start:end], start / SAMPLE_RATE, language, task)
+            for start, end in chunks
+        ))
+
+        return {
+            "language": language,
+            "text": "".join(result["text"] for result in results),
+            "segments": [segment for result in results for segment in result["segments"]]
+        }
+
+    async def transcribe_stream(
+            self,
+            file: UploadFile,
+            language: str | None,
+            task: str,
+            model: str | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        오디오를 30초 구간 단위로 디코딩하면서 세그먼트를 NDJSON 이벤트로 바로 내보내는 스트림을 생성합니다.
+
+        - start: 파일명과 전체 길이
+        - segment: 디코딩이 끝난 세그먼트 (start, end, text)
+        - done: 감지된 언어와 전체 텍스트
+        - error: 처리 중 오류
+        """
+        model_name = self.validate_request(file, model)
+
+        # 응답(200)을 시작하기 전에 슬롯을 확보해, 과부하면 다른 엔드포인트와 같이 503 + Retry-After 로 거절
+        try:
+            slot = self.executor.acquire()
+        except WhisperOverloadedError as e:
+            raise self._to_http_exception(e)
+
+        try:
+            try:
+                async with asyncio.timeout(self.executor.timeout_seconds):
+                    audio = await decode_upload(file)
+            except TimeoutError as e:
+                raise self._to_http_exception(WhisperTimeoutError(self.executor.timeout_seconds)) from e
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"오디오 변환 중 오류가 발생했습니다: {str(e)}"
+                )
+        except BaseException:
+            # 스트림을 만들지 못하면 (요청 취소 포함) 여기서 슬롯 반환
+            slot.release()
+            raise
+
+        return self._stream_windows(slot, model_name, file.filename, audio, language, task)
+
+    async def _stream_windows(
+            self,
+            slot: ExecutorSlot,
+            model_name: str,
+            filename: str,
+            audio: np.ndarray,
+            language: str | None,
+            task: str
+    ) -> AsyncIterator[bytes]:
+        """slot 은 transcribe_stream 에서 확보한 슬롯이며, 스트림이 끝나면 (오류/연결 종료 포함) 반환합니다."""
+        # 클라이언트 연결이 끊기면 이 제너레이터가 취소되어 남은 구간은 워커 풀에 제출되지 않음
+        try:
+            yield self._ndjson({
+                "event": "start",
+                "filename": filename,
+                "model": model_name,
+                "duration": len(audio) / SAMPLE_RATE
+            })
+
+            texts = []
+            prompt = None
+            for offset in range(0, len(audio), WINDOW_SAMPLES):
+                window = audio[offset:offset + WINDOW_SAMPLES]
+                started = time.perf_counter()
+                result = await asyncio.wait_for(
+                    self.executor.run(
+                        transcribe_window,
+                        model_name,
+                        window,
+                        offset / SAMPLE_RATE,
+                        language,
+                        task,
+                        prompt,
+                        slots=(slot,)
+                    ),
+                    self.executor.timeout_seconds
+                )
+                observe_transcription(
+                    "transcribe-stream", model_name, len(window) / SAMPLE_RATE, time.perf_counter() - started
+                )
+
+                # 첫 구간에서 감지한 언어를 이후 구간에 고정하고, 직전 구간 텍스트를 prompt 로 사용
+                language = language or result["language"]
+                prompt = result["text"] or None
+                texts.append(result["text"])
+
+                for segment in result["segments"]:
+                    yield self._ndjson({"event": "segment", **segment})
+
+            yield self._ndjson({
+                "event": "done",
+                "filename": filename,
+                "detected_language": language,
+                "task": task,
+                "text": "".join(texts)
+            })
+
+        except asyncio.TimeoutError:
+            yield self._ndjson({"event": "error", "detail": str(WhisperTimeoutError(self.executor.timeout_seconds))})
+        except Exception as e:
+            yield self._ndjson({"event": "error", "detail": f"오디오 변환 중 오류가 발생했습니다: {str(e)}"})
+        finally:
+            slot.release()
+
+    @staticmethod
+    def _ndjson(event: dict) -> bytes:
+        return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def cache_stats(self) -> dict:
+        if self.cache is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            "redis_enabled": self.cache.redis is not None,
+            "entries": len(self.cache.memory),
+            **self.cache.stats.to_dict()
+        }
+
+    @staticmethod
+    def _to_http_exception(e: WhisperOverloadedError | WhisperTimeoutError) -> HTTPException:
+        if isinstance(e, WhisperOverloadedError):
+            return HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)}
+            )
+        return HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e)
+        )
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+FRAME_MS = 30
+
+
+@dataclass(frozen=True)
+class SplitOptions:
+    chunk_seconds: float = 120.0
+    threshold_db: float = -40.0
+    min_silence_ms: int = 500
+
+
+def find_silences(
+        audio: np.ndarray,
+        sample_rate: int,
+        threshold_db: float = -40.0,
+        min_silence_ms: int = 500
+) -> list[tuple[int, int]]:
+    """
+    프레임(30ms) 단위 RMS 에너지가 threshold_db(dBFS) 미만인 구간이 min_silence_ms 이상 이어지는
+    무음 구간을 찾아 (시작 샘플, 끝 샘플) 목록으로 반환합니다.
+    """
+    frame_size = sample_rate * FRAME_MS // 1000
+    n_frames = len(audio) // frame_size
+    if n_frames == 0:
+        return []
+
+    frames = audio[:n_frames * frame_size].reshape(n_frames, frame_size)
+    # frames ** 2 는 오디오 전체 크기의 임시 배열을 만들므로 einsum 으로 프레임별 제곱합만 계산
+    energy = np.einsum("ij,ij->i", frames, frames) / frame_size
+    db = 10 * np.log10(energy + 1e-12)
+    silent = np.concatenate(([0], (db < threshold_db).astype(np.int8), [0]))
+
+    edges = np.diff(silent)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    min_frames = max(1, min_silence_ms // FRAME_MS)
+    return [
+        (int(start * frame_size), int(end * frame_size))
+        for start, end in zip(starts, ends)
+        if end - start >= min_frames
+    ]
+
+
+def split_on_silence(
+        audio: np.ndarray,
+        sample_rate: int,
+        chunk_seconds: float,
+        threshold_db: float = -40.0,
+        min_silence_ms: int = 500
+) -> list[tuple[int, int]]:
+    """
+    긴 오디오를 chunk_seconds 이하의 구간으로 나눕니다.
+
+    각 구간은 목표 길이의 절반 ~ 목표 길이 사이에서 가장 늦게 나오는 무음 구간의 중앙에서 자르고,
+    적당한 무음 구간이 없으면 목표 길이에서 그대로 자릅니다.
+    """
+    chunk_samples = int(chunk_seconds * sample_rate)
+    total = len(audio)
+    if total <= chunk_samples:
+        return [(0, total)]
+
+    silences = find_silences(audio, sample_rate, threshold_db, min_silence_ms)
+    midpoints = np.array([(start + end) // 2 for start, end in silences], dtype=np.int64)
+
+    boundaries = [0]
+    position = 0
+    while total - position > chunk_samples:
+        target = position + chunk_samples
+        candidates = midpoints[(midpoints > position + chunk_samples // 2) & (midpoints <= target)]
+        position = int(candidates[-1]) if len(candidates) else target
+        boundaries.append(position)
+    boundaries.append(total)
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
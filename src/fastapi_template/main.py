@@ -1,10 +1,14 @@
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from fastapi_template.api.v1 import routers as v1_routers
 from fastapi_template.core.config.lifespan import lifespan
 from fastapi_template.core.config.settings import get_settings
 from fastapi_template.core.exception.global_exception_handler import register_global_exception_handlers
+from fastapi_template.core.metrics.router import router as metrics_router
+from fastapi_template.core.middleware.profiling import ProfilingMiddleware
+from fastapi_template.core.middleware.timing import TimingMiddleware
 
 settings = get_settings()
 app = FastAPI(
@@ -20,17 +24,33 @@ app = FastAPI(
         "name": "Apache 2.0",
         "url": "https://www.apache.org/licenses/LICENSE-2.0.html",
     },
-    lifespan=lifespan
+    lifespan=lifespan,
+    # dict/list 를 반환하는 엔드포인트는 orjson 으로 직렬화
+    default_response_class=ORJSONResponse
 )
 
 register_global_exception_handlers(app)
 
+# 나중에 추가한 미들웨어가 바깥쪽: 타이밍은 프로파일링 비용까지 포함해 측정
+if settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=settings.profiling_sample_rate,
+        header=settings.profiling_header,
+        backend=settings.profiling_backend,
+        output_dir=settings.profiling_output_dir,
+        max_files=settings.profiling_max_files
+    )
+app.add_middleware(TimingMiddleware)
+
 
 @app.get("/env")
 def read_env():
     return settings.model_dump()
 
 
+app.include_router(metrics_router)
+
 for router in v1_routers:
     app.include_router(router, prefix="/api/v1")
 
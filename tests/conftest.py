@@ -0,0 +1,41 @@
+import os
+
+# settings 는 import 시점에 .env.{APP_ENV} 를 읽으므로 애플리케이션 모듈보다 먼저 설정
+os.environ.setdefault("APP_ENV", "test")
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from fastapi_template.core.config.database import UnitOfWorkSession
+from fastapi_template.core.security.password import PasswordHasher
+from fastapi_template.domains.user.models import User  # noqa: F401 (metadata 에 테이블 등록)
+
+
+@pytest.fixture
+async def engine(tmp_path) -> AsyncEngine:
+    """테스트마다 새로 만드는 SQLite 데이터베이스 (파일 기반: 여러 커넥션이 같은 DB 를 봄)"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=UnitOfWorkSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def password_hasher():
+    # 테스트 속도를 위해 최소 cost 사용
+    hasher = PasswordHasher(rounds=4, max_workers=2)
+    yield hasher
+    hasher.shutdown()
@@ -0,0 +1,190 @@
+import asyncio
+import json
+
+import pytest
+
+from fastapi_template.core.cache import memory
+from fastapi_template.core.cache.memory import TTLCache
+from fastapi_template.core.cache.singleflight import SingleFlight
+from fastapi_template.core.cache.tiered import TieredCache
+from tests.fakes import FakeRedis
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(memory.time, "monotonic", clock)
+    return clock
+
+
+class TestTTLCache:
+    def test_get_and_set(self, clock):
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expires_after_ttl(self, clock):
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+
+        clock.now += 10
+        assert cache.get("a") == 1
+        clock.now += 0.001
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a 를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_zero_size_disables_cache(self, clock):
+        cache = TTLCache(max_size=0, ttl_seconds=10)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+    def test_delete_and_clear(self, clock):
+        cache = TTLCache(max_size=3, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestTieredCache:
+    async def test_memory_only(self):
+        cache = TieredCache("test", TTLCache(max_size=10, ttl_seconds=10))
+
+        assert await cache.get("k") is None
+        await cache.set("k", {"v": 1})
+        assert await cache.get("k") == {"v": 1}
+        assert cache.stats.to_dict() == {
+            "memory_hits": 1, "redis_hits": 0, "misses": 1, "hits": 1, "hit_ratio": 0.5
+        }
+
+    async def test_set_writes_both_tiers_with_ttl(self):
+        redis = FakeRedis()
+        cache = TieredCache("test", TTLCache(max_size=10, ttl_seconds=10), redis=redis, ttl_seconds=60)
+
+        await cache.set("k", {"v": 1})
+
+        assert json.loads(redis.data["test:k"]) == {"v": 1}
+        assert redis.expires["test:k"] == 60
+
+    async def test_redis_hit_fills_memory(self):
+        redis = FakeRedis()
+        redis.data["test:k"] = b'{"v": 1}'
+        cache = TieredCache("test", TTLCache(max_size=10, ttl_seconds=10), redis=redis)
+
+        assert await cache.get("k") == {"v": 1}
+        assert await cache.get("k") == {"v": 1}
+        assert (cache.stats.redis_hits, cache.stats.memory_hits) == (1, 1)
+
+    async def test_delete_removes_both_tiers(self):
+        redis = FakeRedis()
+        cache = TieredCache("test", TTLCache(max_size=10, ttl_seconds=10), redis=redis)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        await cache.delete("a", "b")
+
+        assert await cache.get("a") is None
+        assert redis.data == {}
+
+    async def test_redis_errors_degrade_to_memory(self):
+        cache = TieredCache("test", TTLCache(max_size=10, ttl_seconds=10), redis=FakeRedis(fail=True))
+
+        await cache.set("k", 1)
+        assert await cache.get("k") == 1
+        await cache.delete("k")
+        assert await cache.get("k") is None
+        assert cache.stats.misses == 1
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        singleflight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"v": calls}
+
+        tasks = [asyncio.create_task(singleflight.do("k", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [{"v": 1}] * 5
+        assert calls == 1
+
+    async def test_next_call_after_completion_runs_again(self):
+        singleflight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await singleflight.do("k", load) == 1
+        assert await singleflight.do("k", load) == 2
+
+    async def test_exception_is_shared(self):
+        singleflight = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(singleflight.do("k", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_cancelled_waiter_does_not_cancel_leader(self):
+        singleflight = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(singleflight.do("k", load))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(singleflight.do("k", load))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        release.set()
+
+        assert await leader == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
@@ -0,0 +1,32 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from fastapi_template.core.pagination.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_round_trip():
+    created_at, id = datetime(2025, 7, 1, 12, 30, 45, 123456), uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, id)) == (created_at, id)
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor(datetime(2025, 7, 1), uuid4())
+
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not-a-cursor",
+    "!!!!",
+    encode_cursor(datetime(2025, 7, 1), uuid4())[:-4],  # 잘린 cursor
+    "WyIyMDI1LTA3LTAxIl0",  # ["2025-07-01"]: id 누락
+    "WzEsMl0",  # [1,2]: 타입 불일치
+])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+
+from fastapi_template.core.security import password
+from fastapi_template.core.security.password import PasswordHasher
+
+
+def rounds_of(hashed_password: str) -> int:
+    # $2b$<cost>$...
+    return int(hashed_password.split("$")[2])
+
+
+async def hash_with_rounds(rounds: int, value: str) -> str:
+    hasher = PasswordHasher(rounds=rounds)
+    try:
+        return await hasher.hash(value)
+    finally:
+        hasher.shutdown()
+
+
+@pytest.fixture(params=["thread", "process"])
+def hasher(request):
+    hasher = PasswordHasher(rounds=4, kind=request.param, max_workers=2)
+    yield hasher
+    hasher.shutdown()
+
+
+async def test_hash_and_verify(hasher):
+    hashed = await hasher.hash("password123")
+
+    assert rounds_of(hashed) == 4
+    assert await hasher.verify("password123", hashed)
+    assert not await hasher.verify("wrong-password", hashed)
+
+
+async def test_verify_and_update_rehashes_other_cost(hasher):
+    old_hash = await hash_with_rounds(5, "password123")
+
+    verified, new_hash = await hasher.verify_and_update("password123", old_hash)
+
+    assert verified
+    assert rounds_of(new_hash) == 4
+    assert await hasher.verify("password123", new_hash)
+
+
+async def test_verify_and_update_keeps_current_cost(hasher):
+    hashed = await hasher.hash("password123")
+
+    assert await hasher.verify_and_update("password123", hashed) == (True, None)
+
+
+async def test_wrong_password_is_not_rehashed(hasher):
+    old_hash = await hash_with_rounds(5, "password123")
+
+    assert await hasher.verify_and_update("wrong-password", old_hash) == (False, None)
+
+
+async def test_thread_hasher_runs_off_event_loop(monkeypatch):
+    threads = []
+
+    def record_hash(rounds, value):
+        threads.append(threading.current_thread())
+        return "hashed"
+
+    monkeypatch.setattr(password, "_hash", record_hash)
+    hasher = PasswordHasher(rounds=4, kind="thread")
+    try:
+        assert await hasher.hash("password123") == "hashed"
+    finally:
+        hasher.shutdown()
+
+    assert threads[0] is not threading.main_thread()
+    assert threads[0].name.startswith("password-hasher")
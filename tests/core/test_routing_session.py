@@ -0,0 +1,164 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import lambda_stmt, select, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from fastapi_template.core.config import database
+from fastapi_template.core.config.database import RoutingSession, UnitOfWorkSession, use_primary
+from fastapi_template.core.cache.memory import TTLCache
+from fastapi_template.core.cache.singleflight import SingleFlight
+from fastapi_template.core.cache.tiered import TieredCache
+from fastapi_template.core.config.replica import ReplicaSet
+from fastapi_template.domains.user.cached_repository import CachedUserRepository
+from fastapi_template.domains.user.models import User
+from fastapi_template.domains.user.repository import UserRepository
+
+
+def make_user(username: str) -> User:
+    return User(id=uuid4(), email=f"{username}@example.com", username=username, hashed_password="hashed")
+
+
+@pytest.fixture
+def primary(engine, monkeypatch):
+    # RoutingSession 은 쓰기를 모듈 수준 primary 엔진으로 보냄
+    monkeypatch.setattr(database, "engine", engine)
+    return engine
+
+
+@pytest.fixture
+async def replica_engines(tmp_path):
+    engines = [create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'replica{n}.db'}") for n in range(2)]
+    for n, engine in enumerate(engines):
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        # 각 DB 에만 있는 행으로 어느 엔진에서 읽었는지 구분
+        async with async_sessionmaker(engine)() as session:
+            session.add(make_user(f"replica{n}"))
+            await session.commit()
+    yield engines
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture
+def make_session(primary, replica_engines):
+    def make_session(replicas: ReplicaSet | None = None):
+        return async_sessionmaker(
+            primary,
+            class_=UnitOfWorkSession,
+            expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            replicas=replicas if replicas is not None else ReplicaSet(replica_engines[:1])
+        )()
+
+    return make_session
+
+
+async def usernames(session) -> set[str]:
+    return set((await session.scalars(select(User.username))).all())
+
+
+async def test_reads_go_to_replica(make_session):
+    async with make_session() as session:
+        assert await usernames(session) == {"replica0"}
+        assert not session.sync_session.use_primary
+
+
+async def test_lambda_statement_reads_go_to_replica(make_session):
+    async with make_session() as session:
+        user = await UserRepository(session).get_by_username("replica0")
+
+    assert user is not None
+
+
+async def test_user_cache_fills_from_primary(make_session):
+    async with make_session() as session:
+        cache = TieredCache("user", TTLCache(max_size=10, ttl_seconds=60))
+        cached = CachedUserRepository(UserRepository(session), cache, SingleFlight())
+
+        # replica0 은 replica 에만 있는 행: primary 에서 읽었으므로 찾지 못함
+        assert await cached.get_by_username("replica0") is None
+
+
+async def test_flush_sticks_session_to_primary(make_session):
+    async with make_session() as session:
+        session.add(make_user("written"))
+        await session.commit()
+
+        # 커밋 후에도 방금 쓴 행을 읽을 수 있도록 primary 에 고정
+        assert session.sync_session.use_primary
+        assert await usernames(session) == {"written"}
+
+
+async def test_dml_statement_sticks_session_to_primary(make_session):
+    async with make_session() as session:
+        await session.execute(update(User).where(User.username == "missing").values(full_name="x"))
+        await session.commit()
+
+        assert await usernames(session) == set()
+
+
+async def test_select_for_update_goes_to_primary(make_session):
+    async with make_session() as session:
+        await session.execute(select(User).with_for_update())
+
+        assert session.sync_session.use_primary
+        assert await usernames(session) == set()
+
+
+async def test_lambda_select_for_update_goes_to_primary(make_session):
+    async with make_session() as session:
+        await session.execute(lambda_stmt(lambda: select(User).with_for_update()))
+
+        assert session.sync_session.use_primary
+
+
+async def test_select_with_unknown_lock_state_goes_to_primary(make_session):
+    # text().columns() 는 SELECT 지만 FOR UPDATE 여부를 확인할 수 없으므로 잠그는 읽기로 간주
+    async with make_session() as session:
+        result = await session.execute(text("SELECT username FROM users").columns(User.username))
+
+        assert set(result.scalars()) == set()
+        assert session.sync_session.use_primary
+
+
+async def test_text_goes_to_primary_without_sticking(make_session):
+    async with make_session() as session:
+        await session.execute(text("SELECT 1"))
+
+        assert not session.sync_session.use_primary
+        assert await usernames(session) == {"replica0"}
+
+
+async def test_use_primary(make_session):
+    async with make_session() as session:
+        use_primary(session)
+
+        assert await usernames(session) == set()
+
+
+async def test_each_session_keeps_one_replica(make_session, replica_engines):
+    replicas = ReplicaSet(replica_engines, balancing="round_robin")
+
+    seen = []
+    for _ in range(2):
+        async with make_session(replicas) as session:
+            first = await usernames(session)
+            assert await usernames(session) == first
+            seen.append(first)
+
+    assert seen == [{"replica0"}, {"replica1"}]
+
+
+async def test_falls_back_to_primary_without_healthy_replica(make_session, tmp_path):
+    unreachable = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    replicas = ReplicaSet([unreachable])
+    await replicas.check_health(timeout=5)
+
+    try:
+        async with make_session(replicas) as session:
+            assert await usernames(session) == set()
+    finally:
+        await unreachable.dispose()
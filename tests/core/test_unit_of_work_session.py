@@ -0,0 +1,84 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import lambda_stmt, select
+
+from fastapi_template.domains.user.models import User
+
+
+@pytest.fixture
+async def user_id(session) -> str:
+    user = User(id=uuid4(), email="a@example.com", username="a", hashed_password="hashed")
+    session.add(user)
+    await session.commit()
+    return user.id
+
+
+def checked_out(engine) -> int:
+    return engine.sync_engine.pool.checkedout()
+
+
+@pytest.mark.parametrize("read", [
+    lambda session, user_id: session.execute(select(User).where(User.id == user_id)),
+    lambda session, user_id: session.execute(lambda_stmt(lambda: select(User).where(User.id == user_id))),
+    lambda session, user_id: session.scalar(select(User.email).where(User.id == user_id)),
+    lambda session, user_id: session.scalars(select(User).where(User.id == user_id)),
+    lambda session, user_id: session.get(User, user_id, populate_existing=True),
+], ids=["execute", "lambda", "scalar", "scalars", "get"])
+async def test_standalone_read_returns_connection(engine, session, user_id, read):
+    result = await read(session, user_id)
+
+    assert result is not None
+    assert not session.in_transaction()
+    assert checked_out(engine) == 0
+
+
+async def test_buffered_result_is_usable_after_release(session, user_id):
+    result = await session.execute(select(User).where(User.id == user_id))
+
+    assert not session.in_transaction()
+    assert result.scalar_one().email == "a@example.com"
+
+
+async def test_reads_inside_begin_keep_transaction(engine, session, user_id):
+    async with session.begin():
+        await session.execute(select(User).where(User.id == user_id))
+        await session.scalar(select(User.email).where(User.id == user_id))
+
+        assert session.in_transaction()
+        assert checked_out(engine) == 1
+
+    assert checked_out(engine) == 0
+
+
+async def test_read_after_flush_keeps_transaction(engine, session, user_id):
+    session.add(User(id=uuid4(), email="b@example.com", username="b", hashed_password="hashed"))
+    await session.flush()
+
+    await session.execute(select(User))
+
+    # 커밋되지 않은 쓰기가 있으므로 읽기 후에도 트랜잭션 유지
+    assert session.in_transaction()
+    assert checked_out(engine) == 1
+
+    await session.rollback()
+    assert checked_out(engine) == 0
+
+
+async def test_read_with_pending_changes_keeps_transaction(engine, session, user_id):
+    session.add(User(id=uuid4(), email="b@example.com", username="b", hashed_password="hashed"))
+
+    # autoflush 로 pending 객체가 flush 되므로 커밋하지 않음
+    await session.execute(select(User))
+
+    assert session.in_transaction()
+    assert checked_out(engine) == 1
+    await session.rollback()
+
+
+async def test_select_for_update_keeps_transaction(engine, session, user_id):
+    await session.execute(select(User).where(User.id == user_id).with_for_update())
+
+    assert session.in_transaction()
+    assert checked_out(engine) == 1
+    await session.rollback()
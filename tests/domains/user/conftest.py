@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from fastapi_template.domains.user.models import User
+
+
+@pytest.fixture
+def add_users(session):
+    """이메일/사용자명이 user{n} 인 사용자를 추가하고 (created_at, id) 순으로 반환합니다."""
+
+    async def add_users(count: int, same_created_at: bool = False, start: int = 0) -> list[User]:
+        base = datetime(2025, 1, 1)
+        users = [
+            User(
+                id=uuid4(),
+                email=f"user{n}@example.com",
+                username=f"user{n}",
+                hashed_password="hashed",
+                created_at=base if same_created_at else base + timedelta(minutes=n)
+            )
+            for n in range(start, start + count)
+        ]
+        session.add_all(users)
+        await session.commit()
+        return sorted(users, key=lambda user: (user.created_at, user.id))
+
+    return add_users
@@ -0,0 +1,80 @@
+import pytest
+
+from fastapi_template.core.security.password import PasswordHasher
+from fastapi_template.domains.user.models import User
+from fastapi_template.domains.user.repository import UserRepository
+from fastapi_template.domains.user.service import UserService
+
+
+class RecordingRepository(UserRepository):
+    """update_password 호출을 기록합니다."""
+
+    def __init__(self, session):
+        super().__init__(session)
+        self.password_updates = []
+
+    async def update_password(self, user_id, hashed_password):
+        self.password_updates.append(hashed_password)
+        await super().update_password(user_id, hashed_password)
+
+
+def rounds_of(hashed_password: str) -> int:
+    return int(hashed_password.split("$")[2])
+
+
+@pytest.fixture
+async def user_id(session):
+    # 현재 설정(rounds=4)보다 낮은 cost 로 저장된 기존 해시
+    old_hasher = PasswordHasher(rounds=4)
+    try:
+        hashed_password = await old_hasher.hash("password123")
+    finally:
+        old_hasher.shutdown()
+
+    user = User(email="a@example.com", username="a", hashed_password=hashed_password)
+    session.add(user)
+    await session.commit()
+    return user.id
+
+
+@pytest.fixture
+def repository(session):
+    return RecordingRepository(session)
+
+
+@pytest.fixture
+def service(repository):
+    hasher = PasswordHasher(rounds=5, max_workers=2)
+    yield UserService(repository, hasher)
+    hasher.shutdown()
+
+
+async def stored_hash(session, user_id) -> str:
+    return (await session.get(User, user_id, populate_existing=True)).hashed_password
+
+
+async def test_login_upgrades_hash_cost(service, repository, session, user_id):
+    user = await service.authenticate_user("a@example.com", "password123")
+
+    assert user is not None
+    assert len(repository.password_updates) == 1
+    assert rounds_of(await stored_hash(session, user_id)) == 5
+    assert user.hashed_password == await stored_hash(session, user_id)
+
+    # 이미 새 cost 로 저장되었으므로 다음 로그인에서는 다시 쓰지 않음
+    assert await service.authenticate_user("a@example.com", "password123") is not None
+    assert len(repository.password_updates) == 1
+
+
+async def test_wrong_password_neither_rehashes_nor_writes(service, repository, session, user_id):
+    before = await stored_hash(session, user_id)
+
+    assert await service.authenticate_user("a@example.com", "wrong-password") is None
+
+    assert repository.password_updates == []
+    assert await stored_hash(session, user_id) == before
+
+
+async def test_unknown_email(service, repository):
+    assert await service.authenticate_user("missing@example.com", "password123") is None
+    assert repository.password_updates == []
@@ -0,0 +1,150 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from fastapi_template.domains.user.repository import UserRepository
+from fastapi_template.domains.user.schemas import UserBulkCreate, UserBulkUpdate
+from fastapi_template.domains.user.service import UserService
+
+
+class StalePrecheckRepository(UserRepository):
+    """사전 중복 검사 이후 다른 요청이 같은 값을 추가한 상황: 검사 결과가 항상 비어 있음"""
+
+    async def find_existing(self, emails, usernames):
+        return {}, {}
+
+
+def new_user(n: int) -> dict:
+    return {"email": f"new{n}@example.com", "username": f"new{n}", "password": "password123"}
+
+
+def errors(result) -> dict[int, str]:
+    return {error.index: error.detail for error in result.errors}
+
+
+@pytest.fixture
+def service(session, password_hasher):
+    return UserService(UserRepository(session), password_hasher, bulk_chunk_size=2)
+
+
+@pytest.fixture
+def stale_service(session, password_hasher):
+    return UserService(StalePrecheckRepository(session), password_hasher, bulk_chunk_size=2)
+
+
+async def test_bulk_create_across_chunks(service, session):
+    result = await service.bulk_create_users(UserBulkCreate(users=[new_user(n) for n in range(5)]))
+
+    assert (result.succeeded, result.failed, result.errors) == (5, 0, [])
+    assert len(await UserRepository(session).get_many(result.ids)) == 5
+
+
+async def test_bulk_create_reports_per_row_errors(service, add_users):
+    await add_users(2)
+
+    result = await service.bulk_create_users(UserBulkCreate(users=[
+        new_user(0),
+        {**new_user(1), "email": "new0@example.com"},
+        {**new_user(2), "username": "new0"},
+        {**new_user(3), "email": "user0@example.com"},
+        {**new_user(4), "username": "user1"},
+        new_user(5),
+    ]))
+
+    assert errors(result) == {
+        1: "Duplicate email in request",
+        2: "Duplicate username in request",
+        3: "Email already registered",
+        4: "Username already taken",
+    }
+    assert (result.succeeded, result.failed) == (2, 4)
+
+
+async def test_bulk_create_skips_rows_inserted_after_precheck(stale_service, add_users):
+    await add_users(1)
+
+    result = await stale_service.bulk_create_users(UserBulkCreate(users=[
+        new_user(0),
+        {**new_user(1), "email": "user0@example.com"},
+        new_user(2),
+    ]))
+
+    assert errors(result) == {1: "Email or username already exists"}
+    assert result.succeeded == 2
+
+
+async def test_bulk_update_reports_per_row_errors(service, add_users):
+    users = await add_users(4)
+    missing = uuid4()
+
+    result = await service.bulk_update_users(UserBulkUpdate(users=[
+        {"id": users[0].id, "full_name": "Zero"},
+        {"id": users[0].id, "full_name": "Again"},
+        {"id": missing, "full_name": "Nobody"},
+        {"id": users[1].id, "email": "user2@example.com"},
+        {"id": users[2].id, "username": "user3"},
+        {"id": users[3].id, "email": users[3].email, "username": "renamed"},  # 자기 email 은 충돌 아님
+    ]))
+
+    assert errors(result) == {
+        1: "Duplicate id in request",
+        2: "User not found",
+        3: "Email already registered",
+        4: "Username already taken",
+    }
+    assert set(result.ids) == {users[0].id, users[3].id}
+
+
+async def test_bulk_update_rejects_duplicate_values_in_request(service, add_users):
+    users = await add_users(3)
+
+    result = await service.bulk_update_users(UserBulkUpdate(users=[
+        {"id": users[0].id, "email": "same@example.com"},
+        {"id": users[1].id, "email": "same@example.com"},
+        {"id": users[2].id, "username": "user0"},
+    ]))
+
+    assert errors(result)[1] == "Duplicate email in request"
+    assert errors(result)[2] == "Username already taken"
+
+
+async def test_bulk_update_retries_rows_after_conflict(stale_service, session, add_users):
+    # 롤백 후에는 세션의 User 객체가 만료되므로 id 를 미리 꺼내 둠
+    first, second, _ = [user.id for user in await add_users(3)]
+
+    result = await stale_service.bulk_update_users(UserBulkUpdate(users=[
+        {"id": first, "full_name": "Zero"},
+        {"id": second, "email": "user2@example.com"},
+    ]))
+
+    # 같은 chunk 의 충돌하지 않는 행은 행 단위 재시도로 반영됨
+    assert errors(result) == {1: "Email already registered"}
+    assert result.ids == [first]
+    updated = {user.id: user for user in await UserRepository(session).get_many([first, second])}
+    assert updated[first].full_name == "Zero"
+    assert updated[second].email == "user1@example.com"
+
+
+async def test_bulk_update_rejects_explicit_nulls(service, add_users):
+    users = await add_users(4)
+
+    result = await service.bulk_update_users(UserBulkUpdate(users=[
+        {"id": users[0].id, "email": None},
+        {"id": users[1].id, "username": None},
+        {"id": users[2].id, "is_active": None},
+        {"id": users[3].id, "full_name": None},  # nullable 컬럼은 null 로 수정 가능
+    ]))
+
+    assert errors(result) == {
+        0: "email must not be null",
+        1: "username must not be null",
+        2: "is_active must not be null",
+    }
+    assert result.ids == [users[3].id]
+
+
+def test_other_constraint_violations_are_not_reported_as_duplicates():
+    error = IntegrityError("UPDATE users ...", {}, Exception("CHECK constraint failed: users"))
+
+    assert UserService._update_conflict_detail(error) == "Rejected by a database constraint"
@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from fastapi_template.core.cache.memory import TTLCache
+from fastapi_template.core.cache.singleflight import SingleFlight
+from fastapi_template.core.cache.tiered import TieredCache
+from fastapi_template.core.config.settings import get_settings
+from fastapi_template.domains.user import dependencies
+from fastapi_template.domains.user.cached_repository import CachedUserRepository
+from fastapi_template.domains.user.repository import UserRepository
+from fastapi_template.domains.user.schemas import UserResponse, UserUpdate
+from tests.fakes import FakeRedis
+
+
+class CountingRepository(UserRepository):
+    """단건 조회가 DB 까지 내려간 횟수를 셉니다."""
+
+    def __init__(self, session):
+        super().__init__(session)
+        self.loads = 0
+
+    async def get_by_id(self, user_id):
+        self.loads += 1
+        return await super().get_by_id(user_id)
+
+    async def get_by_email(self, email):
+        self.loads += 1
+        return await super().get_by_email(email)
+
+
+@pytest.fixture
+def repository(session):
+    return CountingRepository(session)
+
+
+@pytest.fixture
+def cache():
+    return TieredCache("user", TTLCache(max_size=100, ttl_seconds=60))
+
+
+@pytest.fixture
+def cached(repository, cache):
+    return CachedUserRepository(repository, cache, SingleFlight())
+
+
+async def test_second_lookup_is_served_from_cache(cached, repository, add_users):
+    user, = await add_users(1)
+
+    first = await cached.get_by_id(user.id)
+    second = await cached.get_by_id(user.id)
+
+    assert isinstance(first, UserResponse)
+    assert first == second == UserResponse.model_validate(user)
+    assert repository.loads == 1
+
+
+async def test_one_load_fills_every_key(cached, repository, add_users):
+    user, = await add_users(1)
+
+    await cached.get_by_id(user.id)
+    assert (await cached.get_by_email(user.email)).id == user.id
+    assert (await cached.get_by_username(user.username)).id == user.id
+    assert repository.loads == 1
+
+
+async def test_password_hash_is_not_cached(cached, cache, add_users):
+    user, = await add_users(1)
+
+    await cached.get_by_id(user.id)
+
+    for key in cached._keys(user):
+        assert "hashed_password" not in await cache.get(key)
+
+
+async def test_authentication_lookup_bypasses_cache(cached, repository, add_users):
+    user, = await add_users(1)
+    await cached.get_by_email(user.email)
+
+    authenticated = await cached.get_for_authentication(user.email)
+
+    assert authenticated.hashed_password == "hashed"
+    assert repository.loads == 2
+
+
+async def test_missing_user_is_not_cached(cached, repository, add_users):
+    assert await cached.get_by_email("user0@example.com") is None
+
+    await add_users(1)
+    user = await cached.get_by_email("user0@example.com")
+
+    assert user is not None
+    assert repository.loads == 2
+
+
+async def test_concurrent_misses_load_once(cached, repository, add_users):
+    user, = await add_users(1)
+
+    results = await asyncio.gather(*(cached.get_by_id(user.id) for _ in range(5)))
+
+    assert {result.id for result in results} == {user.id}
+    assert repository.loads == 1
+
+
+async def test_update_invalidates_old_and_new_keys(cached, cache, add_users):
+    user, = await add_users(1)
+    # update 결과가 같은 세션의 user 객체에 반영되므로 변경 전 값을 먼저 보관
+    old_email = user.email
+    await cached.get_by_id(user.id)
+
+    await cached.update(user.id, UserUpdate(email="renamed@example.com"))
+
+    assert await cache.get(f"email:{old_email}") is None
+    assert await cached.get_by_email(old_email) is None
+    assert (await cached.get_by_id(user.id)).email == "renamed@example.com"
+
+
+async def test_update_without_cached_entry_skips_lookup(cached, repository, cache, add_users):
+    user, = await add_users(1)
+    # 변경 후 email 로 미리 캐시된 부정확한 값이 있어도 새 행의 key 로 삭제됨
+    await cache.set("email:renamed@example.com", {"stale": True})
+
+    updated = await cached.update(user.id, UserUpdate(email="renamed@example.com"))
+
+    assert updated.email == "renamed@example.com"
+    assert repository.loads == 0
+    assert await cache.get("email:renamed@example.com") is None
+
+
+async def test_delete_invalidates_cached_keys(cached, add_users):
+    user, = await add_users(1)
+    await cached.get_by_username(user.username)
+
+    assert await cached.delete(user.id)
+
+    assert await cached.get_by_id(user.id) is None
+    assert await cached.get_by_username(user.username) is None
+
+
+def test_cache_is_disabled_by_default():
+    assert dependencies.create_user_components(get_settings()).user_cache is None
+
+
+async def test_delete_on_one_worker_is_seen_by_another(session_factory, add_users, monkeypatch):
+    # uvicorn --workers N: 워커마다 create_user_components 로 만든 캐시, Redis 만 공유
+    redis = FakeRedis()
+    monkeypatch.setattr(dependencies, "get_redis_client", lambda: redis)
+    settings = get_settings().model_copy(update={"user_cache_enabled": True, "user_cache_redis_enabled": True})
+    workers = [dependencies.create_user_components(settings) for _ in range(2)]
+
+    def repository_for(worker, session):
+        return CachedUserRepository(UserRepository(session), worker.user_cache, worker.singleflight)
+
+    user_id = (await add_users(1))[0].id
+    async with session_factory() as first, session_factory() as second:
+        assert await repository_for(workers[0], first).get_by_id(user_id) is not None
+        assert await repository_for(workers[1], second).get_by_id(user_id) is not None
+
+        assert await repository_for(workers[0], first).delete(user_id)
+
+        assert await repository_for(workers[1], second).get_by_id(user_id) is None
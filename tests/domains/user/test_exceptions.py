@@ -0,0 +1,62 @@
+import pytest
+from asyncpg.exceptions import UniqueViolationError
+from pymysql.err import IntegrityError as MySQLIntegrityError
+from sqlalchemy.exc import IntegrityError
+
+from fastapi_template.domains.user.exceptions import UserAlreadyExistsError
+from fastapi_template.domains.user.repository import UserRepository
+from fastapi_template.domains.user.schemas import UserCreate, UserUpdate
+
+
+class AdaptedError(Exception):
+    """SQLAlchemy asyncpg 어댑터가 드라이버 예외를 감싸는 형태 (원래 예외는 __cause__)"""
+
+
+def asyncpg_error(constraint_name: str) -> IntegrityError:
+    cause = UniqueViolationError("duplicate key value violates unique constraint")
+    cause.constraint_name = constraint_name
+    adapted = AdaptedError(str(cause))
+    adapted.__cause__ = cause
+    return IntegrityError("INSERT ...", {}, adapted)
+
+
+def mysql_error(errno: int, message: str) -> IntegrityError:
+    return IntegrityError("INSERT ...", {}, MySQLIntegrityError(errno, message))
+
+
+@pytest.mark.parametrize(("error", "field"), [
+    (asyncpg_error("ix_users_email"), "email"),
+    (asyncpg_error("ix_users_username"), "username"),
+    (mysql_error(1062, "Duplicate entry 'a@b.com' for key 'users.ix_users_email'"), "email"),
+    (mysql_error(1062, "Duplicate entry 'a' for key 'ix_users_username'"), "username"),
+])
+def test_field_from_constraint_name(error, field):
+    assert UserAlreadyExistsError.from_integrity_error(error).field == field
+
+
+@pytest.mark.parametrize("error", [
+    asyncpg_error("users_pkey"),
+    mysql_error(1048, "Column 'email' cannot be null"),
+    mysql_error(1062, "Duplicate entry 'x' for key 'users.PRIMARY'"),
+])
+def test_other_violations_are_not_converted(error):
+    assert UserAlreadyExistsError.from_integrity_error(error) is None
+
+
+async def test_duplicate_create_raises_already_exists(session, add_users):
+    await add_users(1)
+    repository = UserRepository(session)
+
+    with pytest.raises(UserAlreadyExistsError) as exc_info:
+        await repository.create(
+            UserCreate(email="user0@example.com", username="other", password="password123"), "hashed"
+        )
+
+    assert exc_info.value.field == "email"
+
+
+async def test_not_null_violation_is_reraised(session, add_users):
+    user_id = (await add_users(1))[0].id
+
+    with pytest.raises(IntegrityError):
+        await UserRepository(session).update(user_id, UserUpdate(email=None))
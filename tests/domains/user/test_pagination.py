@@ -0,0 +1,87 @@
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+
+from fastapi_template.domains.user.repository import UserRepository
+from fastapi_template.domains.user.schemas import UserFilter
+from fastapi_template.domains.user.service import UserService
+
+
+def ids(users) -> list[UUID]:
+    return [user.id for user in users]
+
+
+@pytest.fixture
+def repository(session):
+    return UserRepository(session)
+
+
+@pytest.fixture
+def service(repository, password_hasher):
+    return UserService(repository, password_hasher)
+
+
+async def test_keyset_returns_rows_after_cursor(repository, add_users):
+    users = await add_users(5)
+
+    page = await repository.get_list(UserFilter(size=2), after=(users[1].created_at, users[1].id))
+
+    # 다음 페이지 존재 여부 확인용으로 size + 1 건
+    assert ids(page) == ids(users[2:5])
+
+
+async def test_keyset_breaks_created_at_ties_by_id(repository, add_users):
+    users = await add_users(4, same_created_at=True)
+
+    page = await repository.get_list(UserFilter(size=10), after=(users[1].created_at, users[1].id))
+
+    assert ids(page) == ids(users[2:])
+
+
+async def test_keyset_ignores_page(repository, add_users):
+    users = await add_users(5)
+
+    page = await repository.get_list(UserFilter(size=2, page=3), after=(users[0].created_at, users[0].id))
+
+    assert ids(page) == ids(users[1:4])
+
+
+async def test_offset_without_cursor(repository, add_users):
+    users = await add_users(5)
+
+    page = await repository.get_list(UserFilter(size=2, page=2))
+
+    assert ids(page) == ids(users[2:5])
+
+
+async def test_cursor_paging_visits_every_row_once(service, add_users):
+    users = await add_users(7, same_created_at=True)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        response = await service.get_users(UserFilter(size=3, cursor=cursor))
+        seen.extend(user.id for user in response.users)
+        pages += 1
+        if response.next_cursor is None:
+            break
+        cursor = response.next_cursor
+
+    assert seen == ids(users)
+    assert pages == 3
+
+
+async def test_no_next_cursor_on_exact_last_page(service, add_users):
+    await add_users(3)
+
+    response = await service.get_users(UserFilter(size=3))
+
+    assert len(response.users) == 3
+    assert response.next_cursor is None
+
+
+async def test_invalid_cursor_is_bad_request(service):
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_users(UserFilter(cursor="not-a-cursor"))
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from fastapi_template.core.constants.search_mode import SearchMode
+from fastapi_template.domains.user.models import User
+from fastapi_template.domains.user.repository import UserRepository
+from fastapi_template.domains.user.schemas import UserFilter
+
+
+@pytest.fixture
+def repository(session):
+    return UserRepository(session)
+
+
+@pytest.fixture
+async def users(add_users, session):
+    users = await add_users(3)
+    # LIKE 와일드카드 이스케이프 확인용
+    users[2].username = "user_%2"
+    await session.commit()
+    return users
+
+
+async def usernames(repository, **filters) -> list[str]:
+    return [user.username for user in await repository.get_list(UserFilter(size=100, **filters))]
+
+
+@pytest.mark.parametrize(("mode", "value", "expected"), [
+    (SearchMode.EXACT, "user1", ["user1"]),
+    (SearchMode.EXACT, "user", []),
+    (SearchMode.PREFIX, "user", ["user0", "user1", "user_%2"]),
+    (SearchMode.PREFIX, "ser", []),
+    (SearchMode.CONTAINS, "ser1", ["user1"]),
+    (SearchMode.CONTAINS, "_%", ["user_%2"]),  # 와일드카드가 아닌 문자 그대로 비교
+    (SearchMode.FULLTEXT, "ser1", ["user1"]),  # MySQL 이 아니면 contains 로 처리
+])
+async def test_username_match(repository, users, mode, value, expected):
+    assert await usernames(repository, username=value, match=mode) == expected
+
+
+async def test_default_mode_is_contains(repository, users):
+    assert await usernames(repository, email="1@example") == ["user1"]
+
+
+async def test_count_uses_same_match(repository, users):
+    assert await repository.count(UserFilter(username="user", match=SearchMode.PREFIX)) == 3
+    assert await repository.count(UserFilter(username="user", match=SearchMode.EXACT)) == 0
+
+
+def _mysql_repository() -> UserRepository:
+    # _match 는 세션의 bind dialect 이름만 확인함
+    session = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=mysql.dialect()))
+    return UserRepository(session)
+
+
+def _compile_mysql(clause) -> str:
+    return str(clause.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_mysql_fulltext_uses_match_against():
+    clause = _mysql_repository()._match(User.email, 'ab"c', SearchMode.FULLTEXT)
+
+    sql = _compile_mysql(clause)
+    assert "MATCH (users.email) AGAINST" in sql
+    assert "IN BOOLEAN MODE" in sql
+    # 사용자 입력의 따옴표는 제거하고 phrase 검색으로 감쌈
+    assert "'\"ab c\"'" in sql
+
+
+def test_mysql_fulltext_falls_back_to_like_below_ngram_size():
+    clause = _mysql_repository()._match(User.email, "a", SearchMode.FULLTEXT)
+
+    sql = _compile_mysql(clause)
+    assert "MATCH" not in sql
+    assert "LIKE" in sql
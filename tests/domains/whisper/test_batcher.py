@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fastapi_template.domains.whisper import batcher
+from fastapi_template.domains.whisper.batcher import WhisperBatchScheduler
+from fastapi_template.domains.whisper.executor import WhisperExecutor
+
+
+class FakeInference:
+    """transcribe_batch 대신 실행되어 동시에 실행 중인 배치 수를 기록합니다."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.running = 0
+        self.max_running = 0
+        self.batch_sizes: list[int] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, model_name, mels, languages, tasks):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.batch_sizes.append(len(mels))
+        time.sleep(self.seconds)
+        with self._lock:
+            self.running -= 1
+        return [{"model": model_name, "text": mel} for mel in mels]
+
+
+@pytest.fixture
+def executor():
+    executor = WhisperExecutor(kind="thread", max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+async def scheduler(executor):
+    scheduler = WhisperBatchScheduler(executor, max_batch_size=1, max_wait_ms=1)
+    yield scheduler
+    await scheduler.stop()
+
+
+async def test_batches_run_up_to_max_workers_at_once(scheduler, monkeypatch):
+    inference = FakeInference(seconds=0.1)
+    monkeypatch.setattr(batcher, "transcribe_batch", inference)
+
+    results = await asyncio.gather(*(scheduler.submit("base", f"mel{n}", None, "transcribe") for n in range(6)))
+
+    assert [result["text"] for result in results] == [f"mel{n}" for n in range(6)]
+    assert inference.max_running == 2
+
+
+async def test_requests_arriving_during_a_batch_form_the_next_batch(executor, monkeypatch):
+    inference = FakeInference(seconds=0.1)
+    monkeypatch.setattr(batcher, "transcribe_batch", inference)
+    scheduler = WhisperBatchScheduler(executor, max_batch_size=8, max_wait_ms=1)
+
+    try:
+        first = [asyncio.create_task(scheduler.submit("base", f"a{n}", None, "transcribe")) for n in range(2)]
+        await asyncio.sleep(0.02)
+        second = [asyncio.create_task(scheduler.submit("base", f"b{n}", None, "transcribe")) for n in range(3)]
+        await asyncio.gather(*first, *second)
+    finally:
+        await scheduler.stop()
+
+    # 첫 배치가 실행되는 동안 들어온 요청은 다음 배치 하나로 실행됨
+    assert inference.batch_sizes == [2, 3]
+
+
+async def test_model_groups_run_concurrently(scheduler, monkeypatch):
+    inference = FakeInference(seconds=0.1)
+    monkeypatch.setattr(batcher, "transcribe_batch", inference)
+    scheduler.max_batch_size = 8
+    scheduler.max_wait = 0.02
+
+    results = await asyncio.gather(
+        scheduler.submit("base", "x", None, "transcribe"),
+        scheduler.submit("small", "y", None, "transcribe")
+    )
+
+    assert [result["model"] for result in results] == ["base", "small"]
+    assert inference.max_running == 2
+
+
+async def test_inference_error_is_raised_to_each_request(scheduler, monkeypatch):
+    def fail(model_name, mels, languages, tasks):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(batcher, "transcribe_batch", fail)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await scheduler.submit("base", "x", None, "transcribe")
+
+
+async def test_stop_cancels_running_batches(scheduler, monkeypatch):
+    monkeypatch.setattr(batcher, "transcribe_batch", FakeInference(seconds=0.2))
+
+    request = asyncio.create_task(scheduler.submit("base", "x", None, "transcribe"))
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    with pytest.raises(asyncio.CancelledError):
+        await request
@@ -0,0 +1,28 @@
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+class FakeRedis:
+    """TieredCache 가 사용하는 get/set/delete 만 구현한 dict 기반 Redis"""
+
+    def __init__(self, fail: bool = False):
+        self.data: dict[str, bytes] = {}
+        self.expires: dict[str, int] = {}
+        self.fail = fail
+
+    def _check(self):
+        if self.fail:
+            raise RedisConnectionError("redis down")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self._check()
+        self.data[key] = value.encode()
+        self.expires[key] = ex
+
+    async def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key, None)